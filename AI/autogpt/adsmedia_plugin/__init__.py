@@ -1,11 +1,16 @@
 """ADSMedia Plugin for AutoGPT"""
 
-from typing import Any, Dict, List, Optional, Type, TypeVar
-import requests
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from adsmedia import ADSMedia, ADSMediaError, AsyncADSMedia, aclose_shared_clients, shared_async_client
 
 PromptConfig = TypeVar("PromptConfig")
 
-API_BASE_URL = "https://api.adsmedia.live/v1"
+API_BASE_URL = os.getenv("ADSMEDIA_BASE_URL", "https://api.adsmedia.live/v1")
+MAX_BATCH_SIZE = 1000
 
 
 class ADSMediaPlugin:
@@ -14,37 +19,49 @@ class ADSMediaPlugin:
     Enables AutoGPT to send emails via ADSMedia API
     """
 
-    def __init__(self):
+    def __init__(self, cache_ttl: float = 60.0):
         self.api_key = None
+        self.client: Optional[ADSMedia] = None
+        # Seconds ping and usage results are reused across loop iterations
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _client(self) -> ADSMedia:
+        if self.client is None:
+            raise ValueError("API key not set. Use set_api_key command first.")
+        return self.client
 
-    def _request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict:
-        """Make API request to ADSMedia"""
-        if not self.api_key:
+    def _async(self) -> AsyncADSMedia:
+        if self.api_key is None:
             raise ValueError("API key not set. Use set_api_key command first.")
+        # One client per event loop, since a session cannot outlive its loop
+        return shared_async_client(self.api_key, API_BASE_URL)
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
-        url = f"{API_BASE_URL}{endpoint}"
-        
-        if method == "GET":
-            response = requests.get(url, headers=headers, params=data, timeout=30)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=data, timeout=30)
-        else:
-            raise ValueError(f"Unsupported method: {method}")
-
-        result = response.json()
-        if not result.get("success"):
-            raise Exception(result.get("error", {}).get("message", "API Error"))
-        
-        return result.get("data", {})
+    def _request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Any:
+        """Make API request to ADSMedia over the pooled session"""
+        if method in ("GET", "DELETE"):
+            return self._client()._request(method, endpoint, params=data)
+        return self._client()._request(method, endpoint, json=data)
+
+    def _cached(self, key: str, load: Callable[[], Any]) -> Any:
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        value = load()
+        with self._lock:
+            self._cache[key] = (time.monotonic() + self.cache_ttl, value)
+        return value
 
     def set_api_key(self, api_key: str) -> str:
         """Set the ADSMedia API key"""
+        if self.client is not None:
+            self.client.close()
         self.api_key = api_key
+        self.client = ADSMedia(api_key=api_key, base_url=API_BASE_URL)
+        with self._lock:
+            self._cache.clear()
         return "API key set successfully"
 
     def send_email(
@@ -57,50 +74,110 @@ class ADSMediaPlugin:
     ) -> Dict:
         """
         Send a single email via ADSMedia API
-        
+
         Args:
             to: Recipient email address
             subject: Email subject line
             html: HTML content of the email
             to_name: Recipient name (optional)
             from_name: Sender display name (optional)
-        
+
         Returns:
             Response with message_id and status
         """
-        data = {"to": to, "subject": subject, "html": html}
-        if to_name:
-            data["to_name"] = to_name
-        if from_name:
-            data["from_name"] = from_name
-        
-        return self._request("POST", "/send", data)
+        return self._client().send(to=to, subject=subject, html=html, to_name=to_name, from_name=from_name)
+
+    def send_batch(
+        self,
+        recipients: List[str],
+        subject: str,
+        html: str,
+        text: Optional[str] = None,
+        from_name: Optional[str] = None,
+    ) -> Dict:
+        """
+        Send one email to many recipients (batches of up to 1000)
+
+        Invalid and duplicate addresses are dropped before sending.
+
+        Returns:
+            task_ids, queued count and invalid (email, reason) pairs
+        """
+        unique = list(dict.fromkeys(recipients))
+        summary: Dict[str, Any] = {"task_ids": [], "queued": 0, "invalid": []}
+        for start in range(0, len(unique), MAX_BATCH_SIZE):
+            result = self._client().send_batch(
+                recipients=[{"email": email} for email in unique[start:start + MAX_BATCH_SIZE]],
+                subject=subject,
+                html=html,
+                text=text,
+                from_name=from_name,
+                validate=True,
+            )
+            if result.get("task_id") is not None:
+                summary["task_ids"].append(result["task_id"])
+            summary["queued"] += result.get("recipients_count", 0)
+            summary["invalid"] += result.get("invalid", [])
+        return summary
 
     def check_suppression(self, email: str) -> Dict:
         """
         Check if an email address is suppressed
-        
+
         Args:
             email: Email address to check
-        
+
         Returns:
             Suppression status and reason
         """
-        return self._request("GET", "/suppressions/check", {"email": email})
+        return self._client().check_suppression(email)
+
+    def check_suppressions(self, emails: List[str]) -> Dict[str, Any]:
+        """Check many addresses concurrently; email -> status dict or ADSMediaError"""
+        return self._client().check_suppressions(emails)
 
     def ping(self) -> Dict:
-        """Test API connection"""
-        return self._request("GET", "/ping")
+        """Test API connection (cached for cache_ttl seconds)"""
+        return self._cached("ping", self._client().ping)
 
     def get_usage(self) -> Dict:
-        """Get account usage statistics"""
-        return self._request("GET", "/account/usage")
+        """Get account usage statistics (cached for cache_ttl seconds)"""
+        return self._cached("usage", self._client().get_usage)
+
+    # ===== Async =====
+
+    async def asend_email(
+        self,
+        to: str,
+        subject: str,
+        html: str,
+        to_name: Optional[str] = None,
+        from_name: Optional[str] = None,
+    ) -> Dict:
+        """Async variant of send_email for hosts running an event loop"""
+        return await self._async().send(to=to, subject=subject, html=html, to_name=to_name, from_name=from_name)
+
+    async def acheck_suppression(self, email: str) -> Dict:
+        """Async variant of check_suppression"""
+        return await self._async().check_suppression(email)
+
+    async def acheck_suppressions(self, emails: List[str]) -> Dict[str, Any]:
+        """Async variant of check_suppressions"""
+        return await self._async().check_suppressions(emails)
+
+    async def aclose(self) -> None:
+        """Close the async clients shared in the running event loop"""
+        await aclose_shared_clients()
 
 
 # Global plugin instance
 plugin = ADSMediaPlugin()
 
 
+def _split(addresses: str) -> List[str]:
+    return [a.strip() for a in addresses.replace(";", ",").replace("\n", ",").split(",") if a.strip()]
+
+
 # AutoGPT command functions
 def set_adsmedia_api_key(api_key: str) -> str:
     """Set ADSMedia API key. Example: set_adsmedia_api_key('your-key')"""
@@ -128,6 +205,24 @@ def send_email_adsmedia(
     return f"Email sent to {to}. Message ID: {result.get('message_id')}"
 
 
+def send_bulk_email_adsmedia(
+    recipients: str,
+    subject: str,
+    html: str,
+    from_name: str = "",
+) -> str:
+    """
+    Send the same email to many recipients in one command.
+    Example: send_bulk_email_adsmedia('a@example.com, b@example.com', 'Hello!', '<h1>Hi!</h1>')
+    """
+    emails = _split(recipients)
+    result = plugin.send_batch(emails, subject, html, from_name=from_name if from_name else None)
+    message = f"Batch queued for {result['queued']} of {len(emails)} recipients. Task IDs: {result['task_ids']}"
+    if result["invalid"]:
+        message += f". Skipped invalid: {', '.join(email for email, _ in result['invalid'])}"
+    return message
+
+
 def check_email_suppression(email: str) -> str:
     """
     Check if email is suppressed.
@@ -139,8 +234,32 @@ def check_email_suppression(email: str) -> str:
     return f"Email {email} is NOT suppressed - safe to send"
 
 
+def check_emails_suppression(emails: str) -> str:
+    """
+    Check many emails at once.
+    Example: check_emails_suppression('a@example.com, b@example.com')
+    """
+    results = plugin.check_suppressions(_split(emails))
+    problems = []
+    for email, result in results.items():
+        if isinstance(result, ADSMediaError):
+            problems.append(f"{email}: check failed ({result.message})")
+        elif result.get("suppressed"):
+            problems.append(f"{email}: SUPPRESSED ({result.get('reason')})")
+    safe = len(results) - len(problems)
+    return "; ".join([f"{safe} of {len(results)} emails are safe to send"] + problems)
+
+
 def test_adsmedia_connection() -> str:
     """Test ADSMedia API connection"""
     result = plugin.ping()
     return f"Connected! User ID: {result.get('userId')}"
 
+
+def get_adsmedia_usage() -> str:
+    """Get ADSMedia account usage statistics"""
+    result = plugin.get_usage()
+    return (
+        f"Servers: {result.get('servers', 0)}, Lists: {result.get('lists', 0)}, "
+        f"Schedules: {result.get('schedules', 0)}, Sent this month: {result.get('sent_this_month', 0)}"
+    )
@@ -2,16 +2,42 @@
 ADSMedia Tool for CrewAI
 Send emails using ADSMedia API from CrewAI agents
 
-pip install crewai requests
+pip install crewai adsmedia
 """
 
-import os
-import requests
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
 from crewai_tools import BaseTool
 
+from adsmedia import ADSMedia, ADSMediaError, shared_client
 
-class ADSMediaSendEmailTool(BaseTool):
+MAX_BATCH_SIZE = 1000
+# Personalised emails sent at once by the multi-recipient tool
+SEND_CONCURRENCY = 8
+# Recipients listed individually in a multi-recipient summary
+SUMMARY_LINES = 50
+
+
+def get_client(api_key: Optional[str] = None) -> ADSMedia:
+    """The pooled client for an API key, shared by every tool using it."""
+    return shared_client(api_key or None)
+
+
+def _error(e: Exception) -> str:
+    return e.message if isinstance(e, ADSMediaError) else str(e)
+
+
+class ADSMediaBaseTool(BaseTool):
+    """Shared client setup for the ADSMedia tools."""
+    
+    client: Any = None
+    
+    def __init__(self, api_key: Optional[str] = None, client: Optional[ADSMedia] = None):
+        super().__init__()
+        self.client = client or get_client(api_key)
+
+
+class ADSMediaSendEmailTool(ADSMediaBaseTool):
     """Tool for sending emails via ADSMedia API."""
     
     name: str = "Send Email"
@@ -26,13 +52,6 @@ class ADSMediaSendEmailTool(BaseTool):
     - from_name: Sender display name (optional)
     """
     
-    def __init__(self, api_key: Optional[str] = None):
-        super().__init__()
-        self.api_key = api_key or os.getenv("ADSMEDIA_API_KEY", "")
-        if not self.api_key:
-            raise ValueError("ADSMEDIA_API_KEY is required")
-        self.base_url = "https://api.adsmedia.live/v1"
-    
     def _run(
         self,
         to: str,
@@ -42,37 +61,14 @@ class ADSMediaSendEmailTool(BaseTool):
         from_name: Optional[str] = None,
     ) -> str:
         """Execute the tool."""
-        payload = {
-            "to": to,
-            "subject": subject,
-            "html": html,
-        }
-        if to_name:
-            payload["to_name"] = to_name
-        if from_name:
-            payload["from_name"] = from_name
-        
         try:
-            response = requests.post(
-                f"{self.base_url}/send",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json=payload,
-                timeout=30,
-            )
-            data = response.json()
-            
-            if data.get("success"):
-                return f"✅ Email sent successfully to {to}! Message ID: {data['data']['message_id']}"
-            else:
-                return f"❌ Error: {data.get('error', 'Unknown error')}"
+            result = self.client.send(to=to, subject=subject, html=html, to_name=to_name, from_name=from_name)
+            return f"✅ Email sent successfully to {to}! Message ID: {result.get('message_id')}"
         except Exception as e:
-            return f"❌ Error sending email: {str(e)}"
+            return f"❌ Error sending email: {_error(e)}"
 
 
-class ADSMediaCheckSuppressionTool(BaseTool):
+class ADSMediaCheckSuppressionTool(ADSMediaBaseTool):
     """Tool for checking email suppression status."""
     
     name: str = "Check Email Suppression"
@@ -83,39 +79,117 @@ class ADSMediaCheckSuppressionTool(BaseTool):
     - email: Email address to check (required)
     """
     
-    def __init__(self, api_key: Optional[str] = None):
-        super().__init__()
-        self.api_key = api_key or os.getenv("ADSMEDIA_API_KEY", "")
-        if not self.api_key:
-            raise ValueError("ADSMEDIA_API_KEY is required")
-        self.base_url = "https://api.adsmedia.live/v1"
-    
     def _run(self, email: str) -> str:
         """Execute the tool."""
         try:
-            response = requests.get(
-                f"{self.base_url}/suppressions/check",
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                params={"email": email},
-                timeout=30,
-            )
-            data = response.json()
-            
-            if data.get("success"):
-                if data["data"].get("suppressed"):
-                    return f"⚠️ {email} is SUPPRESSED - Reason: {data['data'].get('reason', 'Unknown')}"
-                return f"✅ {email} is NOT suppressed - safe to send"
-            else:
-                return f"❌ Error: {data.get('error', 'Unknown error')}"
+            result = self.client.check_suppression(email)
+            if result.get("suppressed"):
+                return f"⚠️ {email} is SUPPRESSED - Reason: {result.get('reason', 'Unknown')}"
+            return f"✅ {email} is NOT suppressed - safe to send"
         except Exception as e:
-            return f"❌ Error: {str(e)}"
+            return f"❌ Error: {_error(e)}"
+
+
+class ADSMediaSendManyTool(ADSMediaBaseTool):
+    """Tool for sending one email, or personalised emails, to many recipients in one call."""
+    
+    name: str = "Send Email to Many"
+    description: str = """Send an email to many recipients in a single call instead of one call per recipient.
+    Useful for notifying a group of stakeholders or a team.
+    
+    Arguments:
+    - recipients: List of email addresses, or objects with email and optional
+      name, subject and html to personalise a recipient's message (required)
+    - subject: Email subject line for recipients without their own (required)
+    - html: HTML content for recipients without their own (required)
+    - from_name: Sender display name (optional)
+    
+    Returns one line per recipient: sent, queued, invalid or failed.
+    """
+    
+    def _run(
+        self,
+        recipients: List[Union[str, Dict[str, Any]]],
+        subject: str,
+        html: str,
+        from_name: Optional[str] = None,
+    ) -> str:
+        """Execute the tool."""
+        people = [{"email": r} if isinstance(r, str) else dict(r) for r in recipients]
+        people = list({p["email"]: p for p in people if p.get("email")}.values())
+        if not people:
+            return "❌ Error: no recipients"
+        
+        # Same content for everyone goes out as batches; personalised content per recipient
+        if any("subject" in p or "html" in p for p in people):
+            outcomes = self._send_each(people, subject, html, from_name)
+        else:
+            outcomes = self._send_batches(people, subject, html, from_name)
+        return self._summary(outcomes)
+    
+    def _send_batches(self, people, subject, html, from_name) -> Dict[str, str]:
+        outcomes: Dict[str, str] = {}
+        for start in range(0, len(people), MAX_BATCH_SIZE):
+            chunk = people[start:start + MAX_BATCH_SIZE]
+            try:
+                result = self.client.send_batch(
+                    recipients=[{k: p[k] for k in ("email", "name") if p.get(k)} for p in chunk],
+                    subject=subject,
+                    html=html,
+                    from_name=from_name,
+                    validate=True,
+                )
+            except Exception as e:
+                outcomes.update((p["email"], f"failed ({_error(e)})") for p in chunk)
+                continue
+            invalid = dict(result.get("invalid", []))
+            suppressed = result.get("suppressed", {})
+            for p in chunk:
+                email = p["email"]
+                if email in invalid:
+                    outcomes[email] = f"invalid ({invalid[email]})"
+                elif email in suppressed:
+                    outcomes[email] = f"suppressed ({suppressed[email]})"
+                else:
+                    outcomes[email] = f"queued (task {result.get('task_id')})"
+        return outcomes
+    
+    def _send_each(self, people, subject, html, from_name) -> Dict[str, str]:
+        def send(person: Dict[str, Any]) -> str:
+            try:
+                result = self.client.send(
+                    to=person["email"],
+                    subject=person.get("subject") or subject,
+                    html=person.get("html") or html,
+                    to_name=person.get("name"),
+                    from_name=from_name,
+                )
+                return f"sent ({result.get('message_id')})"
+            except Exception as e:
+                return f"failed ({_error(e)})"
+        
+        with ThreadPoolExecutor(min(SEND_CONCURRENCY, len(people))) as executor:
+            return dict(zip([p["email"] for p in people], executor.map(send, people)))
+    
+    @staticmethod
+    def _summary(outcomes: Dict[str, str]) -> str:
+        ok = sum(1 for o in outcomes.values() if o.startswith(("sent", "queued")))
+        lines = [f"{'✅' if ok == len(outcomes) else '⚠️'} {ok} of {len(outcomes)} recipients accepted"]
+        # Problems first, so they are never cut off by the line limit
+        ordered = sorted(outcomes.items(), key=lambda item: item[1].startswith(("sent", "queued")))
+        lines += [f"- {email}: {outcome}" for email, outcome in ordered[:SUMMARY_LINES]]
+        if len(ordered) > SUMMARY_LINES:
+            lines.append(f"- ... and {len(ordered) - SUMMARY_LINES} more")
+        return "\n".join(lines)
 
 
 def get_adsmedia_tools(api_key: Optional[str] = None):
-    """Get all ADSMedia tools for CrewAI."""
+    """Get all ADSMedia tools for CrewAI, sharing one pooled client."""
+    client = get_client(api_key)
     return [
-        ADSMediaSendEmailTool(api_key=api_key),
-        ADSMediaCheckSuppressionTool(api_key=api_key),
+        ADSMediaSendEmailTool(client=client),
+        ADSMediaSendManyTool(client=client),
+        ADSMediaCheckSuppressionTool(client=client),
     ]
 
 
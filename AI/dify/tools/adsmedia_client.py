@@ -0,0 +1,58 @@
+import hashlib
+import threading
+import time
+from typing import Any, Union
+
+from adsmedia import ADSMedia, ADSMediaError, shared_client
+
+# Seconds a suppression result is reused before the API is asked again
+SUPPRESSION_CACHE_TTL = 300.0
+# Addresses checked at once by the batch tool
+CHECK_CONCURRENCY = 8
+# Cached results above which expired entries are pruned
+SUPPRESSION_CACHE_SIZE = 10000
+
+_suppressions: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+_lock = threading.Lock()
+
+
+def _credential(api_key: str) -> str:
+    # Cache keys hold a digest rather than the secret itself
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def get_client(api_key: str) -> ADSMedia:
+    """
+    Pooled client for a credential, kept for the life of the plugin process
+    """
+    return shared_client(api_key)
+
+
+def check_suppressions(api_key: str, emails: list[str]) -> dict[str, Union[dict[str, Any], ADSMediaError]]:
+    """
+    Suppression status per address, from the TTL cache or concurrent API checks
+    """
+    credential = _credential(api_key)
+    now = time.monotonic()
+    results: dict[str, Union[dict[str, Any], ADSMediaError]] = {}
+    missing = []
+    with _lock:
+        for email in dict.fromkeys(emails):
+            cached = _suppressions.get((credential, email.lower()))
+            if cached is not None and cached[0] > now:
+                results[email] = cached[1]
+            else:
+                missing.append(email)
+
+    if missing:
+        fetched = get_client(api_key).check_suppressions(missing, concurrency=CHECK_CONCURRENCY)
+        expires = time.monotonic() + SUPPRESSION_CACHE_TTL
+        with _lock:
+            for email, result in fetched.items():
+                if not isinstance(result, ADSMediaError):
+                    _suppressions[(credential, email.lower())] = (expires, result)
+            if len(_suppressions) > SUPPRESSION_CACHE_SIZE:
+                for key in [k for k, (expiry, _) in _suppressions.items() if expiry <= now]:
+                    del _suppressions[key]
+        results.update(fetched)
+    return {email: results[email] for email in dict.fromkeys(emails)}
@@ -1,8 +1,10 @@
 from typing import Any, Union
-import requests
 from dify_plugin.entities.tool import ToolInvokeMessage
 from dify_plugin import Tool
 
+from adsmedia import ADSMediaError
+from tools.adsmedia_client import check_suppressions
+
 
 class CheckSuppressionTool(Tool):
     def _invoke(
@@ -22,28 +24,20 @@ class CheckSuppressionTool(Tool):
             return self.create_text_message("Error: email is required")
         
         try:
-            response = requests.get(
-                "https://api.adsmedia.live/v1/suppressions/check",
-                headers={"Authorization": f"Bearer {api_key}"},
-                params={"email": email},
-                timeout=30,
-            )
-            data = response.json()
+            result = check_suppressions(api_key, [email])[email]
+            if isinstance(result, ADSMediaError):
+                return self.create_text_message(f"❌ Error: {result.message}")
             
-            if data.get("success"):
-                if data["data"].get("suppressed"):
-                    return self.create_text_message(
-                        f"⚠️ Email SUPPRESSED\n"
-                        f"Email: {email}\n"
-                        f"Reason: {data['data'].get('reason', 'Unknown')}"
-                    )
-                else:
-                    return self.create_text_message(
-                        f"✅ Email OK\n"
-                        f"Email {email} is NOT suppressed - safe to send!"
-                    )
+            if result.get("suppressed"):
+                return self.create_text_message(
+                    f"⚠️ Email SUPPRESSED\n"
+                    f"Email: {email}\n"
+                    f"Reason: {result.get('reason', 'Unknown')}"
+                )
             else:
-                return self.create_text_message(f"❌ Error: {data.get('error', 'Unknown error')}")
+                return self.create_text_message(
+                    f"✅ Email OK\n"
+                    f"Email {email} is NOT suppressed - safe to send!"
+                )
         except Exception as e:
             return self.create_text_message(f"❌ Error: {str(e)}")
-
@@ -0,0 +1,53 @@
+import re
+from typing import Any, Union
+from dify_plugin.entities.tool import ToolInvokeMessage
+from dify_plugin import Tool
+
+from adsmedia import ADSMediaError
+from tools.adsmedia_client import check_suppressions
+
+MAX_EMAILS = 1000
+
+
+class CheckSuppressionsTool(Tool):
+    def _invoke(
+        self, 
+        user_id: str, 
+        tool_parameters: dict[str, Any]
+    ) -> Union[ToolInvokeMessage, list[ToolInvokeMessage]]:
+        """
+        Check the suppression status of many email addresses at once
+        """
+        api_key = self.runtime.credentials.get("api_key")
+        if not api_key:
+            return self.create_text_message("Error: API key not configured")
+        
+        emails = [e for e in re.split(r"[\s,;]+", tool_parameters.get("emails") or "") if e]
+        if not emails:
+            return self.create_text_message("Error: emails is required")
+        if len(emails) > MAX_EMAILS:
+            return self.create_text_message(f"Error: at most {MAX_EMAILS} emails per call")
+        
+        try:
+            results = check_suppressions(api_key, emails)
+        except Exception as e:
+            return self.create_text_message(f"❌ Error: {str(e)}")
+        
+        statuses = {}
+        lines = []
+        for email, result in results.items():
+            if isinstance(result, ADSMediaError):
+                statuses[email] = {"error": result.message}
+                lines.append(f"❌ {email}: {result.message}")
+            elif result.get("suppressed"):
+                statuses[email] = {"suppressed": True, "reason": result.get("reason")}
+                lines.append(f"⚠️ {email}: {result.get('reason', 'suppressed')}")
+            else:
+                statuses[email] = {"suppressed": False}
+        
+        safe = len(results) - len(lines)
+        summary = "\n".join([f"✅ {safe} of {len(results)} emails are safe to send"] + lines)
+        return [
+            self.create_text_message(summary),
+            self.create_json_message({"results": statuses}),
+        ]
@@ -1,8 +1,10 @@
 from typing import Any, Union
-import requests
 from dify_plugin.entities.tool import ToolInvokeMessage
 from dify_plugin import Tool
 
+from adsmedia import ADSMediaError
+from tools.adsmedia_client import get_client
+
 
 class SendEmailTool(Tool):
     def _invoke(
@@ -24,38 +26,21 @@ class SendEmailTool(Tool):
         if not to or not subject or not html:
             return self.create_text_message("Error: to, subject, and html are required")
         
-        payload = {
-            "to": to,
-            "subject": subject,
-            "html": html,
-        }
-        
-        if tool_parameters.get("to_name"):
-            payload["to_name"] = tool_parameters["to_name"]
-        if tool_parameters.get("from_name"):
-            payload["from_name"] = tool_parameters["from_name"]
-        
         try:
-            response = requests.post(
-                "https://api.adsmedia.live/v1/send",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json=payload,
-                timeout=30,
+            result = get_client(api_key).send(
+                to=to,
+                subject=subject,
+                html=html,
+                to_name=tool_parameters.get("to_name") or None,
+                from_name=tool_parameters.get("from_name") or None,
             )
-            data = response.json()
-            
-            if data.get("success"):
-                return self.create_text_message(
-                    f"✅ Email sent successfully!\n"
-                    f"To: {to}\n"
-                    f"Subject: {subject}\n"
-                    f"Message ID: {data['data']['message_id']}"
-                )
-            else:
-                return self.create_text_message(f"❌ Error: {data.get('error', 'Unknown error')}")
+            return self.create_text_message(
+                f"✅ Email sent successfully!\n"
+                f"To: {to}\n"
+                f"Subject: {subject}\n"
+                f"Message ID: {result.get('message_id')}"
+            )
+        except ADSMediaError as e:
+            return self.create_text_message(f"❌ Error: {e.message}")
         except Exception as e:
             return self.create_text_message(f"❌ Error: {str(e)}")
-
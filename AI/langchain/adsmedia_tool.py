@@ -2,15 +2,71 @@
 ADSMedia Tool for LangChain
 Send emails using ADSMedia API from LangChain agents
 
-pip install langchain requests
+pip install langchain "adsmedia[async]"
 """
 
 import os
-import requests
-from typing import Optional, Type
+from typing import Any, List, Optional, Type
 from pydantic import BaseModel, Field
 from langchain.tools import BaseTool
-from langchain.callbacks.manager import CallbackManagerForToolRun
+from langchain.callbacks.manager import (
+    AsyncCallbackManagerForToolRun,
+    CallbackManagerForToolRun,
+)
+
+from adsmedia import ADSMedia, ADSMediaError, AsyncADSMedia, aclose_shared_clients, shared_async_client
+
+API_BASE_URL = os.getenv("ADSMEDIA_BASE_URL", "https://api.adsmedia.live/v1")
+MAX_BATCH_SIZE = 1000
+
+
+class ADSMediaClients:
+    """One pooled sync client, plus the shared async client of each event loop."""
+    
+    def __init__(self, api_key: Optional[str] = None, base_url: str = API_BASE_URL):
+        self.api_key = api_key or os.getenv("ADSMEDIA_API_KEY", "")
+        if not self.api_key:
+            raise ValueError("ADSMEDIA_API_KEY is required")
+        self.base_url = base_url
+        self.client = ADSMedia(api_key=self.api_key, base_url=base_url)
+    
+    @property
+    def async_client(self) -> AsyncADSMedia:
+        # A session belongs to the loop that opened it, and each
+        # asyncio.run(tool.ainvoke(...)) runs in a new loop
+        return shared_async_client(self.api_key, self.base_url)
+    
+    def close(self) -> None:
+        self.client.close()
+    
+    async def aclose(self) -> None:
+        """Close the sync client and the running loop's shared async clients."""
+        self.client.close()
+        await aclose_shared_clients()
+
+
+def _error(action: str, e: Exception) -> str:
+    if isinstance(e, ADSMediaError):
+        return f"Error: {e.message}"
+    return f"Error {action}: {str(e)}"
+
+
+class ADSMediaBaseTool(BaseTool):
+    """Shared setup for the ADSMedia tools."""
+    
+    api_key: str = ""
+    base_url: str = API_BASE_URL
+    clients: Any = None
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        clients: Optional[ADSMediaClients] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.clients = clients or ADSMediaClients(api_key, self.base_url)
+        self.api_key = self.clients.api_key
 
 
 class SendEmailInput(BaseModel):
@@ -22,24 +78,19 @@ class SendEmailInput(BaseModel):
     from_name: Optional[str] = Field(default=None, description="Sender display name")
 
 
-class ADSMediaSendEmailTool(BaseTool):
+class ADSMediaSendEmailTool(ADSMediaBaseTool):
     """Tool for sending emails via ADSMedia API."""
     
     name: str = "adsmedia_send_email"
-    description: str = """Send an email via ADSMedia API. 
+    description: str = """Send an email via ADSMedia API.
     Use this to send transactional emails like notifications, confirmations, alerts.
     Input should include: to (email), subject, html content.
     Optional: to_name, from_name."""
     args_schema: Type[BaseModel] = SendEmailInput
     
-    api_key: str = ""
-    base_url: str = "https://api.adsmedia.live/v1"
-    
-    def __init__(self, api_key: Optional[str] = None, **kwargs):
-        super().__init__(**kwargs)
-        self.api_key = api_key or os.getenv("ADSMEDIA_API_KEY", "")
-        if not self.api_key:
-            raise ValueError("ADSMEDIA_API_KEY is required")
+    @staticmethod
+    def _format(result: dict) -> str:
+        return f"Email sent successfully! Message ID: {result.get('message_id')}"
     
     def _run(
         self,
@@ -51,34 +102,111 @@ class ADSMediaSendEmailTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> str:
         """Send email via ADSMedia API."""
-        payload = {
-            "to": to,
-            "subject": subject,
-            "html": html,
-        }
-        if to_name:
-            payload["to_name"] = to_name
-        if from_name:
-            payload["from_name"] = from_name
-        
         try:
-            response = requests.post(
-                f"{self.base_url}/send",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json=payload,
-                timeout=30,
-            )
-            data = response.json()
-            
-            if data.get("success"):
-                return f"Email sent successfully! Message ID: {data['data']['message_id']}"
-            else:
-                return f"Error: {data.get('error', 'Unknown error')}"
+            return self._format(self.clients.client.send(
+                to=to, subject=subject, html=html, to_name=to_name, from_name=from_name,
+            ))
+        except Exception as e:
+            return _error("sending email", e)
+    
+    async def _arun(
+        self,
+        to: str,
+        subject: str,
+        html: str,
+        to_name: Optional[str] = None,
+        from_name: Optional[str] = None,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> str:
+        """Send email via ADSMedia API without blocking the event loop."""
+        try:
+            return self._format(await self.clients.async_client.send(
+                to=to, subject=subject, html=html, to_name=to_name, from_name=from_name,
+            ))
+        except Exception as e:
+            return _error("sending email", e)
+
+
+class SendBatchInput(BaseModel):
+    """Input schema for sending one email to many recipients."""
+    recipients: List[str] = Field(description="Recipient email addresses")
+    subject: str = Field(description="Email subject line (supports %%First Name%% etc)")
+    html: str = Field(description="HTML content of the email")
+    text: Optional[str] = Field(default=None, description="Plain text version")
+    from_name: Optional[str] = Field(default=None, description="Sender display name")
+
+
+class ADSMediaSendBatchTool(ADSMediaBaseTool):
+    """Tool for sending one email to many recipients via ADSMedia batch sending."""
+    
+    name: str = "adsmedia_send_batch"
+    description: str = """Send the same email to many recipients at once via ADSMedia batch sending.
+    Use this instead of calling adsmedia_send_email repeatedly for newsletters or announcements.
+    Input should include: recipients (list of emails), subject, html content.
+    Optional: text, from_name."""
+    args_schema: Type[BaseModel] = SendBatchInput
+    
+    @staticmethod
+    def _chunks(recipients: List[str]) -> List[List[dict]]:
+        unique = list(dict.fromkeys(recipients))
+        return [
+            [{"email": email} for email in unique[start:start + MAX_BATCH_SIZE]]
+            for start in range(0, len(unique), MAX_BATCH_SIZE)
+        ]
+    
+    @staticmethod
+    def _format(results: List[dict], total: int) -> str:
+        queued = sum(r.get("recipients_count", 0) for r in results)
+        invalid = [email for r in results for email, _ in r.get("invalid", [])]
+        tasks = ", ".join(str(r.get("task_id")) for r in results)
+        summary = f"Batch queued for {queued} of {total} recipients (task {tasks})."
+        if invalid:
+            summary += f" Skipped invalid: {', '.join(invalid)}"
+        return summary
+    
+    def _run(
+        self,
+        recipients: List[str],
+        subject: str,
+        html: str,
+        text: Optional[str] = None,
+        from_name: Optional[str] = None,
+        run_manager: Optional[CallbackManagerForToolRun] = None,
+    ) -> str:
+        """Send batch via ADSMedia API."""
+        try:
+            results = [
+                self.clients.client.send_batch(
+                    recipients=chunk, subject=subject, html=html, text=text,
+                    from_name=from_name, validate=True,
+                )
+                for chunk in self._chunks(recipients)
+            ]
+            return self._format(results, len(recipients))
+        except Exception as e:
+            return _error("sending batch", e)
+    
+    async def _arun(
+        self,
+        recipients: List[str],
+        subject: str,
+        html: str,
+        text: Optional[str] = None,
+        from_name: Optional[str] = None,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> str:
+        """Send batch via ADSMedia API without blocking the event loop."""
+        try:
+            results = [
+                await self.clients.async_client.send_batch(
+                    recipients=chunk, subject=subject, html=html, text=text,
+                    from_name=from_name, validate=True,
+                )
+                for chunk in self._chunks(recipients)
+            ]
+            return self._format(results, len(recipients))
         except Exception as e:
-            return f"Error sending email: {str(e)}"
+            return _error("sending batch", e)
 
 
 class CheckSuppressionInput(BaseModel):
@@ -86,7 +214,7 @@ class CheckSuppressionInput(BaseModel):
     email: str = Field(description="Email address to check")
 
 
-class ADSMediaCheckSuppressionTool(BaseTool):
+class ADSMediaCheckSuppressionTool(ADSMediaBaseTool):
     """Tool for checking if an email is suppressed."""
     
     name: str = "adsmedia_check_suppression"
@@ -94,14 +222,11 @@ class ADSMediaCheckSuppressionTool(BaseTool):
     Use this before sending to verify the email is deliverable."""
     args_schema: Type[BaseModel] = CheckSuppressionInput
     
-    api_key: str = ""
-    base_url: str = "https://api.adsmedia.live/v1"
-    
-    def __init__(self, api_key: Optional[str] = None, **kwargs):
-        super().__init__(**kwargs)
-        self.api_key = api_key or os.getenv("ADSMEDIA_API_KEY", "")
-        if not self.api_key:
-            raise ValueError("ADSMEDIA_API_KEY is required")
+    @staticmethod
+    def _format(email: str, result: dict) -> str:
+        if result.get("suppressed"):
+            return f"Email {email} is SUPPRESSED. Reason: {result.get('reason', 'Unknown')}"
+        return f"Email {email} is NOT suppressed - safe to send."
     
     def _run(
         self,
@@ -110,29 +235,29 @@ class ADSMediaCheckSuppressionTool(BaseTool):
     ) -> str:
         """Check suppression status."""
         try:
-            response = requests.get(
-                f"{self.base_url}/suppressions/check",
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                params={"email": email},
-                timeout=30,
-            )
-            data = response.json()
-            
-            if data.get("success"):
-                if data["data"].get("suppressed"):
-                    return f"Email {email} is SUPPRESSED. Reason: {data['data'].get('reason', 'Unknown')}"
-                return f"Email {email} is NOT suppressed - safe to send."
-            else:
-                return f"Error: {data.get('error', 'Unknown error')}"
+            return self._format(email, self.clients.client.check_suppression(email))
         except Exception as e:
-            return f"Error checking suppression: {str(e)}"
+            return _error("checking suppression", e)
+    
+    async def _arun(
+        self,
+        email: str,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> str:
+        """Check suppression status without blocking the event loop."""
+        try:
+            return self._format(email, await self.clients.async_client.check_suppression(email))
+        except Exception as e:
+            return _error("checking suppression", e)
 
 
-def get_adsmedia_tools(api_key: Optional[str] = None):
-    """Get all ADSMedia tools for LangChain."""
+def get_adsmedia_tools(api_key: Optional[str] = None, clients: Optional[ADSMediaClients] = None):
+    """Get all ADSMedia tools for LangChain, sharing one pooled client."""
+    clients = clients or ADSMediaClients(api_key)
     return [
-        ADSMediaSendEmailTool(api_key=api_key),
-        ADSMediaCheckSuppressionTool(api_key=api_key),
+        ADSMediaSendEmailTool(clients=clients),
+        ADSMediaSendBatchTool(clients=clients),
+        ADSMediaCheckSuppressionTool(clients=clients),
     ]
 
 
@@ -158,4 +283,3 @@ if __name__ == "__main__":
     # Run
     result = agent.run("Send a welcome email to test@example.com")
     print(result)
-
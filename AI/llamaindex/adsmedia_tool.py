@@ -2,15 +2,20 @@
 ADSMedia Tool for LlamaIndex
 Send emails using ADSMedia API from LlamaIndex agents
 
-pip install llama-index requests
+pip install llama-index "adsmedia[async]"
 """
 
 import os
-import requests
-from typing import Optional
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
 from llama_index.core.tools import FunctionTool
 
-API_BASE_URL = "https://api.adsmedia.live/v1"
+from adsmedia import ADSMedia, ADSMediaError, AsyncADSMedia, shared_async_client, shared_client
+
+API_BASE_URL = os.getenv("ADSMEDIA_BASE_URL", "https://api.adsmedia.live/v1")
+# Seconds suppression and ping results are reused within and across agent runs
+CACHE_TTL = float(os.getenv("ADSMEDIA_CACHE_TTL", "60"))
 
 
 def get_api_key() -> str:
@@ -21,6 +26,65 @@ def get_api_key() -> str:
     return key
 
 
+def get_client() -> ADSMedia:
+    """The pooled client shared by every tool call."""
+    return shared_client(get_api_key(), API_BASE_URL)
+
+
+def get_async_client() -> AsyncADSMedia:
+    """The async client shared by every async tool call in the running loop."""
+    return shared_async_client(get_api_key(), API_BASE_URL)
+
+
+class ResultCache:
+    """Successful results kept for ttl seconds."""
+    
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._values: Dict[Tuple[str, ...], Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: Tuple[str, ...]) -> Optional[Any]:
+        with self._lock:
+            cached = self._values.get(key)
+            if cached is None:
+                return None
+            if cached[0] <= time.monotonic():
+                del self._values[key]
+                return None
+            return cached[1]
+    
+    def put(self, key: Tuple[str, ...], value: Any) -> Any:
+        with self._lock:
+            self._values[key] = (time.monotonic() + self.ttl, value)
+        return value
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+cache = ResultCache(CACHE_TTL)
+
+
+def _error(e: Exception) -> str:
+    return f"Error: {e.message if isinstance(e, ADSMediaError) else str(e)}"
+
+
+def _sent(to: str, result: Dict[str, Any]) -> str:
+    return f"Email sent successfully to {to}. Message ID: {result.get('message_id')}"
+
+
+def _suppression(email: str, result: Dict[str, Any]) -> str:
+    if result.get("suppressed"):
+        return f"Email {email} is SUPPRESSED. Reason: {result.get('reason', 'Unknown')}"
+    return f"Email {email} is NOT suppressed - safe to send."
+
+
+def _connected(result: Dict[str, Any]) -> str:
+    return f"Connected! User ID: {result.get('userId')}, Version: {result.get('version')}"
+
+
 def send_email(
     to: str,
     subject: str,
@@ -41,36 +105,28 @@ def send_email(
     Returns:
         Success message with message ID or error message
     """
-    api_key = get_api_key()
-    
-    payload = {
-        "to": to,
-        "subject": subject,
-        "html": html,
-    }
-    if to_name:
-        payload["to_name"] = to_name
-    if from_name:
-        payload["from_name"] = from_name
-    
     try:
-        response = requests.post(
-            f"{API_BASE_URL}/send",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            json=payload,
-            timeout=30,
+        result = get_client().send(to=to, subject=subject, html=html, to_name=to_name, from_name=from_name)
+        return _sent(to, result)
+    except Exception as e:
+        return _error(e)
+
+
+async def async_send_email(
+    to: str,
+    subject: str,
+    html: str,
+    to_name: Optional[str] = None,
+    from_name: Optional[str] = None,
+) -> str:
+    """Async variant of send_email."""
+    try:
+        result = await get_async_client().send(
+            to=to, subject=subject, html=html, to_name=to_name, from_name=from_name,
         )
-        data = response.json()
-        
-        if data.get("success"):
-            return f"Email sent successfully to {to}. Message ID: {data['data']['message_id']}"
-        else:
-            return f"Error sending email: {data.get('error', 'Unknown error')}"
+        return _sent(to, result)
     except Exception as e:
-        return f"Error: {str(e)}"
+        return _error(e)
 
 
 def check_suppression(email: str) -> str:
@@ -83,25 +139,26 @@ def check_suppression(email: str) -> str:
     Returns:
         Status message indicating if email is suppressed or safe to send
     """
-    api_key = get_api_key()
-    
-    try:
-        response = requests.get(
-            f"{API_BASE_URL}/suppressions/check",
-            headers={"Authorization": f"Bearer {api_key}"},
-            params={"email": email},
-            timeout=30,
-        )
-        data = response.json()
-        
-        if data.get("success"):
-            if data["data"].get("suppressed"):
-                return f"Email {email} is SUPPRESSED. Reason: {data['data'].get('reason', 'Unknown')}"
-            return f"Email {email} is NOT suppressed - safe to send."
-        else:
-            return f"Error: {data.get('error', 'Unknown error')}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+    key = ("suppression", email.strip().lower())
+    result = cache.get(key)
+    if result is None:
+        try:
+            result = cache.put(key, get_client().check_suppression(email))
+        except Exception as e:
+            return _error(e)
+    return _suppression(email, result)
+
+
+async def async_check_suppression(email: str) -> str:
+    """Async variant of check_suppression."""
+    key = ("suppression", email.strip().lower())
+    result = cache.get(key)
+    if result is None:
+        try:
+            result = cache.put(key, await get_async_client().check_suppression(email))
+        except Exception as e:
+            return _error(e)
+    return _suppression(email, result)
 
 
 def ping() -> str:
@@ -111,39 +168,44 @@ def ping() -> str:
     Returns:
         Connection status message
     """
-    api_key = get_api_key()
-    
-    try:
-        response = requests.get(
-            f"{API_BASE_URL}/ping",
-            headers={"Authorization": f"Bearer {api_key}"},
-            timeout=30,
-        )
-        data = response.json()
-        
-        if data.get("success"):
-            return f"Connected! User ID: {data['data'].get('userId')}, Version: {data['data'].get('version')}"
-        else:
-            return "Connection failed"
-    except Exception as e:
-        return f"Error: {str(e)}"
+    result = cache.get(("ping",))
+    if result is None:
+        try:
+            result = cache.put(("ping",), get_client().ping())
+        except Exception as e:
+            return _error(e)
+    return _connected(result)
+
+
+async def async_ping() -> str:
+    """Async variant of ping."""
+    result = cache.get(("ping",))
+    if result is None:
+        try:
+            result = cache.put(("ping",), await get_async_client().ping())
+        except Exception as e:
+            return _error(e)
+    return _connected(result)
 
 
 # Create LlamaIndex tools
 send_email_tool = FunctionTool.from_defaults(
     fn=send_email,
+    async_fn=async_send_email,
     name="send_email",
     description="Send an email via ADSMedia API. Use for transactional emails like notifications, confirmations, alerts.",
 )
 
 check_suppression_tool = FunctionTool.from_defaults(
     fn=check_suppression,
+    async_fn=async_check_suppression,
     name="check_suppression",
     description="Check if an email address is suppressed before sending. Use to verify deliverability.",
 )
 
 ping_tool = FunctionTool.from_defaults(
     fn=ping,
+    async_fn=async_ping,
     name="ping",
     description="Test ADSMedia API connection.",
 )
@@ -171,4 +233,3 @@ if __name__ == "__main__":
     # Run
     response = agent.chat("Send a welcome email to test@example.com")
     print(response)
-
@@ -13,7 +13,49 @@ Example usage:
     )
 """
 
-from .client import ADSMedia, ADSMediaError
+from .client import ADSMedia, ADSMediaError, CircuitOpenError, SuppressedRecipientError
+from .async_client import AsyncADSMedia
+from .content import CampaignCache, ContentCampaigns, content_hash
+from .events import (
+    CheckpointStore,
+    EventTailer,
+    MemoryCheckpointStore,
+    SQLiteCheckpointStore,
+)
+from .fanout import CampaignFanout, FanoutTarget, FanoutTask
+from .idempotency import (
+    IdempotencyStore,
+    MemoryIdempotencyStore,
+    SQLiteIdempotencyStore,
+    new_idempotency_key,
+)
+from .listsync import ListSync, SyncPlan, merge_lists
+from .pool import ClientPool, PoolMember
+from .scheduler import QuotaScheduler, ServerQuota
+from .shared import (
+    aclose_shared_clients,
+    close_shared_clients,
+    shared_async_client,
+    shared_client,
+)
+from .suppression import SuppressionIndex, SuppressionSync
+from .templates import CompiledTemplate, MessageTemplate, compile_template
+from .resilience import CircuitBreaker, CircuitBreakerConfig
+from .validation import MXCache, ValidationReport, normalise_address, validate_recipients
+from .watcher import ScheduleWatcher, Subscription, WatchEvent
+from .transport import (
+    AiohttpTransport,
+    AsyncFakeTransport,
+    AsyncHttpxTransport,
+    AsyncTransport,
+    FakeTransport,
+    HttpxTransport,
+    RecordingTransport,
+    RequestsTransport,
+    Transport,
+    TransportResponse,
+    Urllib3Transport,
+)
 from .types import (
     SendEmailOptions,
     BatchRecipient,
@@ -29,7 +71,60 @@ from .types import (
 __version__ = "1.0.0"
 __all__ = [
     "ADSMedia",
+    "AsyncADSMedia",
+    "shared_client",
+    "shared_async_client",
+    "close_shared_clients",
+    "aclose_shared_clients",
     "ADSMediaError",
+    "CircuitOpenError",
+    "SuppressedRecipientError",
+    "CircuitBreaker",
+    "CircuitBreakerConfig",
+    "ClientPool",
+    "PoolMember",
+    "QuotaScheduler",
+    "ServerQuota",
+    "CompiledTemplate",
+    "MessageTemplate",
+    "compile_template",
+    "CampaignFanout",
+    "CampaignCache",
+    "ContentCampaigns",
+    "content_hash",
+    "FanoutTarget",
+    "FanoutTask",
+    "ScheduleWatcher",
+    "Subscription",
+    "WatchEvent",
+    "EventTailer",
+    "CheckpointStore",
+    "MemoryCheckpointStore",
+    "SQLiteCheckpointStore",
+    "ListSync",
+    "SyncPlan",
+    "merge_lists",
+    "SuppressionIndex",
+    "SuppressionSync",
+    "validate_recipients",
+    "normalise_address",
+    "ValidationReport",
+    "MXCache",
+    "IdempotencyStore",
+    "MemoryIdempotencyStore",
+    "SQLiteIdempotencyStore",
+    "new_idempotency_key",
+    "Transport",
+    "AsyncTransport",
+    "TransportResponse",
+    "RequestsTransport",
+    "HttpxTransport",
+    "Urllib3Transport",
+    "AiohttpTransport",
+    "AsyncHttpxTransport",
+    "FakeTransport",
+    "AsyncFakeTransport",
+    "RecordingTransport",
     "SendEmailOptions",
     "BatchRecipient", 
     "SendBatchOptions",
@@ -0,0 +1,639 @@
+"""ADSMedia API Client for asyncio"""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, AsyncIterator, Union
+
+from .client import (
+    ADSMediaError,
+    CircuitOpenError,
+    SuppressedRecipientError,
+    _can_retry,
+    _is_transient,
+    _parse_response,
+    _prepare_batch,
+    _prepare_contacts,
+)
+from .idempotency import IdempotencyStore, MemoryIdempotencyStore, new_idempotency_key
+from .resilience import CircuitBreaker, CircuitBreakerConfig
+from .streaming import GZIP, JSONArrayStream, accept_encoding, encode_json
+from .transport import (
+    AsyncStreamResponse,
+    AsyncTransport,
+    TransportError,
+    TransportResponse,
+    TransportTimeout,
+    _decode,
+    make_async_transport,
+)
+from .types import BatchRecipient, Contact
+if TYPE_CHECKING:
+    from .suppression import SuppressionIndex
+
+
+class AsyncADSMedia:
+    """
+    ADSMedia Email API Client for asyncio
+    
+    Same methods as ADSMedia, as coroutines. Requests share one pooled
+    session (aiohttp by default, pip install adsmedia[async]; or
+    transport='httpx'). Create it inside the running event loop and close
+    it with aclose() or "async with".
+    
+    Example:
+        async with AsyncADSMedia(api_key='your-api-key') as client:
+            result = await client.send(to='user@example.com', subject='Hello', html='<h1>Hi!</h1>')
+    """
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.adsmedia.live/v1",
+        timeout: int = 30,
+        max_retries: int = 0,
+        retry_backoff: float = 0.5,
+        retry_writes: bool = False,
+        idempotency_store: Optional[IdempotencyStore] = None,
+        circuit_breaker: Optional[CircuitBreakerConfig] = None,
+        pool_maxsize: int = 100,
+        suppression_index: Optional["SuppressionIndex"] = None,
+        transport: Union[str, AsyncTransport, None] = None,
+        max_concurrency: Optional[int] = None,
+        compress_threshold: Optional[int] = None,
+        compression: str = GZIP,
+    ):
+        if not api_key:
+            raise ValueError("API key is required")
+        
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.retry_writes = retry_writes
+        self.idempotency_store = (
+            idempotency_store if idempotency_store is not None else MemoryIdempotencyStore()
+        )
+        self._inflight: Dict[str, asyncio.Event] = {}
+        self.suppression_index = suppression_index
+        self.circuit_breaker = circuit_breaker
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self.transport = make_async_transport(transport, pool_maxsize)
+        # Caps requests in flight from this client (None: the pool size limits them)
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # Request bodies of at least this many bytes are sent compressed
+        self.compress_threshold = compress_threshold
+        self.compression = compression
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "Accept-Encoding": accept_encoding(),
+        }
+    
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Any:
+        """Make API request (retries and idempotency as in ADSMedia._request)"""
+        if idempotency_key is None:
+            return await self._request_with_retries(method, endpoint, params, json)
+        
+        while True:
+            cached = self.idempotency_store.get(idempotency_key)
+            if cached is not None:
+                return cached
+            pending = self._inflight.get(idempotency_key)
+            if pending is None:
+                done = self._inflight[idempotency_key] = asyncio.Event()
+                break
+            # Another task is sending under this key; wait for its outcome
+            await pending.wait()
+        
+        try:
+            result = await self._request_with_retries(method, endpoint, params, json, idempotency_key)
+            self.idempotency_store.put(idempotency_key, result)
+            return result
+        finally:
+            self._inflight.pop(idempotency_key, None)
+            done.set()
+    
+    async def _request_with_retries(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Any:
+        headers = {"Idempotency-Key": idempotency_key} if idempotency_key else None
+        retryable = method == "GET" or idempotency_key is not None
+        attempts = self.max_retries + 1 if retryable else 1
+        
+        for attempt in range(attempts):
+            try:
+                return await self._send_request(method, endpoint, params, json, headers)
+            except ADSMediaError as e:
+                if attempt + 1 >= attempts or not _can_retry(e, method, self.retry_writes):
+                    raise
+                await asyncio.sleep(self.retry_backoff * (2 ** attempt))
+    
+    def _circuit_breaker(self, endpoint: str) -> Optional[CircuitBreaker]:
+        if self.circuit_breaker is None:
+            return None
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._breakers[endpoint] = CircuitBreaker(self.circuit_breaker)
+        return breaker
+    
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        breaker = self._circuit_breaker(endpoint)
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {endpoint}", 503)
+        
+        if self.max_concurrency and self._semaphore is None:
+            # Created lazily so it binds to the running loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        started = time.monotonic()
+        try:
+            if self._semaphore is None:
+                result = await self._perform_request(method, endpoint, params, json, headers)
+            else:
+                async with self._semaphore:
+                    result = await self._perform_request(method, endpoint, params, json, headers)
+        except ADSMediaError as e:
+            if breaker is not None:
+                if _is_transient(e):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success(time.monotonic() - started)
+            raise
+        
+        if breaker is not None:
+            breaker.record_success(time.monotonic() - started)
+        return result
+    
+    async def _perform_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        url = f"{self.base_url}{endpoint}"
+        body = None
+        if json is not None and self.compress_threshold is not None:
+            body, encoding = encode_json(json, self.compress_threshold, self.compression)
+            json = None
+            if encoding:
+                headers = dict(headers or {}, **{"Content-Encoding": encoding})
+        
+        try:
+            response = await self.transport.request(
+                method,
+                url,
+                params=params,
+                json=json,
+                headers=dict(self._headers, **headers) if headers else self._headers,
+                timeout=self.timeout,
+                body=body,
+            )
+        except TransportTimeout as e:
+            raise ADSMediaError("Request timeout", 408) from e
+        except TransportError as e:
+            raise ADSMediaError(str(e)) from e
+        
+        return _parse_response(response)
+    
+    async def _open_stream(self, endpoint: str, params: Optional[Dict[str, Any]]) -> AsyncStreamResponse:
+        try:
+            response = await self.transport.stream(
+                "GET", f"{self.base_url}{endpoint}", params=params,
+                headers=self._headers, timeout=self.timeout,
+            )
+        except TransportTimeout as e:
+            raise ADSMediaError("Request timeout", 408) from e
+        except TransportError as e:
+            raise ADSMediaError(str(e)) from e
+        
+        if response.status_code >= 400:
+            body = b""
+            try:
+                async for chunk in response.chunks:
+                    body += chunk
+            except TransportError:
+                pass
+            finally:
+                await response.close()
+            _parse_response(TransportResponse(response.status_code, _decode(body)))
+        return response
+    
+    async def _stream_items(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Any]:
+        """GET a list endpoint and yield its items while the body downloads"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self._open_stream(endpoint, params)
+                break
+            except ADSMediaError as e:
+                if attempt >= self.max_retries or not _is_transient(e):
+                    raise
+                await asyncio.sleep(self.retry_backoff * (2 ** attempt))
+        
+        parser = JSONArrayStream()
+        try:
+            async for chunk in response.chunks:
+                for item in parser.feed(chunk):
+                    yield item
+            for item in parser.close():
+                yield item
+        except TransportError as e:
+            raise ADSMediaError(str(e)) from e
+        except ValueError as e:
+            raise ADSMediaError("Invalid JSON response", response.status_code) from e
+        finally:
+            await response.close()
+        if parser.envelope.get("success") is False:
+            raise ADSMediaError(parser.envelope.get("error", "Unknown error"))
+    
+    async def aclose(self) -> None:
+        """Close the pooled session"""
+        await self.transport.aclose()
+    
+    async def __aenter__(self) -> "AsyncADSMedia":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+    
+    # ===== Connection =====
+    
+    async def ping(self) -> Dict[str, Any]:
+        """Test API connectivity and authentication"""
+        return await self._request("GET", "/ping")
+    
+    # ===== Email =====
+    
+    async def send(
+        self,
+        to: str,
+        subject: str,
+        html: Optional[str] = None,
+        text: Optional[str] = None,
+        to_name: Optional[str] = None,
+        type: Optional[int] = None,
+        from_name: Optional[str] = None,
+        reply_to: Optional[str] = None,
+        server_id: Optional[int] = None,
+        unsubscribe_url: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Send a single transactional email (see ADSMedia.send)"""
+        if self.suppression_index is not None:
+            reason = self.suppression_index.reason(to)
+            if reason is not None:
+                raise SuppressedRecipientError(to, reason)
+        
+        body = {"to": to, "subject": subject}
+        
+        if html: body["html"] = html
+        if text: body["text"] = text
+        if to_name: body["to_name"] = to_name
+        if type: body["type"] = type
+        if from_name: body["from_name"] = from_name
+        if reply_to: body["reply_to"] = reply_to
+        if server_id: body["server_id"] = server_id
+        if unsubscribe_url: body["unsubscribe_url"] = unsubscribe_url
+        
+        return await self._request(
+            "POST", "/send", json=body,
+            idempotency_key=idempotency_key or new_idempotency_key(),
+        )
+    
+    async def send_batch(
+        self,
+        recipients: List[Union[Dict[str, str], BatchRecipient]],
+        subject: str,
+        html: str,
+        text: Optional[str] = None,
+        preheader: Optional[str] = None,
+        from_name: Optional[str] = None,
+        server_id: Optional[int] = None,
+        idempotency_key: Optional[str] = None,
+        validate: bool = False,
+    ) -> Dict[str, Any]:
+        """Send batch marketing emails, up to 1000 (see ADSMedia.send_batch)"""
+        recipient_list, skipped = _prepare_batch(recipients, self.suppression_index, validate)
+        if not recipient_list:
+            return dict({"task_id": None, "recipients_count": 0}, **skipped)
+        
+        body = {
+            "recipients": recipient_list,
+            "subject": subject,
+            "html": html,
+        }
+        
+        if text: body["text"] = text
+        if preheader: body["preheader"] = preheader
+        if from_name: body["from_name"] = from_name
+        if server_id: body["server_id"] = server_id
+        
+        result = await self._request(
+            "POST", "/send/batch", json=body,
+            idempotency_key=idempotency_key or new_idempotency_key(),
+        )
+        if skipped and isinstance(result, dict):
+            result = dict(result, **skipped)
+        return result
+    
+    async def get_status(
+        self,
+        message_id: Optional[str] = None,
+        send_id: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Get email delivery status"""
+        params = {}
+        if message_id:
+            params["message_id"] = message_id
+        elif send_id:
+            params["id"] = send_id
+        else:
+            raise ValueError("Either message_id or send_id is required")
+        
+        return await self._request("GET", "/send/status", params=params)
+    
+    # ===== Campaigns =====
+    
+    async def get_campaigns(self, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        """Get all campaigns"""
+        return await self._request("GET", "/campaigns", params={"limit": limit, "offset": offset})
+    
+    async def get_campaign(self, id: int) -> Dict[str, Any]:
+        """Get a specific campaign"""
+        return await self._request("GET", "/campaigns/get", params={"id": id})
+    
+    async def create_campaign(
+        self,
+        name: str,
+        subject: str,
+        html: str,
+        text: Optional[str] = None,
+        preheader: Optional[str] = None,
+        type: int = 1,
+    ) -> Dict[str, Any]:
+        """Create a new campaign"""
+        body = {"name": name, "subject": subject, "html": html, "type": type}
+        if text: body["text"] = text
+        if preheader: body["preheader"] = preheader
+        return await self._request("POST", "/campaigns/create", json=body)
+    
+    async def update_campaign(self, id: int, **kwargs) -> Dict[str, Any]:
+        """Update a campaign"""
+        return await self._request("POST", "/campaigns/update", params={"id": id}, json=kwargs)
+    
+    async def delete_campaign(self, id: int) -> Dict[str, Any]:
+        """Delete a campaign"""
+        return await self._request("DELETE", "/campaigns/delete", params={"id": id})
+    
+    # ===== Lists =====
+    
+    async def get_lists(self) -> List[Dict[str, Any]]:
+        """Get all lists"""
+        return await self._request("GET", "/lists")
+    
+    async def get_list(self, id: int) -> Dict[str, Any]:
+        """Get a specific list"""
+        return await self._request("GET", "/lists/get", params={"id": id})
+    
+    async def create_list(self, name: str, type: int = 1) -> Dict[str, Any]:
+        """Create a new list (type: 1=email, 3=phone)"""
+        return await self._request("POST", "/lists/create", json={"name": name, "type": type})
+    
+    async def delete_list(self, id: int) -> Dict[str, Any]:
+        """Delete a list"""
+        return await self._request("DELETE", "/lists/delete", params={"id": id})
+    
+    async def split_list(self, id: int, max_size: int = 35000) -> Dict[str, Any]:
+        """Split a large list into smaller ones"""
+        return await self._request("POST", "/lists/split", params={"id": id}, json={"max_size": max_size})
+    
+    # ===== Contacts =====
+    
+    async def get_contacts(self, list_id: int, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        """Get contacts from a list"""
+        return await self._request("GET", "/lists/contacts", params={
+            "id": list_id, "limit": limit, "offset": offset
+        })
+    
+    async def iter_contacts(self, list_id: int, page_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every contact of a list, streaming each page as it downloads"""
+        offset = 0
+        while True:
+            count = 0
+            async for contact in self._stream_items("/lists/contacts", {
+                "id": list_id, "limit": page_size, "offset": offset
+            }):
+                count += 1
+                yield contact
+            if count < page_size:
+                return
+            offset += count
+    
+    async def add_contacts(
+        self,
+        list_id: int,
+        contacts: List[Union[Dict[str, str], Contact]],
+        validate: bool = False,
+    ) -> Dict[str, Any]:
+        """Add contacts to a list (validate: normalise and drop invalid/duplicate addresses)"""
+        contact_list, dropped = _prepare_contacts(contacts, validate)
+        if validate and not contact_list:
+            return {"added": 0, "invalid": dropped}
+        
+        result = await self._request("POST", "/lists/contacts/add", params={"id": list_id}, json={"contacts": contact_list})
+        if dropped and isinstance(result, dict):
+            result = dict(result, invalid=dropped)
+        return result
+    
+    async def remove_contacts(self, list_id: int, emails: List[str]) -> Dict[str, Any]:
+        """Remove contacts from a list"""
+        return await self._request("DELETE", "/lists/contacts/delete", params={"id": list_id}, json={"emails": emails})
+    
+    # ===== Schedules =====
+    
+    async def get_schedules(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get all schedules (status: queue, prep, sending, done, paused)"""
+        params = {"status": status} if status else {}
+        return await self._request("GET", "/schedules", params=params)
+    
+    async def create_schedule(
+        self,
+        campaign_id: int,
+        list_id: int,
+        server_id: int,
+        sender_name: Optional[str] = None,
+        schedule: Optional[str] = None,  # YYYY-MM-DD HH:MM:SS
+    ) -> Dict[str, Any]:
+        """Create a sending task"""
+        body = {
+            "campaign_id": campaign_id,
+            "list_id": list_id,
+            "server_id": server_id,
+        }
+        if sender_name: body["sender_name"] = sender_name
+        if schedule: body["schedule"] = schedule
+        return await self._request("POST", "/schedules/create", json=body)
+    
+    async def update_schedule(
+        self,
+        id: int,
+        sender_name: Optional[str] = None,
+        schedule: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Update schedule sender name or datetime"""
+        body = {}
+        if sender_name: body["sender_name"] = sender_name
+        if schedule: body["schedule"] = schedule
+        return await self._request("PUT", "/schedules/update", params={"id": id}, json=body)
+    
+    async def pause_schedule(self, id: int) -> Dict[str, Any]:
+        """Pause a schedule"""
+        return await self._request("POST", "/schedules/pause", params={"id": id})
+    
+    async def resume_schedule(self, id: int) -> Dict[str, Any]:
+        """Resume a schedule"""
+        return await self._request("POST", "/schedules/resume", params={"id": id})
+    
+    async def stop_schedule(self, id: int) -> Dict[str, Any]:
+        """Stop and delete a schedule"""
+        return await self._request("DELETE", "/schedules/stop", params={"id": id})
+    
+    # ===== Servers =====
+    
+    async def get_servers(self) -> List[Dict[str, Any]]:
+        """Get all servers"""
+        return await self._request("GET", "/servers")
+    
+    async def get_server(self, id: int) -> Dict[str, Any]:
+        """Get a specific server"""
+        return await self._request("GET", "/servers/get", params={"id": id})
+    
+    async def verify_domain(self, server_id: int) -> Dict[str, Any]:
+        """Verify domain DNS (SPF, DKIM, DMARC, etc)"""
+        return await self._request("GET", "/domains/verify", params={"server_id": server_id})
+    
+    # ===== Statistics =====
+    
+    async def get_overview_stats(self) -> Dict[str, Any]:
+        """Get overall statistics"""
+        return await self._request("GET", "/stats/overview")
+    
+    async def get_campaign_stats(self, task_id: int) -> Dict[str, Any]:
+        """Get campaign/task statistics"""
+        return await self._request("GET", "/stats/campaign", params={"id": task_id})
+    
+    async def get_hourly_stats(self, task_id: int) -> Dict[str, Any]:
+        """Get hourly breakdown"""
+        return await self._request("GET", "/stats/hourly", params={"id": task_id})
+    
+    async def get_daily_stats(self, task_id: int) -> Dict[str, Any]:
+        """Get daily breakdown"""
+        return await self._request("GET", "/stats/daily", params={"id": task_id})
+    
+    async def get_country_stats(self, task_id: int) -> Dict[str, Any]:
+        """Get geographic stats"""
+        return await self._request("GET", "/stats/countries", params={"id": task_id})
+    
+    async def get_provider_stats(self, task_id: int) -> Dict[str, Any]:
+        """Get provider breakdown (Gmail, Outlook, etc)"""
+        return await self._request("GET", "/stats/providers", params={"id": task_id})
+    
+    async def get_bounce_details(self, task_id: int) -> List[Dict[str, Any]]:
+        """Get bounce details"""
+        return await self._request("GET", "/stats/bounces", params={"id": task_id})
+    
+    async def get_events(
+        self,
+        task_id: int,
+        type: Optional[str] = None,  # open, click, bounce, unsubscribe, sent
+        email: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Get events for a task"""
+        params = {"id": task_id, "limit": limit, "offset": offset}
+        if type: params["type"] = type
+        if email: params["email"] = email
+        return await self._request("GET", "/stats/events", params=params)
+    
+    async def iter_events(
+        self,
+        task_id: int,
+        type: Optional[str] = None,
+        email: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every event of a task, streaming each page as it downloads"""
+        offset = 0
+        while True:
+            params = {"id": task_id, "limit": page_size, "offset": offset}
+            if type: params["type"] = type
+            if email: params["email"] = email
+            count = 0
+            async for event in self._stream_items("/stats/events", params):
+                count += 1
+                yield event
+            if count < page_size:
+                return
+            offset += count
+    
+    # ===== Suppression =====
+    
+    async def check_suppression(self, email: str) -> Dict[str, Any]:
+        """Check if email is suppressed (the local suppression index is consulted first)"""
+        if self.suppression_index is not None:
+            reason = self.suppression_index.reason(email)
+            if reason is not None:
+                return {"email": email, "suppressed": True, "reason": reason, "source": "local"}
+        return await self._request("GET", "/suppressions/check", params={"email": email})
+    
+    async def check_suppressions(
+        self, emails: List[str], concurrency: int = 8
+    ) -> Dict[str, Union[Dict[str, Any], ADSMediaError]]:
+        """Check many addresses concurrently (see ADSMedia.check_suppressions)"""
+        unique = list(dict.fromkeys(emails))
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def check(email: str) -> Union[Dict[str, Any], ADSMediaError]:
+            async with semaphore:
+                try:
+                    return await self.check_suppression(email)
+                except ADSMediaError as e:
+                    return e
+        
+        return dict(zip(unique, await asyncio.gather(*(check(email) for email in unique))))
+    
+    # ===== Account =====
+    
+    async def get_account(self) -> Dict[str, Any]:
+        """Get account information"""
+        return await self._request("GET", "/account")
+    
+    async def get_usage(self) -> Dict[str, Any]:
+        """Get usage statistics"""
+        return await self._request("GET", "/account/usage")
+
@@ -1,9 +1,28 @@
 """ADSMedia API Client"""
 
-import requests
-from typing import Optional, List, Dict, Any, Union
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Iterator, Tuple, Union
 from urllib.parse import urlencode
 
+from .idempotency import IdempotencyStore, MemoryIdempotencyStore, new_idempotency_key
+from .resilience import CircuitBreaker, CircuitBreakerConfig, LatencyTracker
+from .streaming import GZIP, JSONArrayStream, accept_encoding, encode_json
+from .transport import (
+    StreamResponse,
+    Transport,
+    TransportConnectError,
+    TransportConnectionError,
+    TransportError,
+    TransportResponse,
+    TransportTimeout,
+    _decode,
+    make_transport,
+)
+from .validation import validate_recipients
+if TYPE_CHECKING:
+    from .suppression import SuppressionIndex
 from .types import (
     SendEmailOptions,
     BatchRecipient,
@@ -25,6 +44,134 @@ class ADSMediaError(Exception):
         self.status_code = status_code
 
 
+class CircuitOpenError(ADSMediaError):
+    """Raised without contacting the API while an endpoint's circuit is open"""
+
+
+class SuppressedRecipientError(ADSMediaError):
+    """Raised without contacting the API when send() targets a suppressed address"""
+    def __init__(self, email: str, reason: str):
+        super().__init__(f"Recipient {email} is suppressed ({reason})")
+        self.email = email
+        self.reason = reason
+
+
+def _parse_response(response: Any) -> Any:
+    """Unwrap an API response envelope, raising ADSMediaError on failure"""
+    data = response.data
+    if not response.ok:
+        error = data.get("error") if isinstance(data, dict) else None
+        message = error.get("message") if isinstance(error, dict) else None
+        raise ADSMediaError(message or f"HTTP {response.status_code}", response.status_code)
+    if not isinstance(data, dict):
+        if data is None:
+            raise ADSMediaError("Invalid JSON response", response.status_code)
+        return data
+    if not data.get("success", True):
+        raise ADSMediaError(data.get("error", "Unknown error"))
+    return data.get("data", data)
+
+
+# Status codes worth resending: timeouts, throttling and upstream failures
+RETRY_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+# Status codes returned without processing the request (throttled, unavailable)
+UNPROCESSED_STATUS_CODES = frozenset({429, 503})
+
+
+def _is_transient(error: ADSMediaError) -> bool:
+    """Whether a failed request may succeed if sent again"""
+    if isinstance(error, CircuitOpenError):
+        return False
+    if error.status_code in RETRY_STATUS_CODES:
+        return True
+    return isinstance(error.__cause__, TransportConnectionError)
+
+
+def _is_unprocessed(error: ADSMediaError) -> bool:
+    """Whether a failed request certainly had no effect, so a write can be resent"""
+    if isinstance(error, CircuitOpenError):
+        return False
+    if error.status_code in UNPROCESSED_STATUS_CODES:
+        return True
+    return isinstance(error.__cause__, TransportConnectError)
+
+
+def _can_retry(error: ADSMediaError, method: str, retry_writes: bool) -> bool:
+    """
+    Whether a failed request may be resent
+    
+    Reads are resent on any transient failure. A write that timed out or
+    got a 5xx may already have been delivered, so it is only resent when
+    retry_writes is set (the server deduplicates on Idempotency-Key).
+    """
+    if method == "GET" or retry_writes:
+        return _is_transient(error)
+    return _is_unprocessed(error)
+
+
+def _prepare_batch(
+    recipients: List[Union[Dict[str, str], BatchRecipient]],
+    suppression_index: Optional["SuppressionIndex"],
+    validate: bool,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Batch recipients as dicts, plus skipped addresses by category (suppressed, invalid)"""
+    # Convert BatchRecipient to dict if needed
+    recipient_list = []
+    for r in recipients:
+        if isinstance(r, BatchRecipient):
+            recipient_list.append({
+                "email": r.email,
+                "name": r.name,
+            })
+        else:
+            recipient_list.append(r)
+    
+    dropped: List[Any] = []
+    if validate:
+        report = validate_recipients(recipient_list)
+        recipient_list, dropped = report.valid, report.dropped
+    
+    suppressed: Dict[str, str] = {}
+    if suppression_index is not None:
+        from .suppression import split_suppressed
+        keep, suppressed = split_suppressed(
+            suppression_index, [r.get("email") for r in recipient_list]
+        )
+        if suppressed:
+            recipient_list = [recipient_list[i] for i in keep]
+    
+    skipped: Dict[str, Any] = {}
+    if suppressed:
+        skipped["suppressed"] = suppressed
+    if dropped:
+        skipped["invalid"] = dropped
+    return recipient_list, skipped
+
+
+def _prepare_contacts(
+    contacts: List[Union[Dict[str, str], Contact]], validate: bool
+) -> Tuple[List[Dict[str, Any]], List[Any]]:
+    """Contacts as API dicts, and the (email, reason) pairs validation dropped"""
+    contact_list = []
+    for c in contacts:
+        if isinstance(c, Contact):
+            contact_list.append({
+                "email": c.email,
+                "firstName": c.first_name,
+                "lastName": c.last_name,
+                "custom1": c.custom1,
+                "custom2": c.custom2,
+            })
+        else:
+            contact_list.append(c)
+    
+    dropped: List[Any] = []
+    if validate:
+        report = validate_recipients(contact_list)
+        contact_list, dropped = report.valid, report.dropped
+    return contact_list, dropped
+
+
 class ADSMedia:
     """
     ADSMedia Email API Client
@@ -38,7 +185,19 @@ class ADSMedia:
         self,
         api_key: str,
         base_url: str = "https://api.adsmedia.live/v1",
-        timeout: int = 30
+        timeout: int = 30,
+        max_retries: int = 0,
+        retry_backoff: float = 0.5,
+        retry_writes: bool = False,
+        idempotency_store: Optional[IdempotencyStore] = None,
+        circuit_breaker: Optional[CircuitBreakerConfig] = None,
+        hedged_reads: bool = False,
+        hedge_percentile: float = 95.0,
+        pool_maxsize: int = 10,
+        suppression_index: Optional["SuppressionIndex"] = None,
+        transport: Union[str, Transport, None] = None,
+        compress_threshold: Optional[int] = None,
+        compression: str = GZIP,
     ):
         if not api_key:
             raise ValueError("API key is required")
@@ -46,11 +205,33 @@ class ADSMedia:
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
-        self._session = requests.Session()
-        self._session.headers.update({
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        # Resend writes after timeouts and 5xx too (needs server-side Idempotency-Key support)
+        self.retry_writes = retry_writes
+        self.idempotency_store = (
+            idempotency_store if idempotency_store is not None else MemoryIdempotencyStore()
+        )
+        # Key -> lock held by the thread sending under that key
+        self._inflight: Dict[str, threading.Lock] = {}
+        self._inflight_lock = threading.Lock()
+        self.suppression_index = suppression_index
+        self.circuit_breaker = circuit_breaker
+        self.hedged_reads = hedged_reads
+        self.hedge_percentile = hedge_percentile
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._latencies: Dict[str, LatencyTracker] = {}
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._state_lock = threading.Lock()
+        self.transport = make_transport(transport, pool_maxsize)
+        # Request bodies of at least this many bytes are sent compressed
+        self.compress_threshold = compress_threshold
+        self.compression = compression
+        self._headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
-        })
+            "Accept-Encoding": accept_encoding(),
+        }
     
     def _request(
         self,
@@ -58,34 +239,240 @@ class ADSMedia:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Any:
+        """
+        Make API request
+
+        GET requests are resent up to max_retries times on transient
+        failures. Requests carrying an idempotency key are resent only when
+        they certainly had no effect (connection refused, 429, 503), or on
+        any transient failure if retry_writes is set. Results of keyed
+        requests are recorded in the idempotency store, so repeating a key
+        never sends the same email twice from this process.
+        """
+        if idempotency_key is None:
+            return self._request_with_retries(method, endpoint, params, json)
+        
+        while True:
+            cached = self.idempotency_store.get(idempotency_key)
+            if cached is not None:
+                return cached
+            with self._inflight_lock:
+                pending = self._inflight.get(idempotency_key)
+                if pending is None:
+                    # A held lock is much cheaper to create than an Event
+                    done = self._inflight[idempotency_key] = threading.Lock()
+                    done.acquire()
+                    break
+            # Another thread is sending under this key; wait for its outcome
+            with pending:
+                pass
+        
+        try:
+            result = self._request_with_retries(method, endpoint, params, json, idempotency_key)
+            self.idempotency_store.put(idempotency_key, result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(idempotency_key, None)
+            done.release()
+    
+    def _request_with_retries(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Any:
+        # The Idempotency-Key header lets a supporting server discard
+        # duplicates of a write whose response was lost; see _can_retry
+        headers = {"Idempotency-Key": idempotency_key} if idempotency_key else None
+        retryable = method == "GET" or idempotency_key is not None
+        attempts = self.max_retries + 1 if retryable else 1
+        
+        for attempt in range(attempts):
+            try:
+                if method == "GET" and self.hedged_reads:
+                    return self._send_hedged(endpoint, params)
+                return self._send_request(method, endpoint, params, json, headers)
+            except ADSMediaError as e:
+                if attempt + 1 >= attempts or not _can_retry(e, method, self.retry_writes):
+                    raise
+                time.sleep(self.retry_backoff * (2 ** attempt))
+    
+    def _send_hedged(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Send a GET, firing a backup copy if it outlives the endpoint's usual
+        latency (hedge_percentile); whichever answers first wins
+        """
+        delay = self._latency_tracker(endpoint).percentile(self.hedge_percentile, min_samples=20)
+        if delay is None:
+            return self._send_request("GET", endpoint, params)
+        
+        with self._state_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(thread_name_prefix="adsmedia-hedge")
+            executor = self._hedge_executor
+        
+        pending = {executor.submit(self._send_request, "GET", endpoint, params)}
+        done, _ = wait(pending, timeout=delay)
+        if not done:
+            pending.add(executor.submit(self._send_request, "GET", endpoint, params))
+        
+        error: Optional[ADSMediaError] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    return future.result()
+                except ADSMediaError as e:
+                    error = e
+        raise error
+    
+    def _circuit_breaker(self, endpoint: str) -> Optional[CircuitBreaker]:
+        if self.circuit_breaker is None:
+            return None
+        with self._state_lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = self._breakers[endpoint] = CircuitBreaker(self.circuit_breaker)
+            return breaker
+    
+    def _latency_tracker(self, endpoint: str) -> LatencyTracker:
+        with self._state_lock:
+            tracker = self._latencies.get(endpoint)
+            if tracker is None:
+                tracker = self._latencies[endpoint] = LatencyTracker()
+            return tracker
+    
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        breaker = self._circuit_breaker(endpoint)
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {endpoint}", 503)
+        
+        started = time.monotonic()
+        try:
+            result = self._perform_request(method, endpoint, params, json, headers)
+        except ADSMediaError as e:
+            if breaker is not None:
+                if _is_transient(e):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success(time.monotonic() - started)
+            raise
+        
+        elapsed = time.monotonic() - started
+        if breaker is not None:
+            breaker.record_success(elapsed)
+        if method == "GET" and self.hedged_reads:
+            self._latency_tracker(endpoint).record(elapsed)
+        return result
+    
+    def _perform_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
     ) -> Any:
-        """Make API request"""
         url = f"{self.base_url}{endpoint}"
+        body = None
+        if json is not None and self.compress_threshold is not None:
+            body, encoding = encode_json(json, self.compress_threshold, self.compression)
+            json = None
+            if encoding:
+                headers = dict(headers or {}, **{"Content-Encoding": encoding})
         
         try:
-            response = self._session.request(
-                method=method,
-                url=url,
+            response = self.transport.request(
+                method,
+                url,
                 params=params,
                 json=json,
+                headers=dict(self._headers, **headers) if headers else self._headers,
                 timeout=self.timeout,
+                body=body,
             )
-            
-            data = response.json()
-            
-            if not response.ok:
-                error_msg = data.get("error", {}).get("message", f"HTTP {response.status_code}")
-                raise ADSMediaError(error_msg, response.status_code)
-            
-            if not data.get("success", True):
-                raise ADSMediaError(data.get("error", "Unknown error"))
-            
-            return data.get("data", data)
-            
-        except requests.exceptions.Timeout:
-            raise ADSMediaError("Request timeout", 408)
-        except requests.exceptions.RequestException as e:
-            raise ADSMediaError(str(e))
+        except TransportTimeout as e:
+            raise ADSMediaError("Request timeout", 408) from e
+        except TransportError as e:
+            raise ADSMediaError(str(e)) from e
+        
+        return _parse_response(response)
+    
+    def _open_stream(self, endpoint: str, params: Optional[Dict[str, Any]]) -> StreamResponse:
+        try:
+            response = self.transport.stream(
+                "GET", f"{self.base_url}{endpoint}", params=params,
+                headers=self._headers, timeout=self.timeout,
+            )
+        except TransportTimeout as e:
+            raise ADSMediaError("Request timeout", 408) from e
+        except TransportError as e:
+            raise ADSMediaError(str(e)) from e
+        
+        if response.status_code >= 400:
+            try:
+                body = b"".join(response.chunks)
+            except TransportError:
+                body = b""
+            finally:
+                response.close()
+            _parse_response(TransportResponse(response.status_code, _decode(body)))
+        return response
+    
+    def _stream_items(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+        """
+        GET a list endpoint and yield its items while the body downloads
+        
+        Only one item and one network chunk are held in memory at a time.
+        Failures before the response starts are retried like other GETs.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self._open_stream(endpoint, params)
+                break
+            except ADSMediaError as e:
+                if attempt >= self.max_retries or not _is_transient(e):
+                    raise
+                time.sleep(self.retry_backoff * (2 ** attempt))
+        
+        parser = JSONArrayStream()
+        try:
+            for chunk in response.chunks:
+                yield from parser.feed(chunk)
+            yield from parser.close()
+        except TransportError as e:
+            raise ADSMediaError(str(e)) from e
+        except ValueError as e:
+            raise ADSMediaError("Invalid JSON response", response.status_code) from e
+        finally:
+            response.close()
+        if parser.envelope.get("success") is False:
+            raise ADSMediaError(parser.envelope.get("error", "Unknown error"))
+    
+    def close(self) -> None:
+        """Release pooled connections and worker threads"""
+        self.transport.close()
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+            self._hedge_executor = None
+    
+    def __enter__(self) -> "ADSMedia":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
     
     # ===== Connection =====
     
@@ -107,6 +494,7 @@ class ADSMedia:
         reply_to: Optional[str] = None,
         server_id: Optional[int] = None,
         unsubscribe_url: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Send a single transactional email
@@ -122,10 +510,17 @@ class ADSMedia:
             reply_to: Reply-to email address
             server_id: Specific server ID
             unsubscribe_url: URL for List-Unsubscribe header
+            idempotency_key: Key identifying this send across retries
+                (generated when omitted)
             
         Returns:
             dict with message_id, send_id, status
         """
+        if self.suppression_index is not None:
+            reason = self.suppression_index.reason(to)
+            if reason is not None:
+                raise SuppressedRecipientError(to, reason)
+        
         body = {"to": to, "subject": subject}
         
         if html: body["html"] = html
@@ -137,7 +532,10 @@ class ADSMedia:
         if server_id: body["server_id"] = server_id
         if unsubscribe_url: body["unsubscribe_url"] = unsubscribe_url
         
-        return self._request("POST", "/send", json=body)
+        return self._request(
+            "POST", "/send", json=body,
+            idempotency_key=idempotency_key or new_idempotency_key(),
+        )
     
     def send_batch(
         self,
@@ -148,6 +546,8 @@ class ADSMedia:
         preheader: Optional[str] = None,
         from_name: Optional[str] = None,
         server_id: Optional[int] = None,
+        idempotency_key: Optional[str] = None,
+        validate: bool = False,
     ) -> Dict[str, Any]:
         """
         Send batch marketing emails (up to 1000)
@@ -160,20 +560,19 @@ class ADSMedia:
             preheader: Email preheader
             from_name: Sender display name
             server_id: Specific server ID
+            idempotency_key: Key identifying this batch across retries
+                (generated when omitted)
+            validate: Normalise addresses and drop invalid and duplicate
+                recipients before sending
             
         Returns:
-            dict with task_id, queued count
+            dict with task_id, recipients_count; with a suppression index,
+            "suppressed" maps skipped addresses to their reasons; with
+            validate, "invalid" lists dropped (email, reason) pairs
         """
-        # Convert BatchRecipient to dict if needed
-        recipient_list = []
-        for r in recipients:
-            if isinstance(r, BatchRecipient):
-                recipient_list.append({
-                    "email": r.email,
-                    "name": r.name,
-                })
-            else:
-                recipient_list.append(r)
+        recipient_list, skipped = _prepare_batch(recipients, self.suppression_index, validate)
+        if not recipient_list:
+            return dict({"task_id": None, "recipients_count": 0}, **skipped)
         
         body = {
             "recipients": recipient_list,
@@ -186,7 +585,13 @@ class ADSMedia:
         if from_name: body["from_name"] = from_name
         if server_id: body["server_id"] = server_id
         
-        return self._request("POST", "/send/batch", json=body)
+        result = self._request(
+            "POST", "/send/batch", json=body,
+            idempotency_key=idempotency_key or new_idempotency_key(),
+        )
+        if skipped and isinstance(result, dict):
+            result = dict(result, **skipped)
+        return result
     
     def get_status(
         self,
@@ -267,22 +672,35 @@ class ADSMedia:
             "id": list_id, "limit": limit, "offset": offset
         })
     
-    def add_contacts(self, list_id: int, contacts: List[Union[Dict[str, str], Contact]]) -> Dict[str, Any]:
-        """Add contacts to a list"""
-        contact_list = []
-        for c in contacts:
-            if isinstance(c, Contact):
-                contact_list.append({
-                    "email": c.email,
-                    "firstName": c.first_name,
-                    "lastName": c.last_name,
-                    "custom1": c.custom1,
-                    "custom2": c.custom2,
-                })
-            else:
-                contact_list.append(c)
+    def iter_contacts(self, list_id: int, page_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Yield every contact of a list, streaming each page as it downloads"""
+        offset = 0
+        while True:
+            count = 0
+            for contact in self._stream_items("/lists/contacts", {
+                "id": list_id, "limit": page_size, "offset": offset
+            }):
+                count += 1
+                yield contact
+            if count < page_size:
+                return
+            offset += count
+    
+    def add_contacts(
+        self,
+        list_id: int,
+        contacts: List[Union[Dict[str, str], Contact]],
+        validate: bool = False,
+    ) -> Dict[str, Any]:
+        """Add contacts to a list (validate: normalise and drop invalid/duplicate addresses)"""
+        contact_list, dropped = _prepare_contacts(contacts, validate)
+        if validate and not contact_list:
+            return {"added": 0, "invalid": dropped}
         
-        return self._request("POST", "/lists/contacts/add", params={"id": list_id}, json={"contacts": contact_list})
+        result = self._request("POST", "/lists/contacts/add", params={"id": list_id}, json={"contacts": contact_list})
+        if dropped and isinstance(result, dict):
+            result = dict(result, invalid=dropped)
+        return result
     
     def remove_contacts(self, list_id: int, emails: List[str]) -> Dict[str, Any]:
         """Remove contacts from a list"""
@@ -395,12 +813,61 @@ class ADSMedia:
         if email: params["email"] = email
         return self._request("GET", "/stats/events", params=params)
     
+    def iter_events(
+        self,
+        task_id: int,
+        type: Optional[str] = None,
+        email: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield every event of a task, streaming each page as it downloads"""
+        offset = 0
+        while True:
+            params = {"id": task_id, "limit": page_size, "offset": offset}
+            if type: params["type"] = type
+            if email: params["email"] = email
+            count = 0
+            for event in self._stream_items("/stats/events", params):
+                count += 1
+                yield event
+            if count < page_size:
+                return
+            offset += count
+    
     # ===== Suppression =====
     
     def check_suppression(self, email: str) -> Dict[str, Any]:
-        """Check if email is suppressed"""
+        """Check if email is suppressed (the local suppression index is consulted first)"""
+        if self.suppression_index is not None:
+            reason = self.suppression_index.reason(email)
+            if reason is not None:
+                return {"email": email, "suppressed": True, "reason": reason, "source": "local"}
         return self._request("GET", "/suppressions/check", params={"email": email})
     
+    def check_suppressions(
+        self, emails: List[str], concurrency: int = 8
+    ) -> Dict[str, Union[Dict[str, Any], ADSMediaError]]:
+        """
+        Check many addresses concurrently over the pooled session
+        
+        Duplicates are checked once. Returns email -> check_suppression
+        result, or the ADSMediaError raised for that address.
+        """
+        unique = list(dict.fromkeys(emails))
+        results: Dict[str, Union[Dict[str, Any], ADSMediaError]] = {}
+        if not unique:
+            return results
+        
+        def check(email: str) -> None:
+            try:
+                results[email] = self.check_suppression(email)
+            except ADSMediaError as e:
+                results[email] = e
+        
+        with ThreadPoolExecutor(min(concurrency, len(unique))) as executor:
+            list(executor.map(check, unique))
+        return {email: results[email] for email in unique}
+    
     # ===== Account =====
     
     def get_account(self) -> Dict[str, Any]:
@@ -0,0 +1,266 @@
+"""Upload message content once and reuse the campaign across chunks"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .client import ADSMedia, ADSMediaError
+from .types import BatchRecipient, Contact
+from .validation import validate_recipients
+
+MAX_BATCH_SIZE = 1000
+
+
+def content_hash(
+    subject: str,
+    html: str,
+    text: Optional[str] = None,
+    preheader: Optional[str] = None,
+    type: int = 1,
+) -> str:
+    """SHA-256 of the fields that make up a campaign's content"""
+    canonical = json.dumps([subject, html, text, preheader, type], separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _as_contact(
+    recipient: Union[str, Dict[str, Any], BatchRecipient, Contact]
+) -> Union[Dict[str, Any], Contact]:
+    if isinstance(recipient, str):
+        return {"email": recipient}
+    if isinstance(recipient, BatchRecipient):
+        return Contact(
+            email=recipient.email,
+            first_name=recipient.first_name,
+            last_name=recipient.last_name,
+            custom1=recipient.custom1,
+            custom2=recipient.custom2,
+        )
+    return recipient
+
+
+class CampaignCache:
+    """
+    Content hash -> campaign_id, kept in memory or in SQLite
+
+    With a path the mapping survives restarts, so a re-run of the same job
+    reuses the campaigns it created before.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self._lock = threading.Lock()
+        self._ids: Dict[str, int] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS campaign_content ("
+                "hash TEXT PRIMARY KEY, campaign_id INTEGER NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._ids = dict(self._conn.execute("SELECT hash, campaign_id FROM campaign_content"))
+
+    def get(self, digest: str) -> Optional[int]:
+        with self._lock:
+            return self._ids.get(digest)
+
+    def put(self, digest: str, campaign_id: int) -> None:
+        with self._lock:
+            self._ids[digest] = campaign_id
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO campaign_content (hash, campaign_id, created_at) "
+                    "VALUES (?, ?, ?)",
+                    (digest, campaign_id, time.time()),
+                )
+
+    def discard(self, digest: str) -> None:
+        with self._lock:
+            self._ids.pop(digest, None)
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM campaign_content WHERE hash = ?", (digest,))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._ids)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class ContentCampaigns:
+    """
+    Send one message to many recipients while uploading its content once
+
+    Each distinct subject/html/text/preheader becomes a campaign the first
+    time it is used; later sends and schedules with the same content
+    reference the cached campaign_id instead of sending the body again.
+    send_chunked() uploads recipients to a list in batches, which carry
+    only contact data, and schedules the cached campaign to that list.
+
+    Example:
+        campaigns = ContentCampaigns(client, cache=CampaignCache('campaigns.db'))
+        campaigns.send_chunked(
+            recipients,                  # Any number of recipients
+            subject='Spring Sale',
+            html=html,                   # Uploaded once
+            server_id=1,
+        )
+    """
+
+    def __init__(
+        self,
+        client: ADSMedia,
+        cache: Optional[CampaignCache] = None,
+        name_prefix: str = "SDK",
+    ):
+        self.client = client
+        self.cache = cache if cache is not None else CampaignCache()
+        self.name_prefix = name_prefix
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def _lock_for(self, digest: str) -> threading.Lock:
+        with self._locks_lock:
+            lock = self._locks.get(digest)
+            if lock is None:
+                lock = self._locks[digest] = threading.Lock()
+            return lock
+
+    def campaign_id(
+        self,
+        subject: str,
+        html: str,
+        text: Optional[str] = None,
+        preheader: Optional[str] = None,
+        type: int = 1,
+        name: Optional[str] = None,
+    ) -> int:
+        """The campaign holding this content, created on first use"""
+        digest = content_hash(subject, html, text, preheader, type)
+        campaign_id = self.cache.get(digest)
+        if campaign_id is not None:
+            return campaign_id
+        # Concurrent callers with the same content create one campaign
+        with self._lock_for(digest):
+            campaign_id = self.cache.get(digest)
+            if campaign_id is None:
+                result = self.client.create_campaign(
+                    name=name or f"{self.name_prefix} {digest[:12]}",
+                    subject=subject,
+                    html=html,
+                    text=text,
+                    preheader=preheader,
+                    type=type,
+                )
+                campaign_id = int(result["id"])
+                self.cache.put(digest, campaign_id)
+        return campaign_id
+
+    def schedule(
+        self,
+        list_id: int,
+        server_id: int,
+        subject: str,
+        html: str,
+        text: Optional[str] = None,
+        preheader: Optional[str] = None,
+        sender_name: Optional[str] = None,
+        schedule: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Schedule the content to a list, reusing its campaign
+
+        A cached campaign that was deleted on the server is recreated once;
+        other 404s (e.g. an unknown list_id) are raised as they are.
+        """
+        digest = content_hash(subject, html, text, preheader)
+        for attempt in range(2):
+            campaign_id = self.campaign_id(subject, html, text, preheader)
+            try:
+                return self.client.create_schedule(
+                    campaign_id=campaign_id,
+                    list_id=list_id,
+                    server_id=server_id,
+                    sender_name=sender_name,
+                    schedule=schedule,
+                )
+            except ADSMediaError as e:
+                if attempt or e.status_code != 404 or not self._campaign_missing(campaign_id):
+                    raise
+                self.cache.discard(digest)
+        raise AssertionError("unreachable")
+
+    def _campaign_missing(self, campaign_id: int) -> bool:
+        """Whether the server confirms the campaign no longer exists"""
+        try:
+            self.client.get_campaign(campaign_id)
+        except ADSMediaError as e:
+            return e.status_code == 404
+        return False
+
+    def send_chunked(
+        self,
+        recipients: List[Union[str, Dict[str, Any], BatchRecipient, Contact]],
+        subject: str,
+        html: str,
+        server_id: int,
+        text: Optional[str] = None,
+        preheader: Optional[str] = None,
+        sender_name: Optional[str] = None,
+        schedule: Optional[str] = None,
+        list_name: Optional[str] = None,
+        chunk_size: int = MAX_BATCH_SIZE,
+        validate: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Load recipients into a new list in chunks and schedule the content
+
+        If uploading or scheduling fails the new list is deleted again; if
+        that fails too, the raised error names the list left behind.
+
+        Returns:
+            dict with list_id, campaign_id, schedule (create_schedule
+            result) and added (recipients uploaded); with validate,
+            "invalid" lists dropped (email, reason) pairs
+        """
+        contacts = [_as_contact(r) for r in recipients]
+        invalid: List[Tuple[str, str]] = []
+        if validate:
+            # Over the whole list, so duplicates in different chunks are caught
+            report = validate_recipients(contacts)
+            contacts, invalid = report.valid, report.dropped
+
+        campaign_id = self.campaign_id(subject, html, text, preheader)
+        created = self.client.create_list(list_name or f"{self.name_prefix} {int(time.time())}")
+        list_id = int(created["id"])
+
+        try:
+            chunk_size = min(chunk_size, MAX_BATCH_SIZE)
+            for start in range(0, len(contacts), chunk_size):
+                self.client.add_contacts(list_id, contacts[start:start + chunk_size])
+
+            scheduled = self.schedule(
+                list_id, server_id, subject, html, text, preheader,
+                sender_name=sender_name, schedule=schedule,
+            )
+        except Exception as e:
+            try:
+                self.client.delete_list(list_id)
+            except ADSMediaError:
+                if isinstance(e, ADSMediaError):
+                    raise ADSMediaError(
+                        f"{e.message} (list {list_id} was created but could not be deleted)",
+                        e.status_code,
+                    ) from e
+            raise
+        result = {"list_id": list_id, "campaign_id": campaign_id, "schedule": scheduled, "added": len(contacts)}
+        if validate:
+            result["invalid"] = invalid
+        return result
@@ -0,0 +1,265 @@
+"""Incremental event tailing with persisted checkpoints"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .client import ADSMedia, ADSMediaError
+
+logger = logging.getLogger(__name__)
+
+# (task_id, event type or "" for all types)
+StreamKey = Tuple[int, str]
+
+
+class CheckpointStore:
+    """Base class for per-stream high-water marks (event offsets)"""
+
+    def get(self, key: StreamKey) -> int:
+        raise NotImplementedError
+
+    def set(self, key: StreamKey, offset: int) -> None:
+        raise NotImplementedError
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """Checkpoints kept for the life of the process"""
+
+    def __init__(self) -> None:
+        self._offsets: Dict[StreamKey, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: StreamKey) -> int:
+        with self._lock:
+            return self._offsets.get(key, 0)
+
+    def set(self, key: StreamKey, offset: int) -> None:
+        with self._lock:
+            self._offsets[key] = offset
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    Checkpoints persisted in SQLite, so a restarted tailer resumes where it
+    stopped instead of re-reading every event
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS event_checkpoints ("
+            "task_id INTEGER NOT NULL, type TEXT NOT NULL, offset INTEGER NOT NULL, "
+            "PRIMARY KEY (task_id, type))"
+        )
+
+    def get(self, key: StreamKey) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT offset FROM event_checkpoints WHERE task_id = ? AND type = ?", key
+            ).fetchone()
+        return row[0] if row else 0
+
+    def set(self, key: StreamKey, offset: int) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO event_checkpoints (task_id, type, offset) VALUES (?, ?, ?)",
+                (key[0], key[1], offset),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class _Stream:
+    def __init__(self, key: StreamKey, interval: float):
+        self.key = key
+        self.interval = interval
+        self.next_poll = 0.0
+
+
+class EventTailer:
+    """
+    Tail get_events for many tasks, fetching only events not seen before
+
+    Each (task, type) stream keeps its offset in a CheckpointStore. Streams
+    that returned new events are polled again after min_interval; idle
+    streams back off up to max_interval. Due streams are polled
+    concurrently. Delivery is at-least-once: a checkpoint advances after
+    each page has been handed to the callback. A callback that raises is
+    logged, and its page is handed over again after the stream backs off.
+
+    Example:
+        tailer = EventTailer(
+            client,
+            task_ids=[123, 124],
+            types=['open', 'click', 'bounce'],
+            checkpoints=SQLiteCheckpointStore('events.db'),
+            on_event=lambda task_id, event: warehouse.insert(task_id, event),
+        )
+        tailer.run()
+    """
+
+    def __init__(
+        self,
+        client: ADSMedia,
+        task_ids: Iterable[int] = (),
+        types: Optional[Iterable[str]] = None,
+        checkpoints: Optional[CheckpointStore] = None,
+        on_event: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+        page_size: int = 100,
+        min_interval: float = 5.0,
+        max_interval: float = 300.0,
+        concurrency: int = 8,
+    ):
+        self.client = client
+        self.types = list(types) if types else [""]
+        self.checkpoints = checkpoints if checkpoints is not None else MemoryCheckpointStore()
+        self.on_event = on_event
+        self.page_size = page_size
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.concurrency = concurrency
+        self._streams: Dict[StreamKey, _Stream] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        for task_id in task_ids:
+            self.add_task(task_id)
+
+    def add_task(self, task_id: int) -> None:
+        """Start tailing a task"""
+        with self._lock:
+            for event_type in self.types:
+                key = (task_id, event_type)
+                if key not in self._streams:
+                    self._streams[key] = _Stream(key, self.min_interval)
+
+    def remove_task(self, task_id: int) -> None:
+        """Stop tailing a task (its checkpoints are kept)"""
+        with self._lock:
+            for key in [k for k in self._streams if k[0] == task_id]:
+                del self._streams[key]
+
+    # ===== Polling =====
+
+    def _poll_stream(self, stream: _Stream) -> Tuple[List[Dict[str, Any]], int]:
+        """Fetch pages until caught up; returns collected events and end offset"""
+        task_id, event_type = stream.key
+        start = offset = self.checkpoints.get(stream.key)
+        collected: List[Dict[str, Any]] = []
+        while True:
+            page = self.client.get_events(
+                task_id,
+                type=event_type or None,
+                limit=self.page_size,
+                offset=offset,
+            ) or []
+            offset += len(page)
+            if event_type:
+                for event in page:
+                    event.setdefault("type", event_type)
+            if self.on_event is not None:
+                for event in page:
+                    self.on_event(task_id, event)
+                if page:
+                    self.checkpoints.set(stream.key, offset)
+            else:
+                collected.extend(page)
+            if len(page) < self.page_size:
+                break
+
+        if offset > start:
+            stream.interval = self.min_interval
+        else:
+            stream.interval = min(stream.interval * 2, self.max_interval)
+        return collected, offset
+
+    def _poll(self) -> Tuple[List[Tuple[int, Dict[str, Any]]], Dict[StreamKey, int]]:
+        now = time.monotonic()
+        with self._lock:
+            due = [s for s in self._streams.values() if s.next_poll <= now]
+        results: List[Tuple[int, Dict[str, Any]]] = []
+        offsets: Dict[StreamKey, int] = {}
+        if not due:
+            return results, offsets
+
+        with ThreadPoolExecutor(min(self.concurrency, len(due))) as executor:
+            futures = [(stream, executor.submit(self._poll_stream, stream)) for stream in due]
+            for stream, future in futures:
+                try:
+                    events, offsets[stream.key] = future.result()
+                except Exception as e:
+                    if not isinstance(e, ADSMediaError):
+                        # Most likely on_event raised; report it but keep run() going
+                        logger.exception("Polling events for %s failed", stream.key)
+                    # Keep the checkpoint; try again after backing off
+                    stream.interval = min(stream.interval * 2, self.max_interval)
+                    events = []
+                stream.next_poll = time.monotonic() + stream.interval
+                results.extend((stream.key[0], event) for event in events)
+        return results, offsets
+
+    def _commit(self, offsets: Dict[StreamKey, int]) -> None:
+        for key, offset in offsets.items():
+            self.checkpoints.set(key, offset)
+
+    def poll_once(self) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Poll every stream that is due
+
+        Returns:
+            new (task_id, event) pairs when no on_event callback is set;
+            their checkpoints are advanced before returning
+        """
+        results, offsets = self._poll()
+        if self.on_event is None:
+            self._commit(offsets)
+        return results
+
+    def _seconds_until_due(self) -> float:
+        with self._lock:
+            if not self._streams:
+                return self.min_interval
+            upcoming = min(s.next_poll for s in self._streams.values())
+        return max(0.0, upcoming - time.monotonic())
+
+    def run(self) -> None:
+        """Poll until stop() is called (requires on_event)"""
+        if self.on_event is None:
+            raise ValueError("run() requires an on_event callback; use events() otherwise")
+        self._stop.clear()
+        while not self._stop.is_set():
+            self.poll_once()
+            self._stop.wait(self._seconds_until_due())
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    async def events(self) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Yield (task_id, event) pairs as they arrive
+
+        Checkpoints advance once every event of a poll has been consumed,
+        so events are redelivered if the consumer stops part-way.
+
+        Example:
+            async for task_id, event in tailer.events():
+                await sink.write(task_id, event)
+        """
+        if self.on_event is not None:
+            raise ValueError("events() cannot be used together with on_event")
+        loop = asyncio.get_running_loop()
+        self._stop.clear()
+        while not self._stop.is_set():
+            results, offsets = await loop.run_in_executor(None, self._poll)
+            for item in results:
+                yield item
+            self._commit(offsets)
+            await asyncio.sleep(self._seconds_until_due())
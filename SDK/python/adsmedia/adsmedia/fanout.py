@@ -0,0 +1,268 @@
+"""Creating, tracking and controlling many sending tasks at once"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .client import ADSMedia, ADSMediaError
+
+# Schedule states reported by get_schedules
+ACTIVE_STATES = frozenset({"queue", "prep", "sending"})
+# "unknown": created, but the response carried no id to track it by
+FINAL_STATES = frozenset({"done", "stopped", "failed", "unknown"})
+
+
+@dataclass
+class FanoutTarget:
+    """One list to send the campaign to, and the server to send it from"""
+    list_id: int
+    server_id: int
+    sender_name: Optional[str] = None
+    schedule: Optional[str] = None  # YYYY-MM-DD HH:MM:SS
+
+
+@dataclass
+class FanoutTask:
+    """A schedule created by the fan-out and its observed state"""
+    target: FanoutTarget
+    schedule_id: Optional[int] = None
+    status: str = "pending"
+    error: Optional[ADSMediaError] = None
+    history: List[Tuple[str, float]] = field(default_factory=list)  # (status, time)
+
+
+class _RateLimiter:
+    """Spaces calls at least 1/rate seconds apart across threads"""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class CampaignFanout:
+    """
+    Launch one campaign to many (list, server) pairs and manage the tasks
+
+    Schedules are created concurrently, no faster than rate_limit calls
+    per second. A single get_schedules call per poll updates every task,
+    and pause/resume/stop act on the whole fan-out.
+
+    Example:
+        fanout = CampaignFanout(client, campaign_id=5, rate_limit=5)
+        fanout.launch([
+            FanoutTarget(list_id=10, server_id=1),
+            FanoutTarget(list_id=11, server_id=2),
+        ])
+        fanout.wait(timeout=3600)
+        print(fanout.summary())  # {'done': 2}
+    """
+
+    def __init__(
+        self,
+        client: ADSMedia,
+        campaign_id: Optional[int] = None,
+        rate_limit: float = 5.0,
+        concurrency: int = 8,
+        poll_interval: float = 15.0,
+        on_change: Optional[Callable[[FanoutTask, str, str], None]] = None,
+    ):
+        self.client = client
+        self.campaign_id = campaign_id
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.on_change = on_change
+        self.tasks: List[FanoutTask] = []
+        self._limiter = _RateLimiter(rate_limit)
+        self._lock = threading.Lock()
+
+    def create_campaign(self, **kwargs: Any) -> int:
+        """Create the campaign to fan out (ADSMedia.create_campaign arguments)"""
+        result = self.client.create_campaign(**kwargs)
+        self.campaign_id = int(result["id"])
+        return self.campaign_id
+
+    def _set_status(self, task: FanoutTask, status: str) -> None:
+        with self._lock:
+            old = task.status
+            if old == status:
+                return
+            task.status = status
+            task.history.append((status, time.time()))
+        if self.on_change is not None:
+            self.on_change(task, old, status)
+
+    def _call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        self._limiter.wait()
+        return func(*args, **kwargs)
+
+    # ===== Launch =====
+
+    def _create(self, task: FanoutTask) -> None:
+        target = task.target
+        try:
+            result = self._call(
+                self.client.create_schedule,
+                campaign_id=self.campaign_id,
+                list_id=target.list_id,
+                server_id=target.server_id,
+                sender_name=target.sender_name,
+                schedule=target.schedule,
+            )
+        except ADSMediaError as e:
+            task.error = e
+            self._set_status(task, "failed")
+            return
+        result = result if isinstance(result, dict) else {}
+        schedule_id = result.get("id") or result.get("task_id")
+        if schedule_id is None:
+            task.error = ADSMediaError(
+                f"create_schedule returned no schedule id for list {target.list_id}; "
+                "the schedule may be sending but cannot be tracked or controlled"
+            )
+            self._set_status(task, "unknown")
+            return
+        task.schedule_id = int(schedule_id)
+        self._set_status(task, result.get("status") or "queue")
+
+    def launch(self, targets: Iterable[Union[FanoutTarget, Tuple[int, int]]]) -> List[FanoutTask]:
+        """
+        Create a schedule for every target concurrently
+
+        Args:
+            targets: FanoutTarget objects or (list_id, server_id) pairs
+
+        Returns:
+            the new tasks; a task whose creation failed has status "failed"
+            and the error in .error. A task created without a schedule id in
+            the response has status "unknown" and is not tracked
+        """
+        if self.campaign_id is None:
+            raise ValueError("Set campaign_id or call create_campaign() first")
+        tasks = [
+            FanoutTask(target=t if isinstance(t, FanoutTarget) else FanoutTarget(*t))
+            for t in targets
+        ]
+        with self._lock:
+            self.tasks.extend(tasks)
+        if tasks:
+            with ThreadPoolExecutor(min(self.concurrency, len(tasks))) as executor:
+                list(executor.map(self._create, tasks))
+        return tasks
+
+    # ===== Tracking =====
+
+    def _by_schedule(self) -> Dict[int, FanoutTask]:
+        with self._lock:
+            return {t.schedule_id: t for t in self.tasks if t.schedule_id is not None}
+
+    def poll(self) -> List[Tuple[FanoutTask, str, str]]:
+        """
+        Refresh every task with one get_schedules call
+
+        Returns:
+            (task, old_status, new_status) for each task that changed
+        """
+        tracked = {
+            schedule_id: task for schedule_id, task in self._by_schedule().items()
+            if task.status not in FINAL_STATES
+        }
+        if not tracked:
+            return []
+        schedules = self._call(self.client.get_schedules) or []
+        seen: Set[int] = set()
+        changes = []
+        for schedule in schedules:
+            schedule_id = schedule.get("id")
+            task = tracked.get(int(schedule_id)) if schedule_id is not None else None
+            if task is None:
+                continue
+            seen.add(task.schedule_id)
+            old, new = task.status, schedule.get("status") or task.status
+            if new != old:
+                self._set_status(task, new)
+                changes.append((task, old, new))
+        for schedule_id, task in tracked.items():
+            # Stopped schedules are deleted and drop out of the listing
+            if schedule_id not in seen and task.status != "done":
+                old = task.status
+                self._set_status(task, "stopped")
+                changes.append((task, old, "stopped"))
+        return changes
+
+    def summary(self) -> Dict[str, int]:
+        """Number of tasks per status"""
+        counts: Dict[str, int] = {}
+        with self._lock:
+            for task in self.tasks:
+                counts[task.status] = counts.get(task.status, 0) + 1
+        return counts
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Poll until every task is done, stopped, failed or unknown
+
+        Returns:
+            True if all tasks finished, False on timeout
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            self.poll()
+            with self._lock:
+                if all(t.status in FINAL_STATES for t in self.tasks):
+                    return True
+            delay = self.poll_interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                delay = min(delay, remaining)
+            time.sleep(delay)
+
+    # ===== Bulk control =====
+
+    def _bulk(
+        self, action: Callable[[int], Any], states: Iterable[str], status: str
+    ) -> Dict[int, Any]:
+        states = frozenset(states)
+        with self._lock:
+            tasks = [t for t in self.tasks if t.schedule_id is not None and t.status in states]
+        results: Dict[int, Any] = {}
+        if not tasks:
+            return results
+
+        def run(task: FanoutTask) -> None:
+            try:
+                results[task.schedule_id] = self._call(action, task.schedule_id)
+            except ADSMediaError as e:
+                results[task.schedule_id] = e
+                return
+            self._set_status(task, status)
+
+        with ThreadPoolExecutor(min(self.concurrency, len(tasks))) as executor:
+            list(executor.map(run, tasks))
+        return results
+
+    def pause_all(self) -> Dict[int, Any]:
+        """Pause every active task; returns schedule_id -> result or ADSMediaError"""
+        return self._bulk(self.client.pause_schedule, ACTIVE_STATES, "paused")
+
+    def resume_all(self) -> Dict[int, Any]:
+        """Resume every paused task; returns schedule_id -> result or ADSMediaError"""
+        return self._bulk(self.client.resume_schedule, {"paused"}, "queue")
+
+    def stop_all(self) -> Dict[int, Any]:
+        """Stop every unfinished task; returns schedule_id -> result or ADSMediaError"""
+        return self._bulk(self.client.stop_schedule, ACTIVE_STATES | {"paused"}, "stopped")
@@ -0,0 +1,130 @@
+"""Idempotency key stores for deduplicated sending"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+def new_idempotency_key() -> str:
+    """Generate a fresh client-side idempotency key"""
+    return uuid.uuid4().hex
+
+
+class IdempotencyStore:
+    """
+    Base class for idempotency stores
+
+    A store remembers the result of every request completed under an
+    idempotency key, so repeating the request returns the recorded result
+    instead of sending the email again.
+    """
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the recorded result for key, or None"""
+        raise NotImplementedError
+
+    def put(self, key: str, result: Any) -> None:
+        """Record the result for key"""
+        raise NotImplementedError
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """
+    Bounded in-memory LRU store
+
+    Example:
+        store = MemoryIdempotencyStore(max_size=50000)
+        client = ADSMedia(api_key='your-api-key', idempotency_store=store)
+    """
+
+    def __init__(self, max_size: int = 10000):
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: str, result: Any) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteIdempotencyStore(IdempotencyStore):
+    """
+    Bounded SQLite-backed store that survives process restarts
+
+    Results are stored as JSON. When the table grows past max_size the
+    oldest entries are evicted.
+
+    Example:
+        store = SQLiteIdempotencyStore('/var/lib/myapp/adsmedia-keys.db')
+        client = ADSMedia(api_key='your-api-key', idempotency_store=store)
+    """
+
+    def __init__(self, path: str = ":memory:", max_size: int = 1000000):
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS idempotency ("
+            "key TEXT PRIMARY KEY, result TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idempotency_created_at ON idempotency (created_at)"
+        )
+        self._count = self._conn.execute("SELECT COUNT(*) FROM idempotency").fetchone()[0]
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM idempotency WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, result: Any) -> None:
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO idempotency (key, result, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(result), time.time()),
+            )
+            self._count += cursor.rowcount
+            if self._count > self.max_size:
+                excess = self._count - self.max_size
+                self._conn.execute(
+                    "DELETE FROM idempotency WHERE key IN ("
+                    "SELECT key FROM idempotency ORDER BY created_at LIMIT ?)",
+                    (excess,),
+                )
+                self._count = self.max_size
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        return self._count
@@ -0,0 +1,334 @@
+"""Fingerprint-based list sync and parallel list merging"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .client import ADSMedia
+from .types import Contact
+from .validation import normalise_address
+
+MAX_BATCH_SIZE = 1000
+
+_MASK = (1 << 64) - 1
+
+
+def email_fingerprint(email: str) -> int:
+    """64-bit hash of an already normalised address"""
+    return int.from_bytes(hashlib.blake2b(email.encode(), digest_size=8).digest(), "big")
+
+
+def _contact_dict(contact: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(contact, str):
+        return {"email": contact}
+    if isinstance(contact, Contact):
+        return {
+            "email": contact.email,
+            "firstName": contact.first_name,
+            "lastName": contact.last_name,
+            "custom1": contact.custom1,
+            "custom2": contact.custom2,
+        }
+    if isinstance(contact, dict):
+        return contact
+    return None
+
+
+@dataclass
+class SyncPlan:
+    """Changes needed to make a remote list match a local source"""
+    list_id: int
+    add: List[Dict[str, Any]] = field(default_factory=list)
+    remove: List[str] = field(default_factory=list)
+    remote_count: int = 0
+    local_count: int = 0
+    invalid: List[str] = field(default_factory=list)  # Local addresses that failed validation
+    digest: str = ""  # Identifies the local source the plan was made for
+
+
+class _Journal:
+    """SQLite record of planned batches, so an interrupted sync can resume"""
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS list_sync_batches ("
+            "list_id INTEGER NOT NULL, seq INTEGER NOT NULL, digest TEXT NOT NULL, "
+            "op TEXT NOT NULL, payload TEXT NOT NULL, done INTEGER NOT NULL DEFAULT 0, "
+            "PRIMARY KEY (list_id, seq))"
+        )
+
+    def pending(self, list_id: int, digest: str) -> List[Tuple[int, str, List[Any]]]:
+        """Unfinished batches of a plan made for digest; stale plans are dropped"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, digest, op, payload FROM list_sync_batches "
+                "WHERE list_id = ? AND done = 0 ORDER BY seq",
+                (list_id,),
+            ).fetchall()
+            if any(row[1] != digest for row in rows):
+                self._conn.execute("DELETE FROM list_sync_batches WHERE list_id = ?", (list_id,))
+                return []
+        return [(seq, op, json.loads(payload)) for seq, _, op, payload in rows]
+
+    def save(self, list_id: int, digest: str, batches: List[Tuple[str, List[Any]]]) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("DELETE FROM list_sync_batches WHERE list_id = ?", (list_id,))
+                self._conn.executemany(
+                    "INSERT INTO list_sync_batches (list_id, seq, digest, op, payload) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (list_id, seq, digest, op, json.dumps(payload))
+                        for seq, (op, payload) in enumerate(batches)
+                    ],
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def mark_done(self, list_id: int, seq: int) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE list_sync_batches SET done = 1 WHERE list_id = ? AND seq = ?",
+                (list_id, seq),
+            )
+
+    def clear(self, list_id: int) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM list_sync_batches WHERE list_id = ?", (list_id,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ListSync:
+    """
+    Make a remote list match a local audience with the fewest API calls
+
+    The remote list is paged with get_contacts concurrently and reduced to
+    a set of 64-bit address hashes; only addresses missing on either side
+    are kept in full. The resulting adds and removals are applied with
+    batched add_contacts/remove_contacts. With a journal path the planned
+    batches are persisted and an interrupted sync resumes with the
+    batches not applied yet, as long as the local set of addresses is unchanged.
+
+    Example:
+        sync = ListSync(client, list_id=42, journal='list-sync.db')
+        plan = sync.sync(crm.subscribers())  # Emails, dicts or Contacts
+        print(len(plan.add), len(plan.remove))
+    """
+
+    def __init__(
+        self,
+        client: ADSMedia,
+        list_id: int,
+        page_size: int = 500,
+        concurrency: int = 8,
+        batch_size: int = MAX_BATCH_SIZE,
+        journal: Optional[str] = None,
+    ):
+        self.client = client
+        self.list_id = list_id
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.batch_size = min(batch_size, MAX_BATCH_SIZE)
+        self._journal = _Journal(journal) if journal else None
+
+    # ===== Fingerprints =====
+
+    def _local_index(
+        self, source: Iterable[Any]
+    ) -> Tuple[Dict[int, Dict[str, Any]], List[str], str]:
+        """hash -> contact for the local source, invalid addresses, source digest"""
+        index: Dict[int, Dict[str, Any]] = {}
+        invalid: List[str] = []
+        for item in source:
+            contact = _contact_dict(item)
+            email = contact.get("email") if contact else None
+            address = normalise_address(email) if email else None
+            if address is None:
+                invalid.append(email or "")
+                continue
+            key = email_fingerprint(address)
+            if key not in index:
+                index[key] = dict(contact, email=address) if address != email else contact
+        # Order-independent digest of the address set
+        total = 0
+        for key in index:
+            total = (total + key) & _MASK
+        return index, invalid, f"{len(index)}:{total:016x}"
+
+    def _fetch_pages(self, on_page: Callable[[List[Dict[str, Any]]], None]) -> None:
+        """Page through the remote list, concurrency pages at a time"""
+        offset = 0
+        with ThreadPoolExecutor(self.concurrency) as executor:
+            while True:
+                offsets = [offset + i * self.page_size for i in range(self.concurrency)]
+                pages = executor.map(
+                    lambda o: self.client.get_contacts(self.list_id, limit=self.page_size, offset=o) or [],
+                    offsets,
+                )
+                finished = False
+                for page in pages:
+                    on_page(page)
+                    if len(page) < self.page_size:
+                        finished = True
+                if finished:
+                    return
+                offset = offsets[-1] + self.page_size
+
+    def remote_fingerprint(self, on_new: Optional[Callable[[int, str], None]] = None) -> Set[int]:
+        """
+        Hashes of every address on the remote list
+
+        on_new(hash, email) is called once per distinct address, with the
+        email as stored remotely.
+        """
+        fingerprint: Set[int] = set()
+
+        def on_page(page: List[Dict[str, Any]]) -> None:
+            for contact in page:
+                email = contact.get("email") or ""
+                address = normalise_address(email)
+                if not address:
+                    continue
+                key = email_fingerprint(address)
+                if key in fingerprint:
+                    continue
+                fingerprint.add(key)
+                if on_new is not None:
+                    on_new(key, email)
+
+        self._fetch_pages(on_page)
+        return fingerprint
+
+    # ===== Diff and apply =====
+
+    def plan(self, source: Iterable[Any], remove: bool = True) -> SyncPlan:
+        """Diff the local source against the remote list without changing it"""
+        return self._plan(*self._local_index(source), remove=remove)
+
+    def _plan(
+        self, local: Dict[int, Dict[str, Any]], invalid: List[str], digest: str, remove: bool
+    ) -> SyncPlan:
+        removals: List[str] = []
+
+        def on_new(key: int, email: str) -> None:
+            if remove and key not in local:
+                removals.append(email)
+
+        remote = self.remote_fingerprint(on_new)
+        return SyncPlan(
+            list_id=self.list_id,
+            add=[contact for key, contact in local.items() if key not in remote],
+            remove=removals,
+            remote_count=len(remote),
+            local_count=len(local),
+            invalid=invalid,
+            digest=digest,
+        )
+
+    def _batches(self, plan: SyncPlan) -> List[Tuple[str, List[Any]]]:
+        size = self.batch_size
+        batches: List[Tuple[str, List[Any]]] = [
+            ("remove", plan.remove[i:i + size]) for i in range(0, len(plan.remove), size)
+        ]
+        batches.extend(("add", plan.add[i:i + size]) for i in range(0, len(plan.add), size))
+        return batches
+
+    def _apply_batch(self, op: str, payload: List[Any]) -> None:
+        if op == "add":
+            self.client.add_contacts(self.list_id, payload)
+        else:
+            self.client.remove_contacts(self.list_id, payload)
+
+    def apply(self, plan: SyncPlan) -> None:
+        """Apply a plan's removals and additions in batches"""
+        batches = self._batches(plan)
+        if self._journal is None:
+            for op, payload in batches:
+                self._apply_batch(op, payload)
+            return
+        self._journal.save(self.list_id, plan.digest, batches)
+        self._run_journal(list(enumerate(batches)))
+
+    def _run_journal(self, batches: List[Tuple[int, Tuple[str, List[Any]]]]) -> None:
+        assert self._journal is not None
+        for seq, (op, payload) in batches:
+            self._apply_batch(op, payload)
+            self._journal.mark_done(self.list_id, seq)
+        self._journal.clear(self.list_id)
+
+    def sync(self, source: Iterable[Any], remove: bool = True) -> SyncPlan:
+        """
+        Make the remote list match source (resuming an interrupted sync)
+
+        Args:
+            source: Addresses, contact dicts or Contacts
+            remove: Also remove remote contacts missing from source
+
+        Returns:
+            the SyncPlan that was applied
+        """
+        local, invalid, digest = self._local_index(source)
+        if self._journal is not None:
+            pending = self._journal.pending(self.list_id, digest)
+            if pending:
+                self._run_journal([(seq, (op, payload)) for seq, op, payload in pending])
+                plan = SyncPlan(list_id=self.list_id, local_count=len(local), invalid=invalid, digest=digest)
+                for _, op, payload in pending:
+                    (plan.add if op == "add" else plan.remove).extend(payload)
+                return plan
+        plan = self._plan(local, invalid, digest, remove)
+        self.apply(plan)
+        return plan
+
+    def close(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+
+
+def merge_lists(
+    client: ADSMedia,
+    source_ids: Iterable[int],
+    target_id: int,
+    page_size: int = 500,
+    concurrency: int = 8,
+) -> SyncPlan:
+    """
+    Add every contact of the source lists to the target list
+
+    Source lists are read in parallel; only contacts not already on the
+    target are sent, in batches. Nothing is removed from the target.
+
+    Example:
+        merge_lists(client, source_ids=[11, 12, 13], target_id=20)
+    """
+    source_ids = list(source_ids)
+    contacts: List[Dict[str, Any]] = []
+    lock = threading.Lock()
+
+    def read(list_id: int) -> None:
+        reader = ListSync(client, list_id, page_size=page_size, concurrency=concurrency)
+
+        def on_page(page: List[Dict[str, Any]]) -> None:
+            with lock:
+                contacts.extend(page)
+
+        reader._fetch_pages(on_page)
+
+    if source_ids:
+        with ThreadPoolExecutor(len(source_ids)) as executor:
+            list(executor.map(read, source_ids))
+    sync = ListSync(client, target_id, page_size=page_size, concurrency=concurrency)
+    return sync.sync(contacts, remove=False)
@@ -0,0 +1,230 @@
+"""Client pool for spreading sends across accounts and servers"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .client import ADSMedia, ADSMediaError, CircuitOpenError, _is_unprocessed
+from .idempotency import new_idempotency_key
+
+
+class PoolMember:
+    """
+    One sending route in a ClientPool: a client and optionally a server ID
+
+    Example:
+        PoolMember(ADSMedia(api_key='key-a'), server_id=1, weight=3)
+    """
+
+    def __init__(
+        self,
+        client: ADSMedia,
+        server_id: Optional[int] = None,
+        weight: int = 1,
+        name: Optional[str] = None,
+    ):
+        if weight < 1:
+            raise ValueError("weight must be positive")
+        self.client = client
+        self.server_id = server_id
+        self.weight = weight
+        self.name = name or (f"server-{server_id}" if server_id else f"client-{id(client):x}")
+
+        # Quota as last reported by get_servers; None until refreshed
+        self.daily_limit: Optional[int] = None
+        self.sent_today: Optional[int] = None
+
+        self.sent = 0  # Emails accepted through this member
+        self.requests = 0
+        self.failures = 0
+        self.busy_seconds = 0.0
+        self.in_flight = 0
+        self._sent_since_refresh = 0
+        self._current_weight = 0
+        self._started = time.monotonic()
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """Emails left today, counting local sends since the last refresh"""
+        if self.daily_limit is None:
+            return None
+        return max(0, self.daily_limit - (self.sent_today or 0) - self._sent_since_refresh)
+
+    def stats(self) -> Dict[str, Any]:
+        """Throughput and quota figures for this member"""
+        elapsed = time.monotonic() - self._started
+        return {
+            "name": self.name,
+            "server_id": self.server_id,
+            "sent": self.sent,
+            "requests": self.requests,
+            "failures": self.failures,
+            "in_flight": self.in_flight,
+            "emails_per_second": self.sent / elapsed if elapsed else 0.0,
+            "avg_latency": self.busy_seconds / self.requests if self.requests else 0.0,
+            "daily_limit": self.daily_limit,
+            "remaining": self.remaining,
+        }
+
+
+class ClientPool:
+    """
+    Route sends across several ADSMedia accounts and/or servers
+
+    Strategies:
+        round_robin   - smooth weighted round-robin using member weights
+        least_loaded  - member with the largest share of its daily quota left
+                        (call refresh_quotas() to load quotas)
+
+    A send is retried on the next member only when it certainly had no
+    effect: the connection could not be opened, the API answered 429 or
+    503, or the member's circuit is open. Timeouts, other 5xx responses
+    and dropped connections are raised, since the first member may already
+    have delivered the email (set the client's retry_writes to resend there
+    under the same idempotency key); so are other API errors.
+
+    Example:
+        pool = ClientPool([
+            PoolMember(ADSMedia(api_key='key-a'), server_id=1, weight=2),
+            PoolMember(ADSMedia(api_key='key-b'), server_id=7),
+        ], strategy='least_loaded')
+        pool.refresh_quotas()
+        pool.send(to='user@example.com', subject='Hello', html='<p>Hi</p>')
+    """
+
+    STRATEGIES = ("round_robin", "least_loaded")
+
+    def __init__(
+        self,
+        members: List[Union[ADSMedia, PoolMember]],
+        strategy: str = "round_robin",
+    ):
+        if not members:
+            raise ValueError("At least one pool member is required")
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown strategy: {strategy}")
+        self.members = [m if isinstance(m, PoolMember) else PoolMember(m) for m in members]
+        self.strategy = strategy
+        self._lock = threading.Lock()
+
+    # ===== Routing =====
+
+    def _candidates(self, count: int) -> List[PoolMember]:
+        """Members in the order they should be tried for a send of count emails"""
+        with self._lock:
+            usable = [m for m in self.members if m.remaining is None or m.remaining >= count]
+            if not usable:
+                raise ADSMediaError("All pool members are over their daily limit", 429)
+            if self.strategy == "least_loaded":
+                first = max(usable, key=self._free_share)
+            else:
+                first = self._next_weighted(usable)
+        return [first] + sorted(
+            (m for m in usable if m is not first), key=self._free_share, reverse=True
+        )
+
+    def _next_weighted(self, usable: List[PoolMember]) -> PoolMember:
+        # Smooth weighted round-robin: spreads heavy members out instead of
+        # sending them runs of consecutive requests
+        total = 0
+        best = usable[0]
+        for member in usable:
+            member._current_weight += member.weight
+            total += member.weight
+            if member._current_weight > best._current_weight:
+                best = member
+        best._current_weight -= total
+        return best
+
+    @staticmethod
+    def _free_share(member: PoolMember) -> float:
+        if member.daily_limit is None:
+            return 1.0 / (1 + member.in_flight)
+        if member.daily_limit <= 0:
+            return 0.0
+        return member.remaining / member.daily_limit / (1 + member.in_flight)
+
+    def _dispatch(self, count: int, call: Callable[[PoolMember], Dict[str, Any]]) -> Dict[str, Any]:
+        error: Optional[ADSMediaError] = None
+        for member in self._candidates(count):
+            with self._lock:
+                member.in_flight += 1
+            started = time.monotonic()
+            try:
+                result = call(member)
+            except ADSMediaError as e:
+                with self._lock:
+                    member.requests += 1
+                    member.failures += 1
+                # Another account would not share the first one's idempotency key
+                if not (isinstance(e, CircuitOpenError) or _is_unprocessed(e)):
+                    raise
+                error = e
+                continue
+            finally:
+                with self._lock:
+                    member.in_flight -= 1
+                    member.busy_seconds += time.monotonic() - started
+            with self._lock:
+                member.requests += 1
+                member.sent += count
+                member._sent_since_refresh += count
+            return result
+        raise error
+
+    # ===== Sending =====
+
+    def send(self, **kwargs: Any) -> Dict[str, Any]:
+        """Send a single email through the pool (same arguments as ADSMedia.send)"""
+        kwargs.setdefault("idempotency_key", new_idempotency_key())
+
+        def call(member: PoolMember) -> Dict[str, Any]:
+            options = dict(kwargs)
+            if member.server_id and not options.get("server_id"):
+                options["server_id"] = member.server_id
+            return member.client.send(**options)
+
+        return self._dispatch(1, call)
+
+    def send_batch(self, recipients: List[Any], **kwargs: Any) -> Dict[str, Any]:
+        """Send a batch through the pool (same arguments as ADSMedia.send_batch)"""
+        kwargs.setdefault("idempotency_key", new_idempotency_key())
+
+        def call(member: PoolMember) -> Dict[str, Any]:
+            options = dict(kwargs)
+            if member.server_id and not options.get("server_id"):
+                options["server_id"] = member.server_id
+            return member.client.send_batch(recipients, **options)
+
+        return self._dispatch(len(recipients), call)
+
+    # ===== Quotas and stats =====
+
+    def refresh_quotas(self) -> None:
+        """
+        Load daily_limit / sent_today from get_servers for every member
+
+        Members without a server_id get the totals of all their account's
+        active servers.
+        """
+        servers_by_client: Dict[int, List[Dict[str, Any]]] = {}
+        for member in self.members:
+            key = id(member.client)
+            if key not in servers_by_client:
+                servers_by_client[key] = member.client.get_servers() or []
+            servers = servers_by_client[key]
+
+            if member.server_id:
+                matching = [s for s in servers if s.get("id") == member.server_id]
+            else:
+                matching = [s for s in servers if s.get("status", "active") == "active"]
+            with self._lock:
+                if matching:
+                    member.daily_limit = sum(int(s.get("daily_limit") or 0) for s in matching)
+                    member.sent_today = sum(int(s.get("sent_today") or 0) for s in matching)
+                member._sent_since_refresh = 0
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-member throughput, failures and remaining quota"""
+        with self._lock:
+            return [member.stats() for member in self.members]
@@ -0,0 +1,124 @@
+"""Circuit breaking and latency tracking for tail-latency control"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Optional
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """
+    Circuit breaker settings, applied to each API endpoint separately
+
+    A call counts as failed when it raises a transient error (timeout,
+    connection error, 429 or 5xx) or, if slow_call_threshold is set, when it
+    takes longer than that many seconds.
+    """
+    failure_threshold: int = 5  # Failed calls within the window that open the circuit
+    window_size: int = 20  # Number of recent calls considered
+    slow_call_threshold: Optional[float] = None  # Seconds
+    reset_timeout: float = 30.0  # Seconds before an open circuit lets a probe through
+    half_open_max_calls: int = 1  # Concurrent probes while half-open
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker
+
+    Example:
+        breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=3))
+        if breaker.allow():
+            try:
+                ...
+                breaker.record_success(elapsed)
+            except Exception:
+                breaker.record_failure()
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, config: Optional[CircuitBreakerConfig] = None):
+        self.config = config or CircuitBreakerConfig()
+        self.state = self.CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=self.config.window_size)
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may proceed now"""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.config.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probes = 0
+            if self.state == self.HALF_OPEN:
+                if self._probes >= self.config.half_open_max_calls:
+                    return False
+                self._probes += 1
+            return True
+
+    def record_success(self, elapsed: float = 0.0) -> None:
+        """Record a completed call and how long it took"""
+        threshold = self.config.slow_call_threshold
+        if threshold is not None and elapsed > threshold:
+            self.record_failure()
+            return
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._close()
+            else:
+                self._push(False)
+
+    def record_failure(self) -> None:
+        """Record a failed (or too slow) call"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._open()
+                return
+            self._push(True)
+            if self._failures >= self.config.failure_threshold:
+                self._open()
+
+    def _push(self, failed: bool) -> None:
+        if len(self._outcomes) == self._outcomes.maxlen and self._outcomes[0]:
+            self._failures -= 1
+        self._outcomes.append(failed)
+        if failed:
+            self._failures += 1
+
+    def _open(self) -> None:
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+
+    def _close(self) -> None:
+        self.state = self.CLOSED
+        self._outcomes.clear()
+        self._failures = 0
+
+
+class LatencyTracker:
+    """Rolling latency samples for one endpoint"""
+
+    def __init__(self, size: int = 200):
+        self._samples: Deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, elapsed: float) -> None:
+        with self._lock:
+            self._samples.append(elapsed)
+
+    def percentile(self, pct: float, min_samples: int = 1) -> Optional[float]:
+        """Latency at the given percentile (0-100), or None with too few samples"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples or len(samples) < min_samples:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * pct / 100))
+        return samples[index]
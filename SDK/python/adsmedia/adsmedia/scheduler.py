@@ -0,0 +1,238 @@
+"""Quota-aware pacing of batch sends and schedules across servers"""
+
+import math
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .client import ADSMedia, ADSMediaError
+
+MAX_BATCH_SIZE = 1000
+
+
+class ServerQuota:
+    """Daily quota of one server, with local sends counted between refreshes"""
+
+    def __init__(self, server_id: int, daily_limit: int, sent_today: int):
+        self.server_id = server_id
+        self.daily_limit = daily_limit
+        self.sent_today = sent_today
+        self.local_sent = 0
+        self.hour: Optional[int] = None
+        self.hour_budget = 0
+        self.hour_sent = 0
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.daily_limit - self.sent_today - self.local_sent)
+
+    @property
+    def hour_available(self) -> int:
+        return max(0, min(self.hour_budget - self.hour_sent, self.remaining))
+
+
+class QuotaScheduler:
+    """
+    Pace sends so every server stays under its daily limit
+
+    Quotas come from get_servers and are refreshed every refresh_interval
+    seconds; sends made through the scheduler are counted locally in
+    between. Each server's remaining quota is spread evenly over the hours
+    left in the day (UTC), so volume neither hits the limit early nor
+    leaves capacity idle at the end of the day.
+
+    Example:
+        scheduler = QuotaScheduler(client)
+        results = scheduler.send_batch(recipients, subject='News', html='<p>...</p>')
+    """
+
+    def __init__(
+        self,
+        client: ADSMedia,
+        refresh_interval: float = 300.0,
+        headroom: float = 0.0,
+        server_ids: Optional[List[int]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        if not 0.0 <= headroom < 1.0:
+            raise ValueError("headroom must be between 0 and 1")
+        self.client = client
+        self.refresh_interval = refresh_interval
+        self.headroom = headroom  # Fraction of each daily limit left unused
+        self.server_ids = set(server_ids) if server_ids else None
+        self.quotas: Dict[int, ServerQuota] = {}
+        self._clock = clock
+        self._refreshed_at: Optional[float] = None
+        self._day: Optional[int] = None
+        self._lock = threading.Lock()
+
+    # ===== Quotas =====
+
+    def refresh(self) -> None:
+        """Reload daily limits and sent counts from get_servers"""
+        servers = self.client.get_servers() or []
+        now = self._clock()
+        with self._lock:
+            quotas = {}
+            for server in servers:
+                server_id = server.get("id")
+                if server.get("status", "active") != "active":
+                    continue
+                if self.server_ids is not None and server_id not in self.server_ids:
+                    continue
+                limit = int((server.get("daily_limit") or 0) * (1.0 - self.headroom))
+                quota = ServerQuota(server_id, limit, int(server.get("sent_today") or 0))
+                previous = self.quotas.get(server_id)
+                if previous is not None:
+                    quota.hour = previous.hour
+                    quota.hour_budget = previous.hour_budget
+                    quota.hour_sent = previous.hour_sent
+                quotas[server_id] = quota
+            self.quotas = quotas
+            self._refreshed_at = now
+            self._day = int(now // 86400)
+
+    def _refresh_if_stale(self) -> None:
+        if self._refreshed_at is None or self._clock() - self._refreshed_at >= self.refresh_interval:
+            self.refresh()
+
+    def _roll(self, now: float) -> None:
+        """Start a new day or hour for every quota when the clock passes one"""
+        day = int(now // 86400)
+        if day != self._day:
+            self._day = day
+            for quota in self.quotas.values():
+                quota.sent_today = 0
+                quota.local_sent = 0
+                quota.hour = None
+
+        hour = int(now // 3600)
+        hours_left = max(1, math.ceil(((day + 1) * 86400 - now) / 3600))
+        for quota in self.quotas.values():
+            if quota.hour != hour:
+                quota.hour = hour
+                quota.hour_sent = 0
+                quota.hour_budget = math.ceil(quota.remaining / hours_left)
+
+    def _take(self, count: int) -> Tuple[Optional[int], int]:
+        """Reserve up to count sends on the server with most capacity this hour"""
+        with self._lock:
+            self._roll(self._clock())
+            best = max(self.quotas.values(), key=lambda q: q.hour_available, default=None)
+            if best is None or best.hour_available == 0:
+                return None, 0
+            granted = min(count, best.hour_available)
+            best.hour_sent += granted
+            best.local_sent += granted
+            return best.server_id, granted
+
+    def acquire(self, count: int = 1, timeout: Optional[float] = None) -> Tuple[int, int]:
+        """
+        Wait for capacity and reserve it
+
+        Returns:
+            (server_id, granted) where 1 <= granted <= count
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self._refresh_if_stale()
+            if not self.quotas:
+                raise ADSMediaError("No active servers available")
+            server_id, granted = self._take(count)
+            if granted:
+                return server_id, granted
+
+            now = self._clock()
+            wait = min(3600 - now % 3600, self.refresh_interval)
+            if deadline is not None:
+                if time.monotonic() + wait > deadline:
+                    raise ADSMediaError("No server quota available", 429)
+            time.sleep(wait)
+
+    def release(self, server_id: int, count: int) -> None:
+        """Return reserved quota that was not used (e.g. a failed send)"""
+        with self._lock:
+            quota = self.quotas.get(server_id)
+            if quota is not None:
+                quota.hour_sent = max(0, quota.hour_sent - count)
+                quota.local_sent = max(0, quota.local_sent - count)
+
+    # ===== Sending =====
+
+    def send_batch(
+        self,
+        recipients: List[Any],
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Send recipients in paced chunks of up to 1000
+
+        Takes the same arguments as ADSMedia.send_batch except server_id,
+        which the scheduler picks. Blocks while every server has used its
+        budget for the current hour.
+
+        Returns:
+            list of send_batch results, one per chunk
+        """
+        results = []
+        position = 0
+        while position < len(recipients):
+            wanted = min(MAX_BATCH_SIZE, len(recipients) - position)
+            server_id, granted = self.acquire(wanted, timeout=timeout)
+            chunk = recipients[position:position + granted]
+            try:
+                results.append(self.client.send_batch(chunk, server_id=server_id, **kwargs))
+            except ADSMediaError:
+                self.release(server_id, granted)
+                raise
+            position += granted
+        return results
+
+    def create_schedule(
+        self,
+        campaign_id: int,
+        list_id: int,
+        list_size: int,
+        sender_name: Optional[str] = None,
+        schedule: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Create a sending task on the server with the most quota left today
+
+        If no server can take list_size more emails today, the task is
+        scheduled for the start of the next day (UTC) on the server with the
+        highest daily limit that fits it.
+        """
+        self._refresh_if_stale()
+        with self._lock:
+            self._roll(self._clock())
+            fits_today = [q for q in self.quotas.values() if q.remaining >= list_size]
+            reserved = 0
+            if fits_today:
+                quota = max(fits_today, key=lambda q: q.remaining)
+                quota.local_sent += list_size
+                reserved = list_size
+            else:
+                fits = [q for q in self.quotas.values() if q.daily_limit >= list_size]
+                if not fits:
+                    raise ADSMediaError("List is larger than every server's daily limit", 429)
+                quota = max(fits, key=lambda q: q.daily_limit)
+                if schedule is None:
+                    tomorrow = datetime.fromtimestamp((self._day + 1) * 86400, timezone.utc)
+                    schedule = (tomorrow + timedelta(minutes=1)).strftime("%Y-%m-%d %H:%M:%S")
+
+        try:
+            return self.client.create_schedule(
+                campaign_id=campaign_id,
+                list_id=list_id,
+                server_id=quota.server_id,
+                sender_name=sender_name,
+                schedule=schedule,
+            )
+        except ADSMediaError:
+            # Only today's total was reserved, not the hourly budget
+            with self._lock:
+                quota.local_sent = max(0, quota.local_sent - reserved)
+            raise
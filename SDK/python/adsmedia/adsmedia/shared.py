@@ -0,0 +1,93 @@
+"""Process-wide clients shared by framework, bot and agent integrations"""
+
+import asyncio
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from .async_client import AsyncADSMedia
+from .client import ADSMedia
+
+DEFAULT_BASE_URL = "https://api.adsmedia.live/v1"
+
+_Key = Tuple[str, str]
+
+_clients: Dict[_Key, ADSMedia] = {}
+# Async sessions belong to the loop that opened them, so clients are per loop
+_async_clients: Dict[asyncio.AbstractEventLoop, Dict[_Key, AsyncADSMedia]] = {}
+_no_loop_clients: Dict[_Key, AsyncADSMedia] = {}
+_lock = threading.Lock()
+
+
+def _key(api_key: Optional[str], base_url: Optional[str]) -> _Key:
+    api_key = api_key or os.environ.get("ADSMEDIA_API_KEY")
+    if not api_key:
+        raise ValueError("ADSMEDIA_API_KEY not configured")
+    base_url = base_url or os.environ.get("ADSMEDIA_BASE_URL") or DEFAULT_BASE_URL
+    return api_key, base_url.rstrip("/")
+
+
+def shared_client(
+    api_key: Optional[str] = None, base_url: Optional[str] = None, **options: Any
+) -> ADSMedia:
+    """
+    The process-wide ADSMedia client for an API key and base URL
+
+    api_key and base_url default to ADSMEDIA_API_KEY and ADSMEDIA_BASE_URL.
+    options (max_retries, pool_maxsize, ...) apply when the client is first
+    created. Integrations call this instead of building their own client,
+    so every request in the process shares one connection pool.
+
+    Example:
+        client = shared_client()            # Reads ADSMEDIA_API_KEY
+        client.send(to='user@example.com', subject='Hi', html='<p>Hi</p>')
+    """
+    key = _key(api_key, base_url)
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = ADSMedia(api_key=key[0], base_url=key[1], **options)
+        return client
+
+
+def shared_async_client(
+    api_key: Optional[str] = None, base_url: Optional[str] = None, **options: Any
+) -> AsyncADSMedia:
+    """
+    The AsyncADSMedia for an API key and base URL in the running event loop
+
+    Like shared_client, but one client per event loop, since a pooled
+    session cannot be used from a loop other than the one that opened it.
+    """
+    key = _key(api_key, base_url)
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    with _lock:
+        # Clients of closed loops can never be used again
+        for closed in [other for other in _async_clients if other.is_closed()]:
+            del _async_clients[closed]
+        clients = _no_loop_clients if loop is None else _async_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            client = clients[key] = AsyncADSMedia(api_key=key[0], base_url=key[1], **options)
+        return client
+
+
+def close_shared_clients() -> None:
+    """Close the shared sync clients (async ones close with aclose_shared_clients)"""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+async def aclose_shared_clients() -> None:
+    """Close the shared async clients of the running event loop"""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = list(_async_clients.pop(loop, {}).values())
+    for client in clients:
+        await client.aclose()
@@ -0,0 +1,216 @@
+"""Request body compression and incremental parsing of large responses"""
+
+import gzip
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # pip install adsmedia[br]
+    brotli = None
+
+GZIP = "gzip"
+BROTLI = "br"
+
+_WHITESPACE = " \t\r\n"
+_SEPARATORS = " \t\r\n,"
+# Characters that may follow a complete number or literal
+_DELIMITERS = " \t\r\n,]}"
+_decoder = json.JSONDecoder()
+
+
+def _may_continue(buffer: str, end: int, final: bool) -> bool:
+    """
+    Whether a value decoded up to end may still be cut short
+
+    Strings, objects and arrays end with their closing character. A number
+    or literal is only complete once a delimiter follows it: "12" may
+    continue as "123", and "-2500" in "-2500." as "-2500.0".
+    """
+    if final or buffer[end - 1] in '}]"':
+        return False
+    return end == len(buffer) or buffer[end] not in _DELIMITERS
+
+
+def accept_encoding() -> str:
+    """Accept-Encoding value for the codecs the HTTP libraries can decode here"""
+    return "br, gzip, deflate" if brotli is not None else "gzip, deflate"
+
+
+def encode_json(
+    payload: Any, threshold: Optional[int], encoding: str = GZIP
+) -> Tuple[bytes, Optional[str]]:
+    """
+    Compact JSON body, compressed when at least threshold bytes long
+
+    Returns:
+        (body, Content-Encoding or None)
+    """
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    if threshold is None or len(body) < threshold:
+        return body, None
+    if encoding == BROTLI:
+        if brotli is None:
+            raise ImportError("Brotli compression needs brotli: pip install adsmedia[br]")
+        # Quality 5 compresses HTML close to the maximum at a fraction of the CPU
+        return brotli.compress(body, quality=5), BROTLI
+    if encoding == GZIP:
+        return gzip.compress(body, compresslevel=6), GZIP
+    raise ValueError(f"Unsupported compression {encoding!r}; use 'gzip' or 'br'")
+
+
+def decode_body(body: bytes, encoding: Optional[str]) -> bytes:
+    """Inverse of encode_json's compression"""
+    if encoding == GZIP:
+        return gzip.decompress(body)
+    if encoding == BROTLI:
+        if brotli is None:
+            raise ImportError("Brotli decoding needs brotli: pip install adsmedia[br]")
+        return brotli.decompress(body)
+    return body
+
+
+class JSONArrayStream:
+    """
+    Push parser yielding the items of a response's data array as bytes arrive
+
+    Handles the API envelope ({"success": true, "data": [...]}) and bare
+    arrays. Only the current item is buffered, so peak memory stays at one
+    item plus one network chunk however long the array is. Envelope keys
+    other than "data" are kept in .envelope.
+
+    Example:
+        stream = JSONArrayStream()
+        for chunk in chunks:
+            for item in stream.feed(chunk):
+                handle(item)
+        stream.close()
+    """
+
+    def __init__(self) -> None:
+        self.envelope: Dict[str, Any] = {}
+        self._decoder = _decoder
+        self._pending = b""
+        self._buffer = ""
+        self._pos = 0
+        # start -> object (envelope) -> key -> colon -> value; array -> item -> separator; end
+        self._state = "start"
+        self._key: Optional[str] = None
+
+    def _skip_ws(self) -> bool:
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return pos < len(buffer)
+
+    def _decode_value(self, final: bool) -> Tuple[bool, Any]:
+        """Decode one JSON value at the cursor; (False, None) if incomplete"""
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return False, None
+        if _may_continue(self._buffer, end, final):
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _read_items(self, items: List[Any], final: bool) -> bool:
+        """Decode consecutive array items; False if stopped at an incomplete one"""
+        # The hot loop of the parser, so it works on locals
+        buffer, pos, end_of_buffer = self._buffer, self._pos, len(self._buffer)
+        decode = self._decoder.raw_decode
+        append = items.append
+        try:
+            while True:
+                while pos < end_of_buffer and buffer[pos] in _SEPARATORS:
+                    pos += 1
+                if pos == end_of_buffer or buffer[pos] == "]":
+                    return pos < end_of_buffer
+                try:
+                    item, end = decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    return False
+                if _may_continue(buffer, end, final):
+                    return False
+                append(item)
+                pos = end
+        finally:
+            self._pos = pos
+
+    def feed(self, chunk: bytes, final: bool = False) -> List[Any]:
+        """Add bytes and return the array items completed by them"""
+        data = self._pending + chunk
+        try:
+            text = data.decode("utf-8")
+            self._pending = b""
+        except UnicodeDecodeError as e:
+            if final or e.start < len(data) - 3:
+                raise
+            # Chunk boundary inside a multi-byte character
+            text = data[:e.start].decode("utf-8")
+            self._pending = data[e.start:]
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+
+        items: List[Any] = []
+        while self._skip_ws():
+            char = self._buffer[self._pos]
+            state = self._state
+            if state == "start":
+                if char == "[":
+                    self._state = "array"
+                elif char == "{":
+                    self._state = "key"
+                else:
+                    raise ValueError("Response is not a JSON object or array")
+                self._pos += 1
+            elif state == "key":
+                if char == "}":
+                    self._state = "end"
+                    self._pos += 1
+                    continue
+                if char == ",":
+                    self._pos += 1
+                    continue
+                done, key = self._decode_value(final)
+                if not done:
+                    break
+                self._key = key
+                self._state = "colon"
+            elif state == "colon":
+                if char != ":":
+                    raise ValueError("Malformed JSON envelope")
+                self._pos += 1
+                self._state = "value"
+            elif state == "value":
+                if self._key == "data" and char == "[":
+                    self._pos += 1
+                    self._state = "array"
+                    continue
+                done, value = self._decode_value(final)
+                if not done:
+                    break
+                self.envelope[self._key] = value
+                self._state = "key"
+            elif state == "array":
+                if char == "]":
+                    self._pos += 1
+                    self._state = "key" if self._key == "data" else "end"
+                    continue
+                if not self._read_items(items, final):
+                    break
+            else:
+                raise ValueError("Unexpected data after the JSON document")
+        return items
+
+    def close(self) -> List[Any]:
+        """Flush the last bytes; raises ValueError if the document was cut short"""
+        items = self.feed(b"", final=True)
+        if self._state != "end":
+            raise ValueError("Response ended before the JSON document was complete")
+        return items
@@ -0,0 +1,216 @@
+"""Local suppression index fed by bounce and unsubscribe events"""
+
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .client import ADSMedia
+from .events import EventTailer, SQLiteCheckpointStore
+
+# SQLite's default limit on bound parameters is 999 on older builds
+_CHUNK = 900
+
+
+def normalise_email(email: str) -> str:
+    return email.strip().lower()
+
+
+class SuppressionIndex:
+    """
+    On-disk index of addresses that must not be mailed
+
+    Stored in SQLite as a WITHOUT ROWID table keyed by the normalised
+    address, so a lookup is a single primary-key probe that never touches
+    a separate row store.
+
+    Example:
+        index = SuppressionIndex('suppressions.db')
+        client = ADSMedia(api_key='your-api-key', suppression_index=index)
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS suppressions ("
+            "email TEXT PRIMARY KEY, reason TEXT NOT NULL, task_id INTEGER, "
+            "created_at REAL NOT NULL) WITHOUT ROWID"
+        )
+
+    def add(self, email: str, reason: str, task_id: Optional[int] = None) -> None:
+        """Suppress an address (the first recorded reason is kept)"""
+        self.add_many([(email, reason, task_id)])
+
+    def add_many(self, entries: Iterable[Tuple[str, str, Optional[int]]]) -> int:
+        """Suppress (email, reason, task_id) entries; returns how many were new"""
+        now = time.time()
+        rows = [
+            (normalise_email(email), reason, task_id, now)
+            for email, reason, task_id in entries if email
+        ]
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO suppressions (email, reason, task_id, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+            except BaseException:
+                # Otherwise the transaction stays open and the next BEGIN fails
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return self._conn.total_changes - before
+
+    def remove(self, email: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM suppressions WHERE email = ?", (normalise_email(email),))
+
+    def reason(self, email: str) -> Optional[str]:
+        """Suppression reason for an address, or None if it may be mailed"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT reason FROM suppressions WHERE email = ?", (normalise_email(email),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def is_suppressed(self, email: str) -> bool:
+        return self.reason(email) is not None
+
+    def __contains__(self, email: str) -> bool:
+        return self.is_suppressed(email)
+
+    def lookup(self, emails: Iterable[str]) -> Dict[str, str]:
+        """Suppressed addresses among emails, mapped to their reasons"""
+        normalised = {normalise_email(e): e for e in emails if e}
+        keys = list(normalised)
+        found: Dict[str, str] = {}
+        with self._lock:
+            for start in range(0, len(keys), _CHUNK):
+                chunk = keys[start:start + _CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                for email, reason in self._conn.execute(
+                    f"SELECT email, reason FROM suppressions WHERE email IN ({placeholders})",
+                    chunk,
+                ):
+                    found[normalised[email]] = reason
+        return found
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM suppressions").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class SuppressionSync:
+    """
+    Keep a SuppressionIndex up to date from bounce and unsubscribe events
+
+    Tails get_events(type='bounce'|'unsubscribe') for the given tasks with
+    an EventTailer whose checkpoints live next to the index, so restarts
+    only fetch new events. Runs in a background thread.
+
+    Example:
+        index = SuppressionIndex('suppressions.db')
+        sync = SuppressionSync(client, index, task_ids=[123, 124])
+        sync.start()
+    """
+
+    TYPES = ("bounce", "unsubscribe")
+
+    def __init__(
+        self,
+        client: ADSMedia,
+        index: SuppressionIndex,
+        task_ids: Iterable[int] = (),
+        min_interval: float = 30.0,
+        max_interval: float = 900.0,
+        concurrency: int = 8,
+    ):
+        self.client = client
+        self.index = index
+        checkpoints = SQLiteCheckpointStore(index.path) if index.path != ":memory:" else None
+        self.tailer = EventTailer(
+            client,
+            task_ids=task_ids,
+            types=self.TYPES,
+            checkpoints=checkpoints,
+            on_event=self._on_event,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            concurrency=concurrency,
+        )
+        self._thread: Optional[threading.Thread] = None
+
+    def _on_event(self, task_id: int, event: Dict[str, Any]) -> None:
+        email = event.get("email")
+        if not email:
+            return
+        event_type = event.get("type") or "bounce"
+        if event_type == "bounce" and _is_soft_bounce(event):
+            return
+        self.index.add(email, event_type, task_id)
+
+    def add_task(self, task_id: int) -> None:
+        self.tailer.add_task(task_id)
+
+    def remove_task(self, task_id: int) -> None:
+        self.tailer.remove_task(task_id)
+
+    def import_bounce_details(self, task_id: int) -> int:
+        """Suppress hard bounces from get_bounce_details; returns how many were new"""
+        bounces = self.client.get_bounce_details(task_id) or []
+        return self.index.add_many(
+            (b.get("email"), "bounce", task_id) for b in bounces if not _is_soft_bounce(b)
+        )
+
+    def sync_once(self) -> None:
+        """Ingest new events from every due task"""
+        self.tailer.poll_once()
+
+    def start(self) -> None:
+        """Start syncing in a daemon thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self.tailer.run, name="adsmedia-suppression-sync", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self.tailer.stop()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+def _is_soft_bounce(entry: Dict[str, Any]) -> bool:
+    kind = str(entry.get("bounce_type") or entry.get("bounceType") or "").lower()
+    return kind == "soft"
+
+
+def split_suppressed(
+    index: SuppressionIndex, emails: List[str]
+) -> Tuple[List[int], Dict[str, str]]:
+    """Positions of mailable addresses, and suppressed address -> reason"""
+    found = index.lookup(emails)
+    if not found:
+        return list(range(len(emails))), {}
+    reasons = {normalise_email(email): reason for email, reason in found.items()}
+    keep = []
+    suppressed = {}
+    for i, email in enumerate(emails):
+        reason = reasons.get(normalise_email(email)) if email else None
+        if reason is None:
+            keep.append(i)
+        else:
+            suppressed[email] = reason
+    return keep, suppressed
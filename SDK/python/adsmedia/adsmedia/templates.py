@@ -0,0 +1,178 @@
+"""Local merge-tag rendering for personalised sends"""
+
+import html as html_lib
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .types import BatchRecipient, Contact
+
+Recipient = Union[Dict[str, Any], BatchRecipient, Contact]
+
+_TAG = re.compile(r"%%([^%\r\n]{1,64})%%")
+
+
+def _normalise(tag: str) -> str:
+    return tag.replace(" ", "").replace("_", "").lower()
+
+
+# Normalised tag -> recipient field, for the placeholders the API supports
+TAG_FIELDS = {
+    "firstname": "first_name",
+    "lastname": "last_name",
+    "emailaddress": "email",
+    "email": "email",
+    "name": "name",
+    "sendername": "sender_name",
+    "custom1": "custom1",
+    "custom2": "custom2",
+}
+
+
+class CompiledTemplate:
+    """
+    A template parsed once into literal text and merge-tag slots
+
+    Rendering fills the slots and joins the pieces in one pass. Tags
+    without a known field (e.g. %%unsubscribelink%%) are kept verbatim so
+    the server can still replace them. With any_field=True every tag is a
+    slot named by its text (e.g. %%orderId%% reads values['orderId']).
+    """
+
+    __slots__ = ("source", "literals", "fields", "tags", "_pieces")
+
+    def __init__(self, source: str, any_field: bool = False):
+        self.source = source
+        literals: List[str] = []
+        fields: List[str] = []
+        tags: List[str] = []
+        position = 0
+        for match in _TAG.finditer(source):
+            if any_field:
+                field = match.group(1).strip()
+            else:
+                field = TAG_FIELDS.get(_normalise(match.group(1)))
+            if field is None:
+                continue
+            literals.append(source[position:match.start()])
+            fields.append(field)
+            tags.append(match.group(0))
+            position = match.end()
+        literals.append(source[position:])
+        self.literals: Tuple[str, ...] = tuple(literals)
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self.tags: Tuple[str, ...] = tuple(tags)
+        self._pieces: List[Optional[str]] = [None] * (2 * len(fields) + 1)
+        self._pieces[0::2] = self.literals
+
+    def render(self, values: Dict[str, str]) -> str:
+        """Render with a field -> value mapping (missing fields render empty)"""
+        if not self.fields:
+            return self.source
+        pieces = self._pieces.copy()
+        pieces[1::2] = [values.get(field, "") for field in self.fields]
+        return "".join(pieces)
+
+
+@lru_cache(maxsize=1024)
+def compile_template(source: str, any_field: bool = False) -> CompiledTemplate:
+    """Compile a template, reusing the compiled form for identical content"""
+    return CompiledTemplate(source, any_field)
+
+
+def recipient_fields(recipient: Recipient, sender_name: Optional[str] = None) -> Dict[str, str]:
+    """Merge-tag values for a BatchRecipient, Contact or recipient dict"""
+    if isinstance(recipient, dict):
+        get = recipient.get
+        first_name = get("first_name") or get("firstName")
+        last_name = get("last_name") or get("lastName")
+        values = {
+            "email": get("email"),
+            "name": get("name"),
+            "first_name": first_name,
+            "last_name": last_name,
+            "custom1": get("custom1"),
+            "custom2": get("custom2"),
+        }
+    else:
+        values = {
+            "email": recipient.email,
+            "name": getattr(recipient, "name", None),
+            "first_name": recipient.first_name,
+            "last_name": recipient.last_name,
+            "custom1": recipient.custom1,
+            "custom2": recipient.custom2,
+        }
+
+    # Fill first/last name from the display name and vice versa
+    if not values["first_name"] and values["name"]:
+        parts = values["name"].split(" ", 1)
+        values["first_name"] = parts[0]
+        if not values["last_name"] and len(parts) > 1:
+            values["last_name"] = parts[1]
+    if not values["name"] and values["first_name"]:
+        values["name"] = " ".join(p for p in (values["first_name"], values["last_name"]) if p)
+    values["sender_name"] = sender_name
+    return {key: str(value) for key, value in values.items() if value is not None}
+
+
+class MessageTemplate:
+    """
+    Subject, HTML and text compiled once and rendered per recipient
+
+    Example:
+        template = MessageTemplate(
+            subject='Hello %%First Name%%!',
+            html='<h1>Hi %%First Name%%</h1><p>Your code: %%custom1%%</p>',
+        )
+        for recipient in recipients:
+            client.send(**template.render(recipient))
+    """
+
+    def __init__(
+        self,
+        subject: str,
+        html: Optional[str] = None,
+        text: Optional[str] = None,
+        sender_name: Optional[str] = None,
+        escape_html: bool = True,
+    ):
+        self.subject = compile_template(subject)
+        self.html = compile_template(html) if html is not None else None
+        self.text = compile_template(text) if text is not None else None
+        self.sender_name = sender_name
+        self.escape_html = escape_html
+        self._html_fields = frozenset(self.html.fields) if self.html is not None else frozenset()
+
+    def render(self, recipient: Recipient) -> Dict[str, Any]:
+        """
+        Render for one recipient
+
+        Returns:
+            dict of ADSMedia.send arguments: to, to_name, subject, html, text
+        """
+        values = recipient_fields(recipient, self.sender_name)
+        message: Dict[str, Any] = {
+            "to": values.get("email"),
+            "subject": self.subject.render(values),
+        }
+        if values.get("name"):
+            message["to_name"] = values["name"]
+        if self.html is not None:
+            if self.escape_html and self._html_fields:
+                escaped = {
+                    key: html_lib.escape(value)
+                    for key, value in values.items() if key in self._html_fields
+                }
+                message["html"] = self.html.render(escaped)
+            else:
+                message["html"] = self.html.render(values)
+        if self.text is not None:
+            message["text"] = self.text.render(values)
+        if self.sender_name:
+            message["from_name"] = self.sender_name
+        return message
+
+    def render_many(self, recipients: List[Recipient]) -> List[Dict[str, Any]]:
+        """Render for every recipient"""
+        return [self.render(recipient) for recipient in recipients]
@@ -0,0 +1,699 @@
+"""HTTP transports used by ADSMedia and AsyncADSMedia"""
+
+import asyncio
+import json as json_lib
+import threading
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlencode, urlsplit
+
+from .streaming import decode_body
+
+
+class TransportError(Exception):
+    """A request could not be completed"""
+
+
+class TransportTimeout(TransportError):
+    """The request timed out"""
+
+
+class TransportConnectionError(TransportError):
+    """The connection failed before a response was received"""
+
+
+class TransportConnectError(TransportConnectionError):
+    """No connection could be opened, so the request was never sent"""
+
+
+class TransportResponse:
+    """Status code and decoded JSON body (None if the body was not JSON)"""
+
+    __slots__ = ("status_code", "data")
+
+    def __init__(self, status_code: int, data: Any):
+        self.status_code = status_code
+        self.data = data
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+
+def _decode(body: bytes) -> Any:
+    if not body:
+        return None
+    try:
+        return json_lib.loads(body)
+    except ValueError:
+        return None
+
+
+class StreamResponse:
+    """Status code and an iterator over the (decompressed) body bytes"""
+
+    __slots__ = ("status_code", "chunks", "_close")
+
+    def __init__(
+        self, status_code: int, chunks: Iterator[bytes], close: Optional[Callable[[], None]] = None
+    ):
+        self.status_code = status_code
+        self.chunks = chunks
+        self._close = close
+
+    def close(self) -> None:
+        if self._close is not None:
+            self._close()
+
+
+class AsyncStreamResponse:
+    """StreamResponse for asyncio transports"""
+
+    __slots__ = ("status_code", "chunks", "_close")
+
+    def __init__(
+        self,
+        status_code: int,
+        chunks: AsyncIterator[bytes],
+        close: Optional[Callable[[], Awaitable[None]]] = None,
+    ):
+        self.status_code = status_code
+        self.chunks = chunks
+        self._close = close
+
+    async def close(self) -> None:
+        if self._close is not None:
+            await self._close()
+
+
+# Size of the chunks streamed responses are read in
+CHUNK_SIZE = 64 * 1024
+
+
+def _chunked(body: bytes) -> Iterator[bytes]:
+    for start in range(0, len(body), CHUNK_SIZE):
+        yield body[start:start + CHUNK_SIZE]
+
+
+async def _achunked(body: bytes) -> AsyncIterator[bytes]:
+    for chunk in _chunked(body):
+        yield chunk
+
+
+def _encode_data(data: Any) -> bytes:
+    return json_lib.dumps(data).encode() if data is not None else b""
+
+
+class Transport:
+    """
+    Base class for synchronous transports
+
+    A transport sends one request and returns a TransportResponse; it
+    raises TransportTimeout, TransportConnectionError or TransportError
+    instead of library-specific exceptions. The request body is either
+    json (serialised by the transport) or pre-encoded bytes in body.
+    """
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        body: Optional[bytes] = None,
+    ) -> TransportResponse:
+        raise NotImplementedError
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> StreamResponse:
+        """
+        Send a request and return its body as it arrives
+
+        Transports without streaming support fall back to a buffered request.
+        """
+        response = self.request(method, url, params=params, headers=headers, timeout=timeout)
+        return StreamResponse(response.status_code, _chunked(_encode_data(response.data)))
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncTransport:
+    """Base class for asyncio transports (same contract as Transport)"""
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        body: Optional[bytes] = None,
+    ) -> TransportResponse:
+        raise NotImplementedError
+
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncStreamResponse:
+        response = await self.request(method, url, params=params, headers=headers, timeout=timeout)
+        return AsyncStreamResponse(response.status_code, _achunked(_encode_data(response.data)))
+
+    async def aclose(self) -> None:
+        pass
+
+
+def _query(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+    if not params:
+        return None
+    return {k: str(v) for k, v in params.items() if v is not None}
+
+
+# ===== Synchronous transports =====
+
+class RequestsTransport(Transport):
+    """requests.Session with a connection pool of pool_maxsize per host"""
+
+    def __init__(self, pool_maxsize: int = 10, session: Optional[Any] = None):
+        import requests
+        import requests.adapters
+        from urllib3.exceptions import NewConnectionError
+
+        self._exceptions = requests.exceptions
+        self._new_connection_error = NewConnectionError
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=pool_maxsize)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+    def _error(self, e: Exception) -> TransportError:
+        exceptions = self._exceptions
+        if isinstance(e, exceptions.Timeout):
+            return TransportTimeout(str(e))
+        if isinstance(e, exceptions.ConnectionError):
+            # requests wraps urllib3's NewConnectionError (refused, DNS failure)
+            reason = getattr(e.args[0], "reason", None) if e.args else None
+            if isinstance(reason, self._new_connection_error):
+                return TransportConnectError(str(e))
+            return TransportConnectionError(str(e))
+        return TransportError(str(e))
+
+    def request(self, method, url, params=None, json=None, headers=None, timeout=None, body=None):
+        try:
+            response = self.session.request(
+                method=method, url=url, params=params, json=json, data=body,
+                headers=headers, timeout=timeout,
+            )
+            return TransportResponse(response.status_code, _decode(response.content))
+        except self._exceptions.RequestException as e:
+            raise self._error(e) from e
+
+    def stream(self, method, url, params=None, headers=None, timeout=None):
+        try:
+            response = self.session.request(
+                method=method, url=url, params=params, headers=headers, timeout=timeout, stream=True,
+            )
+        except self._exceptions.RequestException as e:
+            raise self._error(e) from e
+
+        def chunks() -> Iterator[bytes]:
+            try:
+                yield from response.iter_content(CHUNK_SIZE)
+            except self._exceptions.RequestException as e:
+                raise self._error(e) from e
+
+        return StreamResponse(response.status_code, chunks(), response.close)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class HttpxTransport(Transport):
+    """httpx.Client (pip install adsmedia[httpx]; http2 needs httpx[http2])"""
+
+    def __init__(self, pool_maxsize: int = 10, http2: bool = False, client: Optional[Any] = None):
+        httpx = _import_httpx()
+        self._httpx = httpx
+        if client is None:
+            client = httpx.Client(
+                http2=http2,
+                limits=httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize),
+            )
+        self.client = client
+
+    def request(self, method, url, params=None, json=None, headers=None, timeout=None, body=None):
+        try:
+            response = self.client.request(
+                method, url, params=params, json=json, content=body, headers=headers, timeout=timeout,
+            )
+            return TransportResponse(response.status_code, _decode(response.content))
+        except self._httpx.HTTPError as e:
+            raise _httpx_error(self._httpx, e) from e
+
+    def stream(self, method, url, params=None, headers=None, timeout=None):
+        httpx = self._httpx
+        try:
+            request = self.client.build_request(method, url, params=params, headers=headers, timeout=timeout)
+            response = self.client.send(request, stream=True)
+        except httpx.HTTPError as e:
+            raise _httpx_error(httpx, e) from e
+
+        def chunks() -> Iterator[bytes]:
+            try:
+                yield from response.iter_bytes(CHUNK_SIZE)
+            except httpx.HTTPError as e:
+                raise _httpx_error(httpx, e) from e
+
+        return StreamResponse(response.status_code, chunks(), response.close)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class Urllib3Transport(Transport):
+    """
+    urllib3.PoolManager used directly, skipping the requests layer
+
+    urllib3 ships with requests, so no extra install is needed.
+    """
+
+    def __init__(self, pool_maxsize: int = 10, pool: Optional[Any] = None):
+        import urllib3
+
+        self._exceptions = urllib3.exceptions
+        self.pool = pool if pool is not None else urllib3.PoolManager(maxsize=pool_maxsize)
+
+    def _error(self, e: Exception) -> TransportError:
+        exceptions = self._exceptions
+        # NewConnectionError subclasses ConnectTimeoutError, so test it first
+        if isinstance(e, exceptions.NewConnectionError):
+            return TransportConnectError(str(e))
+        if isinstance(e, exceptions.ProtocolError):
+            return TransportConnectionError(str(e))
+        if isinstance(e, exceptions.TimeoutError):
+            return TransportTimeout(str(e))
+        return TransportError(str(e))
+
+    def _url(self, url: str, params: Optional[Dict[str, Any]]) -> str:
+        query = _query(params)
+        return f"{url}?{urlencode(query)}" if query else url
+
+    def request(self, method, url, params=None, json=None, headers=None, timeout=None, body=None):
+        if body is None and json is not None:
+            body = json_lib.dumps(json).encode()
+        try:
+            response = self.pool.request(
+                method, self._url(url, params), body=body, headers=headers,
+                timeout=timeout, retries=False,
+            )
+            return TransportResponse(response.status, _decode(response.data))
+        except self._exceptions.HTTPError as e:
+            raise self._error(e) from e
+
+    def stream(self, method, url, params=None, headers=None, timeout=None):
+        try:
+            response = self.pool.request(
+                method, self._url(url, params), headers=headers, timeout=timeout,
+                retries=False, preload_content=False,
+            )
+        except self._exceptions.HTTPError as e:
+            raise self._error(e) from e
+
+        def chunks() -> Iterator[bytes]:
+            try:
+                yield from response.stream(CHUNK_SIZE)
+            except self._exceptions.HTTPError as e:
+                raise self._error(e) from e
+
+        return StreamResponse(response.status, chunks(), response.release_conn)
+
+    def close(self) -> None:
+        self.pool.clear()
+
+
+# ===== Asynchronous transports =====
+
+class AiohttpTransport(AsyncTransport):
+    """
+    aiohttp.ClientSession (pip install adsmedia[async])
+
+    The session is created on first use inside the running event loop.
+    """
+
+    def __init__(self, pool_maxsize: int = 100, session: Optional[Any] = None):
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError("AiohttpTransport needs aiohttp: pip install adsmedia[async]") from None
+        self._aiohttp = aiohttp
+        self.pool_maxsize = pool_maxsize
+        self.session = session
+
+    def _session(self) -> Any:
+        if self.session is None or self.session.closed:
+            aiohttp = self._aiohttp
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_maxsize),
+            )
+        return self.session
+
+    def _error(self, e: Exception) -> TransportError:
+        if isinstance(e, asyncio.TimeoutError):
+            return TransportTimeout("Request timed out")
+        if isinstance(e, self._aiohttp.ClientConnectorError):
+            return TransportConnectError(str(e))
+        if isinstance(e, self._aiohttp.ClientConnectionError):
+            return TransportConnectionError(str(e))
+        return TransportError(str(e))
+
+    async def request(self, method, url, params=None, json=None, headers=None, timeout=None, body=None):
+        aiohttp = self._aiohttp
+        try:
+            async with self._session().request(
+                method, url, params=_query(params), json=json, data=body, headers=headers,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as response:
+                return TransportResponse(response.status, _decode(await response.read()))
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            raise self._error(e) from e
+
+    async def stream(self, method, url, params=None, headers=None, timeout=None):
+        aiohttp = self._aiohttp
+        try:
+            response = await self._session().request(
+                method, url, params=_query(params), headers=headers,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            )
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            raise self._error(e) from e
+
+        async def chunks() -> AsyncIterator[bytes]:
+            try:
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    yield chunk
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                raise self._error(e) from e
+
+        async def close() -> None:
+            response.release()
+
+        return AsyncStreamResponse(response.status, chunks(), close)
+
+    async def aclose(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+
+class AsyncHttpxTransport(AsyncTransport):
+    """httpx.AsyncClient (pip install adsmedia[httpx])"""
+
+    def __init__(self, pool_maxsize: int = 100, http2: bool = False, client: Optional[Any] = None):
+        httpx = _import_httpx()
+        self._httpx = httpx
+        if client is None:
+            client = httpx.AsyncClient(
+                http2=http2,
+                limits=httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize),
+            )
+        self.client = client
+
+    async def request(self, method, url, params=None, json=None, headers=None, timeout=None, body=None):
+        try:
+            response = await self.client.request(
+                method, url, params=params, json=json, content=body, headers=headers, timeout=timeout,
+            )
+            return TransportResponse(response.status_code, _decode(response.content))
+        except self._httpx.HTTPError as e:
+            raise _httpx_error(self._httpx, e) from e
+
+    async def stream(self, method, url, params=None, headers=None, timeout=None):
+        httpx = self._httpx
+        try:
+            request = self.client.build_request(method, url, params=params, headers=headers, timeout=timeout)
+            response = await self.client.send(request, stream=True)
+        except httpx.HTTPError as e:
+            raise _httpx_error(httpx, e) from e
+
+        async def chunks() -> AsyncIterator[bytes]:
+            try:
+                async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                    yield chunk
+            except httpx.HTTPError as e:
+                raise _httpx_error(httpx, e) from e
+
+        return AsyncStreamResponse(response.status_code, chunks(), response.aclose)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+def _import_httpx() -> Any:
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError("The httpx transports need httpx: pip install adsmedia[httpx]") from None
+    return httpx
+
+
+def _httpx_error(httpx: Any, e: Exception) -> TransportError:
+    if isinstance(e, httpx.TimeoutException):
+        return TransportTimeout(str(e))
+    if isinstance(e, httpx.ConnectError):
+        return TransportConnectError(str(e))
+    if isinstance(e, (httpx.RemoteProtocolError, httpx.NetworkError)):
+        return TransportConnectionError(str(e))
+    return TransportError(str(e))
+
+
+# ===== In-memory fake =====
+
+# A route response: the JSON body, (status, body), or a callable taking
+# the FakeRequest and returning either
+Responder = Union[Any, Tuple[int, Any], Callable[["FakeRequest"], Any]]
+
+
+class FakeRequest:
+    """A request seen by a fake transport"""
+
+    __slots__ = ("method", "endpoint", "params", "json", "headers")
+
+    def __init__(self, method: str, endpoint: str, params: Any, json: Any, headers: Any):
+        self.method = method
+        self.endpoint = endpoint
+        self.params = params
+        self.json = json
+        self.headers = headers
+
+    def __repr__(self) -> str:
+        return f"FakeRequest({self.method} {self.endpoint})"
+
+
+class _FakeCore:
+    def __init__(
+        self,
+        routes: Optional[Dict[Tuple[str, str], Responder]] = None,
+        default: Responder = None,
+        record_calls: bool = True,
+    ):
+        self._routes: Dict[Tuple[str, str], Deque[Responder]] = {}
+        self._endpoints: Dict[str, str] = {}  # URL -> endpoint, cached
+        self.default = default if default is not None else {"success": True, "data": {}}
+        self.record_calls = record_calls
+        self.calls: List[FakeRequest] = []
+        self._lock = threading.Lock()
+        for (method, endpoint), responder in (routes or {}).items():
+            self.route(method, endpoint, responder)
+
+    def route(self, method: str, endpoint: str, *responses: Responder) -> None:
+        """
+        Answer method+endpoint (e.g. "POST", "/send") with responses in
+        turn; the last one keeps being used once the others are consumed
+        """
+        with self._lock:
+            self._routes[(method.upper(), endpoint)] = deque(responses)
+            self._endpoints.clear()
+
+    def _endpoint(self, url: str) -> str:
+        endpoint = self._endpoints.get(url)
+        if endpoint is None:
+            path = urlsplit(url).path
+            # Longest registered endpoint the path ends with, e.g. /v1/send -> /send
+            known = sorted({e for _, e in self._routes}, key=len, reverse=True)
+            endpoint = next((e for e in known if path.endswith(e)), path)
+            self._endpoints[url] = endpoint
+        return endpoint
+
+    def respond(self, method, url, params, json, headers, body=None) -> TransportResponse:
+        endpoint = self._endpoint(url)
+        if body is not None:
+            encoding = headers.get("Content-Encoding") if headers else None
+            json = json_lib.loads(decode_body(body, encoding))
+        request = FakeRequest(method, endpoint, params, json, headers)
+        with self._lock:
+            if self.record_calls:
+                self.calls.append(request)
+            queue = self._routes.get((method, endpoint))
+            if queue:
+                responder = queue.popleft() if len(queue) > 1 else queue[0]
+            else:
+                responder = self.default
+        if callable(responder):
+            responder = responder(request)
+        if isinstance(responder, BaseException):
+            raise responder
+        if isinstance(responder, tuple):
+            return TransportResponse(*responder)
+        return TransportResponse(200, responder)
+
+    def load_recording(self, records: Union[str, Iterable[Dict[str, Any]]]) -> None:
+        """Replay responses captured by RecordingTransport (records or a JSONL path)"""
+        if isinstance(records, str):
+            with open(records, encoding="utf-8") as f:
+                records = [json_lib.loads(line) for line in f if line.strip()]
+        by_route: Dict[Tuple[str, str], List[Responder]] = {}
+        for record in records:
+            key = (record["method"], record["endpoint"])
+            by_route.setdefault(key, []).append((record["status"], record["data"]))
+        for (method, endpoint), responses in by_route.items():
+            self.route(method, endpoint, *responses)
+
+
+class FakeTransport(_FakeCore, Transport):
+    """
+    In-memory transport for tests and benchmarks; nothing leaves the process
+
+    Unrouted requests get a successful empty response. Every request is
+    kept in .calls unless record_calls=False (use that for benchmarks).
+
+    Example:
+        fake = FakeTransport()
+        fake.route('POST', '/send', {'success': True, 'data': {'message_id': 'm1'}})
+        fake.route('GET', '/ping', (503, {'error': {'message': 'down'}}), {'success': True})
+        client = ADSMedia(api_key='test', transport=fake)
+    """
+
+    def request(self, method, url, params=None, json=None, headers=None, timeout=None, body=None):
+        return self.respond(method, url, params, json, headers, body)
+
+
+class AsyncFakeTransport(_FakeCore, AsyncTransport):
+    """FakeTransport for AsyncADSMedia"""
+
+    async def request(self, method, url, params=None, json=None, headers=None, timeout=None, body=None):
+        return self.respond(method, url, params, json, headers, body)
+
+
+class RecordingTransport(Transport):
+    """
+    Wraps a transport and records every exchange for later replay
+
+    Example:
+        recorder = RecordingTransport(RequestsTransport())
+        client = ADSMedia(api_key='your-api-key', transport=recorder)
+        ...
+        recorder.save('session.jsonl')
+        replay = FakeTransport()
+        replay.load_recording('session.jsonl')
+    """
+
+    def __init__(self, inner: Transport):
+        self.inner = inner
+        self.records: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def request(self, method, url, params=None, json=None, headers=None, timeout=None, body=None):
+        response = self.inner.request(method, url, params, json, headers, timeout, body)
+        if body is not None:
+            encoding = headers.get("Content-Encoding") if headers else None
+            json = json_lib.loads(decode_body(body, encoding))
+        with self._lock:
+            self.records.append({
+                "method": method,
+                "endpoint": urlsplit(url).path,
+                "params": params,
+                "json": json,
+                "status": response.status_code,
+                "data": response.data,
+            })
+        return response
+
+    def save(self, path: str, base_path: str = "/v1") -> None:
+        """Write records as JSONL, with endpoints relative to base_path"""
+        with self._lock, open(path, "w", encoding="utf-8") as f:
+            for record in self.records:
+                endpoint = record["endpoint"]
+                if base_path and endpoint.startswith(base_path):
+                    endpoint = endpoint[len(base_path):]
+                f.write(json_lib.dumps(dict(record, endpoint=endpoint)) + "\n")
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+TRANSPORTS: Dict[str, Callable[..., Transport]] = {
+    "requests": RequestsTransport,
+    "httpx": HttpxTransport,
+    "urllib3": Urllib3Transport,
+    "fake": FakeTransport,
+}
+
+ASYNC_TRANSPORTS: Dict[str, Callable[..., AsyncTransport]] = {
+    "aiohttp": AiohttpTransport,
+    "httpx": AsyncHttpxTransport,
+    "fake": AsyncFakeTransport,
+}
+
+
+def make_transport(transport: Union[str, Transport, None], pool_maxsize: int = 10) -> Transport:
+    """A Transport instance, or one built from its name"""
+    if isinstance(transport, Transport):
+        return transport
+    name = transport or "requests"
+    if name not in TRANSPORTS:
+        raise ValueError(f"Unknown transport {name!r}; choose from {', '.join(TRANSPORTS)}")
+    if name == "fake":
+        return FakeTransport()
+    return TRANSPORTS[name](pool_maxsize=pool_maxsize)
+
+
+def make_async_transport(
+    transport: Union[str, AsyncTransport, None], pool_maxsize: int = 100
+) -> AsyncTransport:
+    """An AsyncTransport instance, or one built from its name"""
+    if isinstance(transport, AsyncTransport):
+        return transport
+    name = transport or "aiohttp"
+    if name not in ASYNC_TRANSPORTS:
+        raise ValueError(f"Unknown transport {name!r}; choose from {', '.join(ASYNC_TRANSPORTS)}")
+    if name == "fake":
+        return AsyncFakeTransport()
+    return ASYNC_TRANSPORTS[name](pool_maxsize=pool_maxsize)
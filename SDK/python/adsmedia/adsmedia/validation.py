@@ -0,0 +1,246 @@
+"""Pre-flight recipient validation and normalisation"""
+
+import dataclasses
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_LOCAL = re.compile(r"[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*")
+_DOMAIN = re.compile(
+    r"(?=.{1,253}$)(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+"
+    r"(?:[a-z]{2,63}|xn--[a-z0-9-]{1,59})"
+)
+
+ROLE_ACCOUNTS = frozenset({
+    "abuse", "admin", "administrator", "billing", "contact", "help", "hostmaster",
+    "info", "mailer-daemon", "marketing", "no-reply", "noc", "noreply", "office",
+    "postmaster", "root", "sales", "security", "support", "webmaster",
+})
+
+DISPOSABLE_DOMAINS = frozenset({
+    "10minutemail.com", "discard.email", "dispostable.com", "emailondeck.com",
+    "fakeinbox.com", "getnada.com", "guerrillamail.com", "guerrillamail.net",
+    "maildrop.cc", "mailinator.com", "mailnesia.com", "mintemail.com",
+    "mohmal.com", "moakt.com", "sharklasers.com", "temp-mail.org",
+    "tempmail.com", "tempmailo.com", "throwawaymail.com", "trashmail.com",
+    "yopmail.com",
+})
+
+# Reasons an address is dropped
+INVALID = "invalid"
+DUPLICATE = "duplicate"
+DISPOSABLE = "disposable"
+ROLE = "role"
+NO_MX = "no_mx"
+
+
+@dataclass
+class ValidationReport:
+    """Result of validate_recipients"""
+    valid: List[Any] = field(default_factory=list)  # Normalised recipients, input order
+    dropped: List[Tuple[str, str]] = field(default_factory=list)  # (original email, reason)
+    flagged: List[Tuple[str, str]] = field(default_factory=list)  # Kept, but disposable/role
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Number of dropped addresses per reason"""
+        counts: Dict[str, int] = {}
+        for _, reason in self.dropped:
+            counts[reason] = counts.get(reason, 0) + 1
+        return counts
+
+
+class MXCache:
+    """
+    Domain -> has-mail-exchanger cache with a TTL
+
+    Uses dnspython when no resolver is given (pip install adsmedia[dns]).
+    A resolver is any callable taking a domain and returning True when the
+    domain accepts mail and False when it certainly does not (NXDOMAIN, no
+    MX or A record). A resolver that raises (timeout, SERVFAIL, no network)
+    leaves the domain unknown: it counts as deliverable and is not cached.
+    """
+
+    def __init__(
+        self,
+        resolver: Optional[Callable[[str], bool]] = None,
+        ttl: float = 3600.0,
+        concurrency: int = 32,
+    ):
+        if resolver is None:
+            resolver = _dns_resolver()
+        self.resolver = resolver
+        self.ttl = ttl
+        self.concurrency = concurrency
+        self._entries: Dict[str, Tuple[bool, float]] = {}
+        self._lock = threading.Lock()
+
+    def _resolve(self, domain: str) -> Optional[bool]:
+        try:
+            return bool(self.resolver(domain))
+        except Exception as e:
+            logger.warning("MX lookup for %s failed, keeping it: %s", domain, e)
+            return None
+
+    def check_many(self, domains: Iterable[str]) -> Dict[str, bool]:
+        """Resolve every domain not cached yet, concurrently"""
+        now = time.monotonic()
+        results: Dict[str, bool] = {}
+        missing: List[str] = []
+        with self._lock:
+            for domain in set(domains):
+                cached = self._entries.get(domain)
+                if cached is not None and cached[1] > now:
+                    results[domain] = cached[0]
+                else:
+                    missing.append(domain)
+        if missing:
+            with ThreadPoolExecutor(min(self.concurrency, len(missing))) as executor:
+                resolved = dict(zip(missing, executor.map(self._resolve, missing)))
+            with self._lock:
+                for domain, ok in resolved.items():
+                    if ok is not None:
+                        self._entries[domain] = (ok, now + self.ttl)
+            # A failed lookup is no evidence against the domain
+            results.update((domain, ok is not False) for domain, ok in resolved.items())
+        return results
+
+
+def _dns_resolver() -> Callable[[str], bool]:
+    try:
+        import dns.resolver
+    except ImportError:
+        raise ImportError(
+            "MX lookups need dnspython: pip install adsmedia[dns], "
+            "or pass MXCache(resolver=...)"
+        ) from None
+
+    def has_mx(domain: str) -> bool:
+        # Only a definite "no such domain/record" is False; other errors raise
+        try:
+            return len(dns.resolver.resolve(domain, "MX")) > 0
+        except dns.resolver.NXDOMAIN:
+            return False
+        except dns.resolver.NoAnswer:
+            pass
+        # No MX record: mail falls back to the A record
+        try:
+            return len(dns.resolver.resolve(domain, "A")) > 0
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            return False
+
+    return has_mx
+
+
+def _normalise_domain(domain: str) -> Optional[str]:
+    domain = domain.rstrip(".").lower()
+    if not domain.isascii():
+        try:
+            domain = domain.encode("idna").decode("ascii")
+        except UnicodeError:
+            return None
+    return domain if _DOMAIN.fullmatch(domain) else None
+
+
+def normalise_address(email: str) -> Optional[str]:
+    """Lower-cased address with an IDNA (punycode) domain, or None if invalid"""
+    local, at, domain = email.strip().rpartition("@")
+    if not at or not local or len(local) > 64:
+        return None
+    local = local.lower()
+    if not _LOCAL.fullmatch(local):
+        return None
+    domain = _normalise_domain(domain)
+    return f"{local}@{domain}" if domain else None
+
+
+def _email_of(recipient: Any) -> Optional[str]:
+    if isinstance(recipient, str):
+        return recipient
+    if isinstance(recipient, dict):
+        return recipient.get("email")
+    return getattr(recipient, "email", None)
+
+
+def _with_email(recipient: Any, email: str) -> Any:
+    if isinstance(recipient, str):
+        return email
+    if isinstance(recipient, dict):
+        return dict(recipient, email=email)
+    return dataclasses.replace(recipient, email=email)
+
+
+def validate_recipients(
+    recipients: Iterable[Any],
+    drop_disposable: bool = False,
+    drop_role: bool = False,
+    mx_cache: Optional[MXCache] = None,
+    disposable_domains: frozenset = DISPOSABLE_DOMAINS,
+) -> ValidationReport:
+    """
+    Validate, normalise and de-duplicate recipients
+
+    Accepts address strings, recipient dicts, BatchRecipient or Contact and
+    returns them with normalised addresses. Work per domain (IDNA encoding,
+    syntax, disposable and MX checks) is done once per distinct domain,
+    which keeps large lists fast.
+
+    Example:
+        report = validate_recipients(recipients, drop_role=True)
+        client.send_batch(report.valid, subject='News', html='<p>...</p>')
+        print(report.counts)  # {'invalid': 12, 'duplicate': 40, 'role': 3}
+    """
+    report = ValidationReport()
+    domains: Dict[str, Optional[str]] = {}
+    seen = set()
+    pending: List[Tuple[Any, str, str, str]] = []  # recipient, original, address, domain
+
+    for recipient in recipients:
+        original = _email_of(recipient)
+        if not original:
+            report.dropped.append((original or "", INVALID))
+            continue
+        local, at, raw_domain = original.strip().rpartition("@")
+        if not at or not local or len(local) > 64:
+            report.dropped.append((original, INVALID))
+            continue
+
+        domain = domains.get(raw_domain, "")
+        if domain == "":
+            domain = domains[raw_domain] = _normalise_domain(raw_domain)
+        local = local.lower()
+        if domain is None or _LOCAL.fullmatch(local) is None:
+            report.dropped.append((original, INVALID))
+            continue
+
+        address = f"{local}@{domain}"
+        if address in seen:
+            report.dropped.append((original, DUPLICATE))
+            continue
+        seen.add(address)
+
+        if domain in disposable_domains:
+            if drop_disposable:
+                report.dropped.append((original, DISPOSABLE))
+                continue
+            report.flagged.append((address, DISPOSABLE))
+        if local in ROLE_ACCOUNTS:
+            if drop_role:
+                report.dropped.append((original, ROLE))
+                continue
+            report.flagged.append((address, ROLE))
+        pending.append((recipient, original, address, domain))
+
+    mail_domains = mx_cache.check_many(p[3] for p in pending) if mx_cache is not None else None
+    for recipient, original, address, domain in pending:
+        if mail_domains is not None and not mail_domains.get(domain, False):
+            report.dropped.append((original, NO_MX))
+            continue
+        report.valid.append(recipient if address == original else _with_email(recipient, address))
+    return report
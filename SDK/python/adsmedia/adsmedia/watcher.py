@@ -0,0 +1,315 @@
+"""Shared, adaptive watching of schedule status and campaign stats"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from .client import ADSMedia, ADSMediaError
+
+logger = logging.getLogger(__name__)
+
+# Base poll interval (seconds) per schedule status
+DEFAULT_INTERVALS = {
+    "sending": 5.0,
+    "prep": 10.0,
+    "queue": 60.0,
+    "paused": 120.0,
+}
+# Statuses after which a schedule is no longer polled
+FINAL_STATES = frozenset({"done", "stopped"})
+
+
+@dataclass
+class WatchEvent:
+    """A change seen by ScheduleWatcher"""
+    schedule_id: int
+    kind: str  # "status" or "stats"
+    old: Any
+    new: Any
+
+
+class Subscription:
+    """Handle returned by ScheduleWatcher.subscribe"""
+
+    def __init__(
+        self,
+        watcher: "ScheduleWatcher",
+        schedule_ids: Set[int],
+        callback: Callable[[WatchEvent], None],
+        stats: bool,
+    ):
+        self.watcher = watcher
+        self.schedule_ids = schedule_ids
+        self.callback = callback
+        self.stats = stats
+
+    def unsubscribe(self) -> None:
+        self.watcher.unsubscribe(self)
+
+
+class _Watch:
+    def __init__(self, schedule_id: int):
+        self.schedule_id = schedule_id
+        self.status: Optional[str] = None
+        self.stats: Optional[Dict[str, Any]] = None
+        self.interval = 0.0
+        self.next_poll = 0.0
+
+
+class ScheduleWatcher:
+    """
+    Watch schedules and call back only when their status or stats change
+
+    All subscribers share one background thread and one get_schedules
+    call per poll. Each schedule is polled at the base interval for its
+    status (fast while sending, slow while queued); the interval doubles,
+    up to max_interval, while nothing changes and resets on a change.
+    Subscribers asking for stats also get get_campaign_stats diffs while
+    a schedule is sending. Use ScheduleWatcher.shared(client) to get the
+    process-wide watcher for a client.
+
+    Example:
+        watcher = ScheduleWatcher.shared(client)
+        subscription = watcher.subscribe(
+            [101, 102],
+            lambda e: print(e.schedule_id, e.kind, e.old, '->', e.new),
+            stats=True,
+        )
+        ...
+        subscription.unsubscribe()
+    """
+
+    _shared: Dict[ADSMedia, "ScheduleWatcher"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        client: ADSMedia,
+        intervals: Optional[Dict[str, float]] = None,
+        default_interval: float = 30.0,
+        max_interval: float = 300.0,
+        backoff: float = 2.0,
+        concurrency: int = 8,
+    ):
+        self.client = client
+        self.intervals = dict(DEFAULT_INTERVALS, **(intervals or {}))
+        self.default_interval = default_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.concurrency = concurrency
+        self._watches: Dict[int, _Watch] = {}
+        self._subscriptions: List[Subscription] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def shared(cls, client: ADSMedia, **kwargs: Any) -> "ScheduleWatcher":
+        """The process-wide watcher for client (kwargs apply on first use)"""
+        with cls._shared_lock:
+            watcher = cls._shared.get(client)
+            if watcher is None:
+                watcher = cls._shared[client] = cls(client, **kwargs)
+            return watcher
+
+    # ===== Subscriptions =====
+
+    def subscribe(
+        self,
+        schedule_ids: Iterable[int],
+        callback: Callable[[WatchEvent], None],
+        stats: bool = False,
+        start: bool = True,
+    ) -> Subscription:
+        """
+        Call callback with a WatchEvent for every change of the schedules
+
+        Every schedule's current status is reported first (old=None): by
+        the first poll for schedules not watched yet, and right away, from
+        the calling thread, for schedules another subscriber already watches.
+        With start=False no thread is started; call poll_once() yourself.
+        """
+        subscription = Subscription(self, set(schedule_ids), callback, stats)
+        known: List[WatchEvent] = []
+        with self._lock:
+            self._subscriptions.append(subscription)
+            for schedule_id in subscription.schedule_ids:
+                watch = self._watches.get(schedule_id)
+                if watch is None:
+                    self._watches[schedule_id] = _Watch(schedule_id)
+                    continue
+                # Already watched: a poll only reports changes, so hand the
+                # new subscriber the last known state now
+                if watch.status is not None:
+                    known.append(WatchEvent(schedule_id, "status", None, watch.status))
+                if stats and watch.stats is not None:
+                    known.append(WatchEvent(schedule_id, "stats", None, watch.stats))
+                elif stats and watch.status == "sending":
+                    watch.next_poll = 0.0
+        for event in known:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Schedule watcher callback failed")
+        if start:
+            self.start()
+        self._wake.set()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+            wanted = self._wanted()
+            for schedule_id in list(self._watches):
+                if schedule_id not in wanted:
+                    del self._watches[schedule_id]
+            idle = not self._subscriptions
+        if idle:
+            self.stop()
+
+    def _wanted(self) -> Set[int]:
+        wanted: Set[int] = set()
+        for subscription in self._subscriptions:
+            wanted |= subscription.schedule_ids
+        return wanted
+
+    # ===== Polling =====
+
+    def _base_interval(self, status: Optional[str]) -> float:
+        if status is None:
+            return self.default_interval
+        return self.intervals.get(status, self.default_interval)
+
+    def _reschedule(self, watch: _Watch, changed: bool, now: float) -> None:
+        base = self._base_interval(watch.status)
+        if changed or watch.interval < base:
+            watch.interval = base
+        else:
+            watch.interval = min(watch.interval * self.backoff, max(base, self.max_interval))
+        watch.next_poll = now + watch.interval
+
+    def _fetch_stats(self, schedule_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        if not schedule_ids:
+            return {}
+
+        def fetch(schedule_id: int) -> Optional[Dict[str, Any]]:
+            try:
+                return self.client.get_campaign_stats(schedule_id)
+            except ADSMediaError:
+                return None
+
+        with ThreadPoolExecutor(min(self.concurrency, len(schedule_ids))) as executor:
+            results = dict(zip(schedule_ids, executor.map(fetch, schedule_ids)))
+        return {k: v for k, v in results.items() if v is not None}
+
+    def poll_once(self) -> List[WatchEvent]:
+        """Poll the schedules that are due and dispatch changes"""
+        now = time.monotonic()
+        with self._lock:
+            due = [w for w in self._watches.values() if w.next_poll <= now]
+            stats_ids = set()
+            for subscription in self._subscriptions:
+                if subscription.stats:
+                    stats_ids |= subscription.schedule_ids
+        if not due:
+            return []
+
+        try:
+            schedules = self.client.get_schedules() or []
+        except ADSMediaError:
+            with self._lock:
+                for watch in due:
+                    watch.interval = min(max(watch.interval, 1.0) * self.backoff, self.max_interval)
+                    watch.next_poll = now + watch.interval
+            return []
+        statuses = {int(s["id"]): s.get("status") for s in schedules if s.get("id") is not None}
+
+        events: List[WatchEvent] = []
+        changed: Set[int] = set()
+        with self._lock:
+            watches = list(self._watches.values())
+        for watch in watches:
+            # Stopped schedules are deleted and drop out of the listing
+            status = statuses.get(watch.schedule_id)
+            if status is None:
+                status = "stopped" if watch.status is not None else None
+            if status is not None and status != watch.status:
+                events.append(WatchEvent(watch.schedule_id, "status", watch.status, status))
+                watch.status = status
+                changed.add(watch.schedule_id)
+
+        stats_due = [
+            w.schedule_id for w in due
+            if w.schedule_id in stats_ids and (w.status == "sending" or w.schedule_id in changed)
+        ]
+        for schedule_id, stats in self._fetch_stats(stats_due).items():
+            watch = self._watches.get(schedule_id)
+            if watch is not None and stats != watch.stats:
+                events.append(WatchEvent(schedule_id, "stats", watch.stats, stats))
+                watch.stats = stats
+                changed.add(schedule_id)
+
+        due_ids = {w.schedule_id for w in due}
+        with self._lock:
+            for watch in watches:
+                if watch.schedule_id in due_ids or watch.schedule_id in changed:
+                    self._reschedule(watch, watch.schedule_id in changed, now)
+        self._dispatch(events)
+
+        with self._lock:
+            for watch in watches:
+                if watch.status in FINAL_STATES:
+                    self._watches.pop(watch.schedule_id, None)
+        return events
+
+    def _dispatch(self, events: List[WatchEvent]) -> None:
+        if not events:
+            return
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            for event in events:
+                if event.schedule_id not in subscription.schedule_ids:
+                    continue
+                if event.kind == "stats" and not subscription.stats:
+                    continue
+                try:
+                    subscription.callback(event)
+                except Exception:
+                    logger.exception("Schedule watcher callback failed")
+
+    def _seconds_until_due(self) -> float:
+        with self._lock:
+            if not self._watches:
+                return self.max_interval
+            upcoming = min(w.next_poll for w in self._watches.values())
+        return max(0.0, upcoming - time.monotonic())
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.poll_once()
+            self._wake.wait(self._seconds_until_due())
+            self._wake.clear()
+
+    def start(self) -> None:
+        """Start the background polling thread"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="adsmedia-schedule-watcher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        self._wake.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
@@ -0,0 +1,440 @@
+"""
+ASGI webhook receiver that turns incoming events into emails
+
+Run with any ASGI server:
+    uvicorn --factory adsmedia.webhooks:create_app
+
+Events are accepted with 202 as soon as they are verified, rendered and
+queued; a background dispatcher drains the queue in batches and sends them
+concurrently over the client's pooled connections.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import html as html_lib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from .client import ADSMedia, ADSMediaError
+from .templates import compile_template
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_HEADER = "x-adsmedia-signature"
+EVENT_ID_HEADERS = ("x-webhook-id", "idempotency-key")
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class EventTemplate:
+    """
+    Subject and HTML for one event type, compiled once
+
+    Tags name keys of the values returned by context(data), e.g.
+    %%orderId%%. Values are HTML-escaped in the body unless listed in safe.
+    """
+
+    def __init__(
+        self,
+        subject: str,
+        html: str,
+        context: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        safe: Iterable[str] = (),
+    ):
+        self.subject = compile_template(subject, any_field=True)
+        self.html = compile_template(html, any_field=True)
+        self.context = context or (lambda data: data)
+        self.safe = frozenset(safe)
+
+    def render(self, data: Dict[str, Any]) -> Tuple[str, str]:
+        values = {
+            key: "" if value is None else str(value)
+            for key, value in self.context(data).items()
+        }
+        escaped = {
+            key: value if key in self.safe else html_lib.escape(value)
+            for key, value in values.items()
+        }
+        return self.subject.render(values), self.html.render(escaped)
+
+
+def _form_context(data: Dict[str, Any]) -> Dict[str, Any]:
+    fields = data.get("fields") or data
+    rows = "".join(
+        '<tr><td style="padding: 8px; border: 1px solid #ddd;"><strong>{}</strong></td>'
+        '<td style="padding: 8px; border: 1px solid #ddd;">{}</td></tr>'.format(
+            html_lib.escape(str(key)), html_lib.escape(str(value))
+        )
+        for key, value in (fields.items() if isinstance(fields, dict) else ())
+    )
+    return {
+        "formTitle": data.get("formName") or "Contact Form",
+        "formName": data.get("formName") or "Unknown",
+        "rows": rows,
+    }
+
+
+def _notification_context(data: Dict[str, Any]) -> Dict[str, Any]:
+    body = data.get("html") or data.get("message") or json.dumps(data)
+    return {"subject": data.get("subject") or "Notification", "body": body}
+
+
+# Same event types as webhooks/generic/webhook-handler.js
+DEFAULT_TEMPLATES: Dict[str, EventTemplate] = {
+    "form_submission": EventTemplate(
+        subject="New Form Submission: %%formTitle%%",
+        html=(
+            "<h1>New Form Submission</h1><p>Form: %%formName%%</p><h3>Submitted Data:</h3>"
+            '<table style="border-collapse: collapse; width: 100%;">%%rows%%</table>'
+        ),
+        context=_form_context,
+        safe=("rows",),
+    ),
+    "user_signup": EventTemplate(
+        subject="Welcome, %%title%%!",
+        html=(
+            "<h1>Welcome to Our Platform!</h1><p>Hi %%name%%,</p>"
+            "<p>Thank you for signing up. We're excited to have you!</p>"
+            "<p>Your account has been created with email: %%email%%</p>"
+        ),
+        context=lambda d: {
+            "title": d.get("name") or "New User",
+            "name": d.get("name") or "there",
+            "email": d.get("email"),
+        },
+    ),
+    "order_placed": EventTemplate(
+        subject="Order Confirmation #%%orderId%%",
+        html=(
+            "<h1>Thank You for Your Order!</h1><p>Order #%%orderId%%</p><p>Total: %%total%%</p>"
+            "<p>We'll send you tracking information when it ships.</p>"
+        ),
+        context=lambda d: {
+            "orderId": d.get("orderId") or d.get("id"),
+            "total": d.get("total") or d.get("amount"),
+        },
+    ),
+    "payment_received": EventTemplate(
+        subject="Payment Received - %%amount%%",
+        html=(
+            "<h1>Payment Confirmed</h1><p>Amount: %%amount%%</p>"
+            "<p>Transaction ID: %%transactionId%%</p><p>Thank you for your payment!</p>"
+        ),
+        context=lambda d: {
+            "amount": d.get("amount"),
+            "transactionId": d.get("transactionId") or d.get("id"),
+        },
+    ),
+    "appointment_booked": EventTemplate(
+        subject="Appointment Confirmed - %%date%%",
+        html=(
+            "<h1>Appointment Confirmed</h1><p>Date: %%date%%</p><p>Time: %%time%%</p>"
+            "<p>Service: %%service%%</p><p>We look forward to seeing you!</p>"
+        ),
+        context=lambda d: {
+            "date": d.get("date") or d.get("datetime"),
+            "time": d.get("time"),
+            "service": d.get("service") or d.get("type") or "Consultation",
+        },
+    ),
+    # Payload text is escaped; register a template with safe=("body",) to
+    # send HTML from trusted senders
+    "notification": EventTemplate(
+        subject="%%subject%%",
+        html="<p>%%body%%</p>",
+        context=_notification_context,
+    ),
+}
+
+
+def sign_payload(secret: str, body: bytes) -> str:
+    """Signature expected in the X-ADSMedia-Signature header"""
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(secret: str, body: bytes, signature: str) -> bool:
+    """Check a hex HMAC-SHA256 signature, with or without the sha256= prefix"""
+    if not signature:
+        return False
+    if not signature.startswith("sha256="):
+        signature = "sha256=" + signature
+    return hmac.compare_digest(sign_payload(secret, body), signature)
+
+
+class WebhookApp:
+    """
+    ASGI application receiving webhook events
+
+    POST any path with a JSON body. The event type comes from body.type,
+    body.event or the ?type= query parameter; the recipient from body.to,
+    body.email, body.recipient or default_to. GET /health returns queue and
+    delivery counters.
+
+    Requests must be signed with secret. With allow_unsigned=True and no
+    secret, unsigned requests are accepted but always go to default_to, so
+    the endpoint cannot be used to mail arbitrary addresses.
+
+    Example:
+        app = WebhookApp(
+            client=ADSMedia(api_key='your-api-key'),
+            secret='your-signing-secret',
+            default_to='ops@example.com',
+        )
+    """
+
+    def __init__(
+        self,
+        client: Optional[ADSMedia] = None,
+        secret: Optional[str] = None,
+        default_to: Optional[str] = None,
+        from_name: str = "Webhook Notification",
+        templates: Optional[Dict[str, EventTemplate]] = None,
+        queue_size: int = 10000,
+        concurrency: int = 32,
+        batch_size: int = 100,
+        max_body_size: int = 1024 * 1024,
+        on_error: Optional[Callable[[Dict[str, Any], Exception], None]] = None,
+        allow_unsigned: bool = False,
+    ):
+        if not secret:
+            if not allow_unsigned:
+                raise ValueError(
+                    "A webhook signing secret is required; pass allow_unsigned=True "
+                    "to accept unsigned requests (sent to default_to only)"
+                )
+            if not default_to:
+                raise ValueError("allow_unsigned=True requires default_to")
+        if client is None:
+            api_key = os.environ.get("ADSMEDIA_API_KEY")
+            if not api_key:
+                raise ValueError("ADSMEDIA_API_KEY not configured")
+            client = ADSMedia(api_key=api_key, pool_maxsize=concurrency)
+        self.client = client
+        self.secret = secret
+        self.default_to = default_to
+        self.from_name = from_name
+        self.templates = dict(DEFAULT_TEMPLATES)
+        if templates:
+            self.templates.update(templates)
+        self.queue_size = queue_size
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.max_body_size = max_body_size
+        self.on_error = on_error
+
+        self.received = 0
+        self.sent = 0
+        self.failed = 0
+        self._counter_lock = threading.Lock()
+        self._queue: Optional["asyncio.Queue[Dict[str, Any]]"] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._dispatcher: Optional["asyncio.Task[None]"] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    # ===== ASGI =====
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        if scope["method"] == "GET" and scope["path"].rstrip("/").endswith("/health"):
+            await self._respond(send, 200, self.stats())
+            return
+        if scope["method"] != "POST":
+            await self._respond(send, 405, {"error": "Method not allowed"})
+            return
+
+        status, payload = await self._handle(scope, receive)
+        await self._respond(send, status, payload)
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self._ensure_started()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _handle(self, scope: Scope, receive: Receive) -> Tuple[int, Dict[str, Any]]:
+        body = await self._read_body(receive)
+        if body is None:
+            return 413, {"error": "Payload too large"}
+
+        headers = {
+            key.decode("latin-1").lower(): value.decode("latin-1")
+            for key, value in scope.get("headers", [])
+        }
+        signed = bool(self.secret)
+        if signed and not verify_signature(self.secret, body, headers.get(SIGNATURE_HEADER, "")):
+            return 401, {"error": "Invalid signature"}
+
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            return 400, {"error": "Invalid JSON"}
+        if not isinstance(payload, dict):
+            return 400, {"error": "JSON object expected"}
+
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        event_type = (
+            payload.get("type") or payload.get("event") or query.get("type", ["notification"])[0]
+        )
+        template = self.templates.get(event_type) or self.templates["notification"]
+
+        if signed:
+            to = payload.get("to") or payload.get("email") or payload.get("recipient") or self.default_to
+        else:
+            # Unauthenticated callers must not choose who gets mail
+            to = self.default_to
+        if not to:
+            return 400, {"error": "Recipient email required"}
+
+        data = payload.get("data") or payload
+        if not isinstance(data, dict):
+            data = {"message": str(data)}
+        subject, html = template.render(data)
+
+        job = {
+            "to": to,
+            "subject": subject,
+            "html": html,
+            "from_name": (payload.get("from_name") if signed else None) or self.from_name,
+        }
+        event_id = next((headers[h] for h in EVENT_ID_HEADERS if headers.get(h)), None)
+        if event_id:
+            # Redelivered webhooks carry the same ID; the key stops a second send
+            job["idempotency_key"] = f"webhook-{event_id}"
+
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            return 503, {"error": "Queue full, retry later"}
+        with self._counter_lock:
+            self.received += 1
+        return 202, {"success": True, "queued": True}
+
+    async def _read_body(self, receive: Receive) -> Optional[bytes]:
+        chunks: List[bytes] = []
+        size = 0
+        while True:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_size:
+                return None
+            chunks.append(chunk)
+            if not message.get("more_body"):
+                return b"".join(chunks)
+
+    @staticmethod
+    async def _respond(send: Send, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    # ===== Delivery =====
+
+    def _ensure_started(self) -> None:
+        if self._dispatcher is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._executor = ThreadPoolExecutor(self.concurrency, thread_name_prefix="adsmedia-webhook")
+        self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            jobs = [await self._queue.get()]
+            while len(jobs) < self.batch_size:
+                try:
+                    jobs.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            for job in jobs:
+                await self._slots.acquire()
+                future = loop.run_in_executor(self._executor, self._deliver, job)
+                future.add_done_callback(self._delivered)
+
+    def _delivered(self, future: "asyncio.Future[None]") -> None:
+        self._slots.release()
+        self._queue.task_done()
+
+    def _deliver(self, job: Dict[str, Any]) -> None:
+        try:
+            self.client.send(**job)
+        except Exception as e:
+            with self._counter_lock:
+                self.failed += 1
+            if isinstance(e, ADSMediaError):
+                logger.warning("Webhook email to %s failed: %s", job["to"], e.message)
+            else:
+                logger.exception("Webhook email to %s failed", job["to"])
+            if self.on_error is not None:
+                try:
+                    self.on_error(job, e)
+                except Exception:
+                    logger.exception("Webhook on_error callback failed")
+            return
+        with self._counter_lock:
+            self.sent += 1
+
+    async def shutdown(self, timeout: float = 30.0) -> None:
+        """Deliver what is queued (up to timeout seconds), then stop"""
+        if self._dispatcher is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Dropping %d queued webhook emails on shutdown", self._queue.qsize())
+        self._dispatcher.cancel()
+        self._executor.shutdown(wait=False)
+        self._dispatcher = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "received": self.received,
+            "sent": self.sent,
+            "failed": self.failed,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+        }
+
+
+def create_app(**kwargs: Any) -> WebhookApp:
+    """
+    Build the app from environment variables
+
+    ADSMEDIA_API_KEY, ADSMEDIA_WEBHOOK_SECRET and NOTIFICATION_EMAIL set the
+    API key, signing secret and default recipient, and
+    ADSMEDIA_WEBHOOK_ALLOW_UNSIGNED=1 accepts unsigned requests; keyword
+    arguments override them.
+    """
+    kwargs.setdefault("secret", os.environ.get("ADSMEDIA_WEBHOOK_SECRET"))
+    kwargs.setdefault(
+        "allow_unsigned",
+        os.environ.get("ADSMEDIA_WEBHOOK_ALLOW_UNSIGNED", "").lower() in ("1", "true", "yes"),
+    )
+    kwargs.setdefault("default_to", os.environ.get("NOTIFICATION_EMAIL"))
+    return WebhookApp(**kwargs)
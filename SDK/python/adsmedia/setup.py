@@ -37,6 +37,9 @@ setup(
     ],
     extras_require={
         "async": ["aiohttp>=3.8.0"],
+        "dns": ["dnspython>=2.0.0"],
+        "httpx": ["httpx>=0.24.0"],
+        "br": ["brotli>=1.0.9"],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
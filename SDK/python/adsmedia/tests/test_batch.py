@@ -0,0 +1,28 @@
+"""Batch send results as integrations read them"""
+
+from adsmedia import ADSMedia, FakeTransport
+
+
+def client(*responses):
+    transport = FakeTransport()
+    transport.route("POST", "/send/batch", *responses)
+    return transport, ADSMedia(api_key="test", transport=transport)
+
+
+def test_queued_count_is_recipients_count():
+    transport, ads = client({"success": True, "data": {"task_id": 7, "recipients_count": 2}})
+    result = ads.send_batch(
+        [{"email": "a@example.com"}, {"email": "B@example.com"}, {"email": "not-an-address"}],
+        subject="Hi", html="<p>Hi</p>", validate=True,
+    )
+    assert result["recipients_count"] == 2
+    assert [email for email, _ in result["invalid"]] == ["not-an-address"]
+    assert len(transport.calls[0].json["recipients"]) == 2
+
+
+def test_empty_batch_reports_zero_without_sending():
+    transport, ads = client()
+    result = ads.send_batch([{"email": "nope"}], subject="Hi", html="<p>Hi</p>", validate=True)
+    assert result["task_id"] is None
+    assert result["recipients_count"] == 0
+    assert transport.calls == []
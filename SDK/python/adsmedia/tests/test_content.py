@@ -0,0 +1,22 @@
+"""ContentCampaigns.send_chunked validation across chunks"""
+
+from adsmedia import ADSMedia, CampaignCache, ContentCampaigns, FakeTransport
+
+
+def test_duplicates_across_chunks_are_dropped_once():
+    transport = FakeTransport()
+    transport.route("POST", "/campaigns/create", {"success": True, "data": {"id": 5}})
+    transport.route("POST", "/lists/create", {"success": True, "data": {"id": 9}})
+    transport.route("POST", "/lists/contacts/add", {"success": True, "data": {}})
+    transport.route("POST", "/schedules/create", {"success": True, "data": {"id": 1}})
+    campaigns = ContentCampaigns(ADSMedia(api_key="test", transport=transport), cache=CampaignCache())
+
+    result = campaigns.send_chunked(
+        ["a@example.com", "b@example.com", "A@Example.com", "bad"],
+        subject="Hi", html="<p>Hi</p>", server_id=1, chunk_size=2, validate=True,
+    )
+
+    uploads = [c.json["contacts"] for c in transport.calls if c.endpoint == "/lists/contacts/add"]
+    assert uploads == [[{"email": "a@example.com"}, {"email": "b@example.com"}]]
+    assert result["added"] == 2
+    assert sorted(reason for _, reason in result["invalid"]) == ["duplicate", "invalid"]
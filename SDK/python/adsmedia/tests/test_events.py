@@ -0,0 +1,36 @@
+"""EventTailer survives a failing callback"""
+
+from adsmedia import ADSMedia, EventTailer, FakeTransport, MemoryCheckpointStore
+
+EVENTS = {"success": True, "data": [{"email": "a@example.com"}]}
+
+
+def test_failing_callback_keeps_checkpoint_and_retries():
+    transport = FakeTransport()
+    transport.route("GET", "/stats/events", EVENTS)
+    received = []
+
+    def on_event(task_id, event):
+        if not received:
+            received.append(None)
+            raise RuntimeError("warehouse down")
+        received.append(event)
+
+    checkpoints = MemoryCheckpointStore()
+    tailer = EventTailer(
+        ADSMedia(api_key="test", transport=transport),
+        task_ids=[7],
+        types=["open"],
+        checkpoints=checkpoints,
+        on_event=on_event,
+        min_interval=1.0,
+    )
+    assert tailer.poll_once() == []
+    assert checkpoints.get((7, "open")) == 0
+    stream = tailer._streams[(7, "open")]
+    assert stream.interval == 2.0
+
+    stream.next_poll = 0.0
+    tailer.poll_once()
+    assert received[1:] == [{"email": "a@example.com", "type": "open"}]
+    assert checkpoints.get((7, "open")) == 1
@@ -0,0 +1,35 @@
+"""Fail-over between ClientPool members"""
+
+import pytest
+
+from adsmedia import ADSMedia, ADSMediaError, ClientPool, FakeTransport
+
+SENT = {"success": True, "data": {"message_id": "m1"}}
+
+
+def member(*responses):
+    transport = FakeTransport()
+    transport.route("POST", "/send", *responses)
+    return transport, ADSMedia(api_key="test", transport=transport)
+
+
+def send(pool):
+    return pool.send(to="user@example.com", subject="Hi", html="<p>Hi</p>")
+
+
+@pytest.mark.parametrize("status", [500, 502, 504])
+def test_server_error_is_not_failed_over(status):
+    first, client_a = member((status, {"error": {"message": "upstream"}}))
+    second, client_b = member(SENT)
+    with pytest.raises(ADSMediaError):
+        send(ClientPool([client_a, client_b]))
+    assert len(first.calls) == 1
+    assert second.calls == []
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_unprocessed_send_fails_over(status):
+    first, client_a = member((status, {"error": {"message": "busy"}}))
+    second, client_b = member(SENT)
+    assert send(ClientPool([client_a, client_b]))["message_id"] == "m1"
+    assert len(second.calls) == 1
@@ -0,0 +1,27 @@
+"""QuotaScheduler gives back quota a failed request did not use"""
+
+import pytest
+
+from adsmedia import ADSMedia, ADSMediaError, FakeTransport, QuotaScheduler
+
+SERVERS = {"success": True, "data": [{"id": 1, "daily_limit": 1000, "sent_today": 0}]}
+
+
+def scheduler(*responses):
+    transport = FakeTransport()
+    transport.route("GET", "/servers", SERVERS)
+    transport.route("POST", "/schedules/create", *responses)
+    return QuotaScheduler(ADSMedia(api_key="test", transport=transport, max_retries=0))
+
+
+def test_failed_schedule_releases_quota():
+    sched = scheduler((400, {"error": {"message": "unknown list"}}))
+    with pytest.raises(ADSMediaError):
+        sched.create_schedule(campaign_id=1, list_id=2, list_size=600)
+    assert sched.quotas[1].remaining == 1000
+
+
+def test_created_schedule_keeps_quota():
+    sched = scheduler({"success": True, "data": {"id": 9}})
+    sched.create_schedule(campaign_id=1, list_id=2, list_size=600)
+    assert sched.quotas[1].remaining == 400
@@ -0,0 +1,58 @@
+"""Incremental parsing of streamed list responses"""
+
+import json
+
+import pytest
+
+from adsmedia.streaming import JSONArrayStream
+
+DOCUMENTS = [
+    b'[-2500.0, 123, 45, 1e3, -0.5E-2, 7]',
+    b'[true, false, null, "a,b]", {"n": [1, 2]}, []]',
+    b'{"success": true, "data": [{"email": "\xc3\xa9l\xc3\xa8ve@example.com", "id": 12}, 3.25], "total": 1024}',
+    b'{"data": [], "page": 10}',
+    b' [ 1 ,\n 22 ,\t 333 ] ',
+]
+
+
+def parse(chunks):
+    stream = JSONArrayStream()
+    items = []
+    for chunk in chunks:
+        items.extend(stream.feed(chunk))
+    items.extend(stream.close())
+    return items, stream.envelope
+
+
+def expected(document):
+    value = json.loads(document)
+    if isinstance(value, list):
+        return value, {}
+    return value.pop("data"), value
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_split_at_every_offset(document):
+    for offset in range(len(document) + 1):
+        assert parse([document[:offset], document[offset:]]) == expected(document), offset
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_one_byte_at_a_time(document):
+    chunks = [document[i:i + 1] for i in range(len(document))]
+    assert parse(chunks) == expected(document)
+
+
+def test_number_is_held_until_a_delimiter_arrives():
+    stream = JSONArrayStream()
+    assert stream.feed(b"[123") == []
+    assert stream.feed(b"45") == []
+    assert stream.feed(b"]") == [12345]
+
+
+@pytest.mark.parametrize("document", [b"[1, 2", b'{"data": [1]', b"[1, {"])
+def test_truncated_document_raises(document):
+    stream = JSONArrayStream()
+    stream.feed(document)
+    with pytest.raises(ValueError):
+        stream.close()
@@ -0,0 +1,16 @@
+"""SuppressionIndex stays usable after a failed bulk insert"""
+
+import sqlite3
+
+import pytest
+
+from adsmedia import SuppressionIndex
+
+
+def test_failed_add_many_rolls_back():
+    index = SuppressionIndex()
+    with pytest.raises(sqlite3.Error):
+        # The second row cannot be bound, after the first was inserted
+        index.add_many([("a@example.com", "bounce", None), ("b@example.com", "bounce", object())])
+    assert not index.is_suppressed("a@example.com")
+    assert index.add_many([("a@example.com", "bounce", None)]) == 1
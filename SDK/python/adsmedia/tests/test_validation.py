@@ -0,0 +1,33 @@
+"""MXCache treats only definite answers as evidence."""
+
+from adsmedia.validation import MXCache
+
+
+def counting(answer):
+    calls = []
+
+    def resolver(domain):
+        calls.append(domain)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    return resolver, calls
+
+
+def test_lookup_failure_is_deliverable_and_not_cached():
+    resolver, calls = counting(TimeoutError("lifetime expired"))
+    cache = MXCache(resolver=resolver)
+
+    assert cache.check_many(["example.com"]) == {"example.com": True}
+    assert cache.check_many(["example.com"]) == {"example.com": True}
+    assert calls == ["example.com", "example.com"]
+
+
+def test_no_mail_is_cached():
+    resolver, calls = counting(False)
+    cache = MXCache(resolver=resolver)
+
+    assert cache.check_many(["nowhere.invalid"]) == {"nowhere.invalid": False}
+    assert cache.check_many(["nowhere.invalid"]) == {"nowhere.invalid": False}
+    assert calls == ["nowhere.invalid"]
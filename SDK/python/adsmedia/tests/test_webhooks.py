@@ -0,0 +1,72 @@
+"""Webhook receiver authentication, escaping and delivery failures"""
+
+import asyncio
+import json
+
+import pytest
+
+from adsmedia import ADSMedia, FakeTransport
+from adsmedia.webhooks import WebhookApp, sign_payload
+
+
+def client():
+    transport = FakeTransport()
+    return transport, ADSMedia(api_key="test", transport=transport)
+
+
+def post(app, payload, secret=None):
+    body = json.dumps(payload).encode()
+    headers = [(b"x-adsmedia-signature", sign_payload(secret, body).encode())] if secret else []
+    scope = {"type": "http", "method": "POST", "path": "/", "headers": headers, "query_string": b""}
+    responses = []
+
+    async def receive():
+        return {"type": "http.request", "body": body}
+
+    async def send(message):
+        responses.append(message)
+
+    async def run():
+        await app(scope, receive, send)
+        await app.shutdown()
+
+    asyncio.run(run())
+    return responses[0]["status"]
+
+
+def test_secret_is_required():
+    with pytest.raises(ValueError):
+        WebhookApp(client=client()[1], default_to="ops@example.com")
+
+
+def test_unsigned_mode_only_mails_default_recipient():
+    transport, api = client()
+    app = WebhookApp(client=api, default_to="ops@example.com", allow_unsigned=True)
+    assert post(app, {"to": "victim@example.com", "message": "hi"}) == 202
+    assert [call.json["to"] for call in transport.calls] == ["ops@example.com"]
+
+
+def test_bad_signature_is_rejected():
+    transport, api = client()
+    app = WebhookApp(client=api, secret="s3cret")
+    assert post(app, {"to": "user@example.com"}, secret="wrong") == 401
+    assert transport.calls == []
+
+
+def test_notification_body_is_escaped():
+    transport, api = client()
+    app = WebhookApp(client=api, secret="s3cret")
+    payload = {"to": "user@example.com", "message": "<script>x</script>"}
+    assert post(app, payload, secret="s3cret") == 202
+    assert "<script>" not in transport.calls[0].json["html"]
+    assert "&lt;script&gt;" in transport.calls[0].json["html"]
+
+
+def test_unexpected_send_errors_are_counted():
+    transport, api = client()
+    transport.route("POST", "/send", RuntimeError("boom"))
+    errors = []
+    app = WebhookApp(client=api, secret="s3cret", on_error=lambda job, e: errors.append(e))
+    assert post(app, {"to": "user@example.com", "message": "hi"}, secret="s3cret") == 202
+    assert app.stats()["failed"] == 1
+    assert isinstance(errors[0], RuntimeError)
@@ -2,72 +2,98 @@
 ADSMedia Discord Bot
 Send emails via Discord slash commands
 
-pip install discord.py requests python-dotenv
+pip install discord.py "adsmedia[async]" python-dotenv
 """
 
 import os
+import time
+from typing import Dict, Optional, Tuple
+
+import aiohttp
 import discord
 from discord import app_commands
-import requests
 from dotenv import load_dotenv
 
+from adsmedia import ADSMediaError, AiohttpTransport, AsyncADSMedia
+
 load_dotenv()
 
 DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
 ADSMEDIA_API_KEY = os.getenv("ADSMEDIA_API_KEY")
-API_BASE_URL = "https://api.adsmedia.live/v1"
+ADSMEDIA_BASE_URL = os.getenv("ADSMEDIA_BASE_URL", "https://api.adsmedia.live/v1")
+# Requests to ADSMedia in flight at once, across all guilds
+MAX_CONCURRENCY = int(os.getenv("ADSMEDIA_MAX_CONCURRENCY", "20"))
+# Resends of failed requests; off unless configured
+MAX_RETRIES = int(os.getenv("ADSMEDIA_MAX_RETRIES", "0"))
+# Commands each guild may run per minute
+GUILD_RATE_LIMIT = float(os.getenv("GUILD_RATE_LIMIT", "30"))
+
+
+class GuildRateLimiter:
+    """Token bucket per guild (per user in DMs), refilled continuously"""
+
+    def __init__(self, per_minute: float, burst: Optional[float] = None):
+        self.rate = per_minute / 60.0
+        self.burst = burst if burst is not None else max(1.0, per_minute / 6)
+        self._buckets: Dict[int, Tuple[float, float]] = {}  # key -> (tokens, updated)
+
+    def acquire(self, key: int) -> float:
+        """Take a token; returns 0, or the seconds to wait if the bucket is empty"""
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - updated) * self.rate)
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            return (1 - tokens) / self.rate
+        self._buckets[key] = (tokens - 1, now)
+        return 0.0
+
+
+class RateLimitedTree(app_commands.CommandTree):
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        key = interaction.guild_id or interaction.user.id
+        retry_after = self.client.limiter.acquire(key)
+        if retry_after:
+            await interaction.response.send_message(
+                f"⏳ Too many commands in this server, try again in {retry_after:.0f}s",
+                ephemeral=True,
+            )
+            return False
+        return True
 
 
 class ADSMediaBot(discord.Client):
     def __init__(self):
         intents = discord.Intents.default()
         super().__init__(intents=intents)
-        self.tree = app_commands.CommandTree(self)
+        self.tree = RateLimitedTree(self)
+        self.limiter = GuildRateLimiter(GUILD_RATE_LIMIT)
+        self.adsmedia: Optional[AsyncADSMedia] = None
 
     async def setup_hook(self):
+        # One pooled session for every command, opened inside the bot's event loop
+        session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=MAX_CONCURRENCY))
+        self.adsmedia = AsyncADSMedia(
+            api_key=ADSMEDIA_API_KEY,
+            base_url=ADSMEDIA_BASE_URL,
+            transport=AiohttpTransport(session=session),
+            max_concurrency=MAX_CONCURRENCY,
+            max_retries=MAX_RETRIES,
+        )
         await self.tree.sync()
 
+    async def close(self):
+        if self.adsmedia is not None:
+            await self.adsmedia.aclose()
+        await super().close()
+
 
 client = ADSMediaBot()
 
 
-def send_email_api(to: str, subject: str, html: str, from_name: str = None) -> dict:
-    """Call ADSMedia API to send email."""
-    payload = {"to": to, "subject": subject, "html": html}
-    if from_name:
-        payload["from_name"] = from_name
-    
-    response = requests.post(
-        f"{API_BASE_URL}/send",
-        headers={
-            "Authorization": f"Bearer {ADSMEDIA_API_KEY}",
-            "Content-Type": "application/json",
-        },
-        json=payload,
-        timeout=30,
-    )
-    return response.json()
-
-
-def check_suppression_api(email: str) -> dict:
-    """Check if email is suppressed."""
-    response = requests.get(
-        f"{API_BASE_URL}/suppressions/check",
-        headers={"Authorization": f"Bearer {ADSMEDIA_API_KEY}"},
-        params={"email": email},
-        timeout=30,
-    )
-    return response.json()
-
-
-def get_usage_api() -> dict:
-    """Get account usage."""
-    response = requests.get(
-        f"{API_BASE_URL}/account/usage",
-        headers={"Authorization": f"Bearer {ADSMEDIA_API_KEY}"},
-        timeout=30,
-    )
-    return response.json()
+def error_embed(title: str, error: Exception) -> discord.Embed:
+    message = error.message if isinstance(error, ADSMediaError) else str(error)
+    return discord.Embed(title=title, description=message or "Unknown error", color=discord.Color.red())
 
 
 @client.event
@@ -86,26 +112,19 @@ async def send_email(interaction: discord.Interaction, to: str, subject: str, me
     await interaction.response.defer(ephemeral=True)
     
     try:
-        result = send_email_api(to, subject, message)
+        result = await client.adsmedia.send(to=to, subject=subject, html=message)
         
-        if result.get("success"):
-            embed = discord.Embed(
-                title="✅ Email Sent!",
-                color=discord.Color.green(),
-            )
-            embed.add_field(name="To", value=to, inline=True)
-            embed.add_field(name="Subject", value=subject, inline=True)
-            embed.add_field(name="Message ID", value=result["data"]["message_id"], inline=False)
-        else:
-            embed = discord.Embed(
-                title="❌ Failed to Send",
-                description=result.get("error", "Unknown error"),
-                color=discord.Color.red(),
-            )
-        
-        await interaction.followup.send(embed=embed, ephemeral=True)
+        embed = discord.Embed(
+            title="✅ Email Sent!",
+            color=discord.Color.green(),
+        )
+        embed.add_field(name="To", value=to, inline=True)
+        embed.add_field(name="Subject", value=subject, inline=True)
+        embed.add_field(name="Message ID", value=result.get("message_id", "N/A"), inline=False)
     except Exception as e:
-        await interaction.followup.send(f"❌ Error: {str(e)}", ephemeral=True)
+        embed = error_embed("❌ Failed to Send", e)
+    
+    await interaction.followup.send(embed=embed, ephemeral=True)
 
 
 @client.tree.command(name="check", description="Check if an email is suppressed")
@@ -114,33 +133,25 @@ async def check_email(interaction: discord.Interaction, email: str):
     await interaction.response.defer(ephemeral=True)
     
     try:
-        result = check_suppression_api(email)
+        data = await client.adsmedia.check_suppression(email)
         
-        if result.get("success"):
-            data = result["data"]
-            if data.get("suppressed"):
-                embed = discord.Embed(
-                    title="⚠️ Email Suppressed",
-                    description=f"`{email}` is suppressed",
-                    color=discord.Color.orange(),
-                )
-                embed.add_field(name="Reason", value=data.get("reason", "Unknown"))
-            else:
-                embed = discord.Embed(
-                    title="✅ Email OK",
-                    description=f"`{email}` is not suppressed - safe to send!",
-                    color=discord.Color.green(),
-                )
+        if data.get("suppressed"):
+            embed = discord.Embed(
+                title="⚠️ Email Suppressed",
+                description=f"`{email}` is suppressed",
+                color=discord.Color.orange(),
+            )
+            embed.add_field(name="Reason", value=data.get("reason", "Unknown"))
         else:
             embed = discord.Embed(
-                title="❌ Error",
-                description=result.get("error", "Unknown error"),
-                color=discord.Color.red(),
+                title="✅ Email OK",
+                description=f"`{email}` is not suppressed - safe to send!",
+                color=discord.Color.green(),
             )
-        
-        await interaction.followup.send(embed=embed, ephemeral=True)
     except Exception as e:
-        await interaction.followup.send(f"❌ Error: {str(e)}", ephemeral=True)
+        embed = error_embed("❌ Error", e)
+    
+    await interaction.followup.send(embed=embed, ephemeral=True)
 
 
 @client.tree.command(name="usage", description="View ADSMedia account usage")
@@ -148,28 +159,20 @@ async def usage(interaction: discord.Interaction):
     await interaction.response.defer(ephemeral=True)
     
     try:
-        result = get_usage_api()
-        
-        if result.get("success"):
-            data = result["data"]
-            embed = discord.Embed(
-                title="📊 ADSMedia Usage",
-                color=discord.Color.blue(),
-            )
-            embed.add_field(name="Servers", value=data.get("servers", 0), inline=True)
-            embed.add_field(name="Lists", value=data.get("lists", 0), inline=True)
-            embed.add_field(name="Schedules", value=data.get("schedules", 0), inline=True)
-            embed.add_field(name="Sent This Month", value=data.get("sent_this_month", 0), inline=False)
-        else:
-            embed = discord.Embed(
-                title="❌ Error",
-                description=result.get("error", "Unknown error"),
-                color=discord.Color.red(),
-            )
+        data = await client.adsmedia.get_usage()
         
-        await interaction.followup.send(embed=embed, ephemeral=True)
+        embed = discord.Embed(
+            title="📊 ADSMedia Usage",
+            color=discord.Color.blue(),
+        )
+        embed.add_field(name="Servers", value=data.get("servers", 0), inline=True)
+        embed.add_field(name="Lists", value=data.get("lists", 0), inline=True)
+        embed.add_field(name="Schedules", value=data.get("schedules", 0), inline=True)
+        embed.add_field(name="Sent This Month", value=data.get("sent_this_month", 0), inline=False)
     except Exception as e:
-        await interaction.followup.send(f"❌ Error: {str(e)}", ephemeral=True)
+        embed = error_embed("❌ Error", e)
+    
+    await interaction.followup.send(embed=embed, ephemeral=True)
 
 
 @client.tree.command(name="ping", description="Test ADSMedia API connection")
@@ -177,30 +180,19 @@ async def ping(interaction: discord.Interaction):
     await interaction.response.defer(ephemeral=True)
     
     try:
-        response = requests.get(
-            f"{API_BASE_URL}/ping",
-            headers={"Authorization": f"Bearer {ADSMEDIA_API_KEY}"},
-            timeout=30,
-        )
-        result = response.json()
+        data = await client.adsmedia.ping()
         
-        if result.get("success"):
-            embed = discord.Embed(
-                title="✅ Connected!",
-                description="ADSMedia API is working",
-                color=discord.Color.green(),
-            )
-            embed.add_field(name="User ID", value=result["data"].get("userId", "N/A"))
-            embed.add_field(name="Version", value=result["data"].get("version", "N/A"))
-        else:
-            embed = discord.Embed(
-                title="❌ Connection Failed",
-                color=discord.Color.red(),
-            )
-        
-        await interaction.followup.send(embed=embed, ephemeral=True)
+        embed = discord.Embed(
+            title="✅ Connected!",
+            description="ADSMedia API is working",
+            color=discord.Color.green(),
+        )
+        embed.add_field(name="User ID", value=data.get("userId", "N/A"))
+        embed.add_field(name="Version", value=data.get("version", "N/A"))
     except Exception as e:
-        await interaction.followup.send(f"❌ Error: {str(e)}", ephemeral=True)
+        embed = error_embed("❌ Connection Failed", e)
+    
+    await interaction.followup.send(embed=embed, ephemeral=True)
 
 
 if __name__ == "__main__":
@@ -2,64 +2,86 @@
 ADSMedia Slack Bot
 Send emails via ADSMedia API from Slack
 
-pip install slack-bolt requests
+pip install slack-bolt adsmedia
 """
 
 import os
-import requests
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 
+from adsmedia import ADSMedia, ADSMediaError, shared_client
+
 # Configuration
 SLACK_BOT_TOKEN = os.environ.get("SLACK_BOT_TOKEN")
 SLACK_APP_TOKEN = os.environ.get("SLACK_APP_TOKEN")
 ADSMEDIA_API_KEY = os.environ.get("ADSMEDIA_API_KEY")
+# Commands processed at once after they are acknowledged
+WORKERS = int(os.environ.get("ADSMEDIA_WORKERS", "8"))
+# Resends of failed requests; off unless configured
+MAX_RETRIES = int(os.environ.get("ADSMEDIA_MAX_RETRIES", "0"))
 
-API_BASE_URL = "https://api.adsmedia.live/v1"
+MAX_BATCH_SIZE = 1000
+ADDRESS_SEPARATORS = re.compile(r"[\s,;]+")
 
 # Initialize Slack app
 app = App(token=SLACK_BOT_TOKEN)
 
+executor = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="adsmedia-slack")
 
-def adsmedia_request(endpoint: str, method: str = "GET", data: dict = None) -> dict:
-    """Make request to ADSMedia API"""
-    headers = {
-        "Authorization": f"Bearer {ADSMEDIA_API_KEY}",
-        "Content-Type": "application/json",
-    }
-    
-    url = f"{API_BASE_URL}{endpoint}"
-    
-    if method == "GET":
-        response = requests.get(url, headers=headers, params=data, timeout=30)
-    else:
-        response = requests.post(url, headers=headers, json=data, timeout=30)
-    
-    return response.json()
+
+def adsmedia() -> ADSMedia:
+    """The pooled client shared by every command, created on first use"""
+    return shared_client(ADSMEDIA_API_KEY, pool_maxsize=WORKERS * 2, max_retries=MAX_RETRIES)
+
+
+def in_background(say, func, *args):
+    """Run func on the worker pool, reporting unexpected errors to the channel"""
+    def run():
+        try:
+            func(say, *args)
+        except ADSMediaError as e:
+            say(f"❌ Error: {e.message}")
+        except Exception as e:
+            say(f"❌ Error: {str(e)}")
+    executor.submit(run)
+
+
+def split_addresses(text: str) -> Tuple[List[str], str]:
+    """Leading addresses (space or comma separated) and the rest of the text"""
+    addresses: List[str] = []
+    rest = text
+    while rest:
+        token, _, remainder = rest.lstrip().partition(" ")
+        if "@" not in token or "|" in token:
+            break
+        addresses.extend(a for a in ADDRESS_SEPARATORS.split(token) if a)
+        rest = remainder
+    return list(dict.fromkeys(addresses)), rest.strip()
 
 
 @app.command("/email")
 def handle_email_command(ack, say, command):
     """
     Handle /email slash command
-    Usage: /email user@example.com Subject line | Email body here
+    Usage: /email user@example.com[,other@example.com ...] Subject line | Email body here
     """
     ack()
     
     text = command.get("text", "").strip()
     
     if not text:
-        say("Usage: `/email user@example.com Subject | Body`")
+        say("Usage: `/email user@example.com[,other@example.com] Subject | Body`")
         return
     
-    parts = text.split(" ", 1)
-    if len(parts) < 2:
-        say("Please provide email address and content: `/email user@example.com Subject | Body`")
+    recipients, rest = split_addresses(text)
+    if not recipients or not rest:
+        say("Please provide email address(es) and content: `/email user@example.com Subject | Body`")
         return
     
-    to = parts[0]
-    rest = parts[1]
-    
     if "|" in rest:
         subject, body = rest.split("|", 1)
         subject = subject.strip()
@@ -68,71 +90,87 @@ def handle_email_command(ack, say, command):
         subject = rest[:50]
         body = rest
     
-    try:
-        result = adsmedia_request("/send", "POST", {
-            "to": to,
-            "subject": subject,
-            "html": f"<p>{body}</p>",
-            "from_name": "Slack Bot",
-        })
-        
-        if result.get("success"):
-            say(f"✅ Email sent to {to}!\nMessage ID: `{result['data']['message_id']}`")
-        else:
-            say(f"❌ Failed to send: {result.get('error', 'Unknown error')}")
-    except Exception as e:
-        say(f"❌ Error: {str(e)}")
+    say(f"📤 Sending to {len(recipients)} recipient(s)...")
+    in_background(say, send_email, recipients, subject, f"<p>{body}</p>")
+
+
+def send_email(say, recipients: List[str], subject: str, html: str):
+    if len(recipients) == 1:
+        result = adsmedia().send(to=recipients[0], subject=subject, html=html, from_name="Slack Bot")
+        say(f"✅ Email sent to {recipients[0]}!\nMessage ID: `{result.get('message_id')}`")
+        return
+    
+    queued, skipped = 0, []
+    for start in range(0, len(recipients), MAX_BATCH_SIZE):
+        result = adsmedia().send_batch(
+            recipients=[{"email": r} for r in recipients[start:start + MAX_BATCH_SIZE]],
+            subject=subject,
+            html=html,
+            from_name="Slack Bot",
+            validate=True,
+        )
+        queued += result.get("recipients_count", 0)
+        skipped += [email for email, _ in result.get("invalid", [])]
+    message = f"✅ Batch queued for {queued} of {len(recipients)} recipients"
+    if skipped:
+        message += f"\n⚠️ Skipped invalid: {', '.join(skipped[:20])}"
+    say(message)
 
 
 @app.command("/check-email")
 def handle_check_command(ack, say, command):
     """
     Handle /check-email slash command
-    Usage: /check-email user@example.com
+    Usage: /check-email user@example.com [other@example.com ...]
     """
     ack()
     
-    email = command.get("text", "").strip()
+    emails, _ = split_addresses(command.get("text", "").strip())
     
-    if not email:
-        say("Usage: `/check-email user@example.com`")
+    if not emails:
+        say("Usage: `/check-email user@example.com [other@example.com ...]`")
         return
     
-    try:
-        result = adsmedia_request("/suppressions/check", "GET", {"email": email})
-        
-        if result.get("success"):
-            data = result.get("data", {})
-            if data.get("suppressed"):
-                say(f"⚠️ `{email}` is **suppressed**\nReason: {data.get('reason', 'Unknown')}")
-            else:
-                say(f"✅ `{email}` is NOT suppressed - safe to send!")
+    in_background(say, check_emails, emails)
+
+
+def check_emails(say, emails: List[str]):
+    results = adsmedia().check_suppressions(emails)
+    if len(emails) == 1:
+        data = results[emails[0]]
+        if isinstance(data, ADSMediaError):
+            raise data
+        if data.get("suppressed"):
+            say(f"⚠️ `{emails[0]}` is **suppressed**\nReason: {data.get('reason', 'Unknown')}")
         else:
-            say(f"❌ Error checking: {result.get('error', 'Unknown')}")
-    except Exception as e:
-        say(f"❌ Error: {str(e)}")
+            say(f"✅ `{emails[0]}` is NOT suppressed - safe to send!")
+        return
+    
+    lines = []
+    for email, data in results.items():
+        if isinstance(data, ADSMediaError):
+            lines.append(f"❌ `{email}` - {data.message}")
+        elif data.get("suppressed"):
+            lines.append(f"⚠️ `{email}` - {data.get('reason', 'suppressed')}")
+    clean = len(emails) - len(lines)
+    say("\n".join([f"✅ {clean} of {len(emails)} addresses are safe to send"] + lines))
 
 
 @app.command("/email-usage")
 def handle_usage_command(ack, say, command):
     """Handle /email-usage slash command"""
     ack()
-    
-    try:
-        result = adsmedia_request("/account/usage", "GET")
-        
-        if result.get("success"):
-            data = result.get("data", {})
-            say(
-                f"📊 **Email Usage**\n"
-                f"• Servers: {data.get('servers', 0)}\n"
-                f"• Lists: {data.get('lists', 0)}\n"
-                f"• Sent this month: {data.get('sent_this_month', 0)}"
-            )
-        else:
-            say(f"❌ Error: {result.get('error', 'Unknown')}")
-    except Exception as e:
-        say(f"❌ Error: {str(e)}")
+    in_background(say, show_usage)
+
+
+def show_usage(say):
+    data = adsmedia().get_usage()
+    say(
+        f"📊 **Email Usage**\n"
+        f"• Servers: {data.get('servers', 0)}\n"
+        f"• Lists: {data.get('lists', 0)}\n"
+        f"• Sent this month: {data.get('sent_this_month', 0)}"
+    )
 
 
 @app.event("message")
@@ -143,8 +181,8 @@ def handle_message(event, say):
     if "help" in text:
         say(
             "📧 **ADSMedia Bot Commands**\n\n"
-            "`/email user@example.com Subject | Body` - Send email\n"
-            "`/check-email user@example.com` - Check suppression\n"
+            "`/email user@example.com[,other@example.com] Subject | Body` - Send email\n"
+            "`/check-email user@example.com [other@example.com ...]` - Check suppression\n"
             "`/email-usage` - View usage stats"
         )
 
@@ -2,39 +2,71 @@
 ADSMedia Telegram Bot
 Send emails via Telegram commands
 
-pip install python-telegram-bot requests python-dotenv
+pip install python-telegram-bot "adsmedia[httpx]" python-dotenv
 """
 
+import asyncio
 import os
-import requests
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
 from dotenv import load_dotenv
 from telegram import Update
 from telegram.ext import Application, CommandHandler, ContextTypes, ConversationHandler, MessageHandler, filters
 
+from adsmedia import ADSMediaError, AsyncADSMedia
+
 load_dotenv()
 
 TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
 ADSMEDIA_API_KEY = os.getenv("ADSMEDIA_API_KEY")
-API_BASE_URL = "https://api.adsmedia.live/v1"
+ADSMEDIA_BASE_URL = os.getenv("ADSMEDIA_BASE_URL", "https://api.adsmedia.live/v1")
+# Seconds /usage and /ping answers are shared across chats
+CACHE_TTL = float(os.getenv("CACHE_TTL", "30"))
+# Background senders, and emails that may wait for one
+SEND_WORKERS = int(os.getenv("SEND_WORKERS", "4"))
+SEND_QUEUE_SIZE = int(os.getenv("SEND_QUEUE_SIZE", "1000"))
+# Resends of failed requests; off unless configured
+MAX_RETRIES = int(os.getenv("ADSMEDIA_MAX_RETRIES", "0"))
 
 # Conversation states
 TO, SUBJECT, MESSAGE = range(3)
 
 
-def api_request(method: str, endpoint: str, **kwargs) -> dict:
-    """Make API request to ADSMedia."""
-    url = f"{API_BASE_URL}{endpoint}"
-    headers = {
-        "Authorization": f"Bearer {ADSMEDIA_API_KEY}",
-        "Content-Type": "application/json",
-    }
-    
-    if method == "GET":
-        response = requests.get(url, headers=headers, params=kwargs.get("params"), timeout=30)
-    else:
-        response = requests.post(url, headers=headers, json=kwargs.get("json"), timeout=30)
-    
-    return response.json()
+class TTLCache:
+    """Async results kept for ttl seconds; concurrent misses share one call"""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._values: Dict[str, Tuple[float, Any]] = {}
+        self._loading: Dict[str, asyncio.Future] = {}
+
+    async def get(self, key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        cached = self._values.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        future = self._loading.get(key)
+        if future is None:
+            future = self._loading[key] = asyncio.ensure_future(load())
+            try:
+                value = await asyncio.shield(future)
+            finally:
+                del self._loading[key]
+            self._values[key] = (time.monotonic() + self.ttl, value)
+            return value
+        return await asyncio.shield(future)
+
+
+def adsmedia(context: ContextTypes.DEFAULT_TYPE) -> AsyncADSMedia:
+    return context.application.bot_data["adsmedia"]
+
+
+def cached(context: ContextTypes.DEFAULT_TYPE, key: str, load: Callable[[], Awaitable[Any]]) -> Awaitable[Any]:
+    return context.application.bot_data["cache"].get(key, load)
+
+
+def error_text(error: Exception) -> str:
+    return error.message if isinstance(error, ADSMediaError) else str(error)
 
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -53,18 +85,15 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def ping(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Test API connection."""
     try:
-        result = api_request("GET", "/ping")
-        if result.get("success"):
-            await update.message.reply_text(
-                f"✅ *Connected!*\n"
-                f"User ID: `{result['data'].get('userId')}`\n"
-                f"Version: `{result['data'].get('version')}`",
-                parse_mode="Markdown",
-            )
-        else:
-            await update.message.reply_text("❌ Connection failed")
+        data = await cached(context, "ping", adsmedia(context).ping)
+        await update.message.reply_text(
+            f"✅ *Connected!*\n"
+            f"User ID: `{data.get('userId')}`\n"
+            f"Version: `{data.get('version')}`",
+            parse_mode="Markdown",
+        )
     except Exception as e:
-        await update.message.reply_text(f"❌ Error: {str(e)}")
+        await update.message.reply_text(f"❌ Connection failed: {error_text(e)}")
 
 
 async def check(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -75,46 +104,38 @@ async def check(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     email = context.args[0]
     try:
-        result = api_request("GET", "/suppressions/check", params={"email": email})
-        if result.get("success"):
-            data = result["data"]
-            if data.get("suppressed"):
-                await update.message.reply_text(
-                    f"⚠️ *Suppressed*\n"
-                    f"Email: `{email}`\n"
-                    f"Reason: {data.get('reason', 'Unknown')}",
-                    parse_mode="Markdown",
-                )
-            else:
-                await update.message.reply_text(
-                    f"✅ *Not Suppressed*\n"
-                    f"Email `{email}` is safe to send!",
-                    parse_mode="Markdown",
-                )
+        data = await adsmedia(context).check_suppression(email)
+        if data.get("suppressed"):
+            await update.message.reply_text(
+                f"⚠️ *Suppressed*\n"
+                f"Email: `{email}`\n"
+                f"Reason: {data.get('reason', 'Unknown')}",
+                parse_mode="Markdown",
+            )
         else:
-            await update.message.reply_text(f"❌ Error: {result.get('error')}")
+            await update.message.reply_text(
+                f"✅ *Not Suppressed*\n"
+                f"Email `{email}` is safe to send!",
+                parse_mode="Markdown",
+            )
     except Exception as e:
-        await update.message.reply_text(f"❌ Error: {str(e)}")
+        await update.message.reply_text(f"❌ Error: {error_text(e)}")
 
 
 async def usage(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Get usage stats."""
     try:
-        result = api_request("GET", "/account/usage")
-        if result.get("success"):
-            data = result["data"]
-            await update.message.reply_text(
-                f"📊 *ADSMedia Usage*\n\n"
-                f"Servers: {data.get('servers', 0)}\n"
-                f"Lists: {data.get('lists', 0)}\n"
-                f"Schedules: {data.get('schedules', 0)}\n"
-                f"Sent this month: {data.get('sent_this_month', 0)}",
-                parse_mode="Markdown",
-            )
-        else:
-            await update.message.reply_text(f"❌ Error: {result.get('error')}")
+        data = await cached(context, "usage", adsmedia(context).get_usage)
+        await update.message.reply_text(
+            f"📊 *ADSMedia Usage*\n\n"
+            f"Servers: {data.get('servers', 0)}\n"
+            f"Lists: {data.get('lists', 0)}\n"
+            f"Schedules: {data.get('schedules', 0)}\n"
+            f"Sent this month: {data.get('sent_this_month', 0)}",
+            parse_mode="Markdown",
+        )
     except Exception as e:
-        await update.message.reply_text(f"❌ Error: {str(e)}")
+        await update.message.reply_text(f"❌ Error: {error_text(e)}")
 
 
 # Conversation for sending email
@@ -139,40 +160,86 @@ async def send_subject(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 async def send_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Get message and send email."""
-    html = update.message.text
-    to = context.user_data["to"]
-    subject = context.user_data["subject"]
-    
+    """Get message and queue the email."""
+    job = {
+        "chat_id": update.effective_chat.id,
+        "to": context.user_data["to"],
+        "subject": context.user_data["subject"],
+        "html": update.message.text,
+    }
     try:
-        result = api_request("POST", "/send", json={
-            "to": to,
-            "subject": subject,
-            "html": html,
-        })
-        
-        if result.get("success"):
-            await update.message.reply_text(
-                f"✅ *Email Sent!*\n\n"
-                f"To: `{to}`\n"
-                f"Subject: {subject}\n"
-                f"Message ID: `{result['data']['message_id']}`",
-                parse_mode="Markdown",
-            )
-        else:
-            await update.message.reply_text(f"❌ Failed: {result.get('error')}")
-    except Exception as e:
-        await update.message.reply_text(f"❌ Error: {str(e)}")
+        context.application.bot_data["send_queue"].put_nowait(job)
+    except asyncio.QueueFull:
+        await update.message.reply_text("❌ Too many emails waiting, please try again shortly")
+        return ConversationHandler.END
     
+    await update.message.reply_text("📤 Sending...")
     return ConversationHandler.END
 
 
+async def send_worker(app: Application):
+    """Send queued emails and report each result to its chat."""
+    queue: asyncio.Queue = app.bot_data["send_queue"]
+    client: AsyncADSMedia = app.bot_data["adsmedia"]
+    while True:
+        job = await queue.get()
+        try:
+            result = await client.send(to=job["to"], subject=job["subject"], html=job["html"])
+            text = (
+                f"✅ *Email Sent!*\n\n"
+                f"To: `{job['to']}`\n"
+                f"Subject: {job['subject']}\n"
+                f"Message ID: `{result.get('message_id')}`"
+            )
+        except Exception as e:
+            text = f"❌ Failed: {error_text(e)}"
+        try:
+            await app.bot.send_message(job["chat_id"], text, parse_mode="Markdown")
+        except Exception as e:
+            print(f"⚠️ Could not report send result: {e}")
+        finally:
+            queue.task_done()
+
+
 async def cancel(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Cancel conversation."""
     await update.message.reply_text("Cancelled.")
     return ConversationHandler.END
 
 
+async def on_startup(app: Application):
+    """Open the pooled API client and start the send workers."""
+    app.bot_data["adsmedia"] = AsyncADSMedia(
+        api_key=ADSMEDIA_API_KEY,
+        base_url=ADSMEDIA_BASE_URL,
+        transport="httpx",
+        max_concurrency=SEND_WORKERS * 4,
+        max_retries=MAX_RETRIES,
+    )
+    app.bot_data["cache"] = TTLCache(CACHE_TTL)
+    app.bot_data["send_queue"] = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+    app.bot_data["workers"] = [
+        asyncio.create_task(send_worker(app)) for _ in range(SEND_WORKERS)
+    ]
+
+
+async def on_stop(app: Application):
+    """Finish queued sends while the bot can still deliver their confirmations."""
+    try:
+        await asyncio.wait_for(app.bot_data["send_queue"].join(), timeout=30)
+    except asyncio.TimeoutError:
+        print("⚠️ Shutting down with emails still queued")
+
+
+async def on_shutdown(app: Application):
+    """Stop the send workers and close the client."""
+    workers: List[asyncio.Task] = app.bot_data["workers"]
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    await app.bot_data["adsmedia"].aclose()
+
+
 def main():
     if not TELEGRAM_TOKEN:
         print("❌ TELEGRAM_TOKEN not set")
@@ -181,7 +248,14 @@ def main():
         print("❌ ADSMEDIA_API_KEY not set")
         return
     
-    app = Application.builder().token(TELEGRAM_TOKEN).build()
+    app = (
+        Application.builder()
+        .token(TELEGRAM_TOKEN)
+        .post_init(on_startup)
+        .post_stop(on_stop)
+        .post_shutdown(on_shutdown)
+        .build()
+    )
     
     # Conversation handler for /send
     send_handler = ConversationHandler(
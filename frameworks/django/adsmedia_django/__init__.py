@@ -0,0 +1,311 @@
+"""
+ADSMedia Django Integration
+Send emails via ADSMedia API from Django applications
+
+pip install adsmedia
+"""
+
+import asyncio
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Optional, List, Dict, Any, Callable, Iterator
+
+from adsmedia import ADSMedia, shared_async_client, shared_client
+
+logger = logging.getLogger(__name__)
+
+
+class ADSMediaClient(ADSMedia):
+    """ADSMedia API Client for Django (the adsmedia SDK client, keyed from the environment)"""
+    
+    def __init__(self, api_key: str = None, **options: Any):
+        api_key = api_key or os.environ.get("ADSMEDIA_API_KEY")
+        if not api_key:
+            raise ValueError("ADSMEDIA_API_KEY not configured")
+        if os.environ.get("ADSMEDIA_BASE_URL"):
+            options.setdefault("base_url", os.environ["ADSMEDIA_BASE_URL"])
+        super().__init__(api_key=api_key, **options)
+
+
+def _setting(name: str, default: Any = None) -> Any:
+    from django.conf import settings
+    return getattr(settings, name, default)
+
+
+def _max_retries() -> int:
+    # Resends of failed requests; off unless configured
+    return int(_setting('ADSMEDIA_MAX_RETRIES', 0))
+
+
+def _settings_key() -> Optional[str]:
+    return _setting('ADSMEDIA_API_KEY') or os.environ.get('ADSMEDIA_API_KEY')
+
+
+def _payloads(message, from_name: str) -> Iterator[Dict[str, Any]]:
+    """send() arguments for each recipient of an EmailMessage"""
+    html = message.body
+    for content, mime in getattr(message, 'alternatives', None) or []:
+        if mime == 'text/html':
+            html = content
+            break
+    
+    for recipient in message.to:
+        yield {
+            'to': recipient,
+            'subject': message.subject,
+            'html': html,
+            'text': message.body if html != message.body else None,
+            'from_name': from_name,
+            'reply_to': message.reply_to[0] if message.reply_to else None,
+        }
+
+
+# Django email backend
+class ADSMediaEmailBackend:
+    """
+    Django Email Backend using ADSMedia API
+    
+    Messages go out on the process-wide pooled client. Between open() and
+    close() (e.g. "with get_connection() as connection:") the backend holds
+    a session of its own instead.
+    
+    settings.py:
+        EMAIL_BACKEND = 'adsmedia_django.ADSMediaEmailBackend'
+        ADSMEDIA_API_KEY = 'your-api-key'
+        ADSMEDIA_FROM_NAME = 'My App'
+    """
+    
+    def __init__(self, fail_silently=False, **kwargs):
+        self.fail_silently = fail_silently
+        self.api_key = _settings_key()
+        self.from_name = _setting('ADSMEDIA_FROM_NAME', 'Django')
+        self.base_url = _setting('ADSMEDIA_BASE_URL') or os.environ.get('ADSMEDIA_BASE_URL')
+        
+        if not self.api_key:
+            raise ValueError("ADSMEDIA_API_KEY not configured")
+        
+        self.connection: Optional[ADSMedia] = None
+
+    @property
+    def client(self) -> ADSMedia:
+        if self.connection is not None:
+            return self.connection
+        return shared_client(self.api_key, self.base_url, max_retries=_max_retries())
+
+    def open(self):
+        """Open a pooled session kept until close(); True if a new one was opened"""
+        if self.connection is not None:
+            return False
+        options = {'base_url': self.base_url} if self.base_url else {}
+        self.connection = ADSMedia(api_key=self.api_key, max_retries=_max_retries(), **options)
+        return True
+
+    def close(self):
+        """Release the session opened by open()"""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def send_messages(self, email_messages):
+        """Send one or more EmailMessage objects"""
+        sent = 0
+        
+        for message in email_messages:
+            try:
+                for payload in _payloads(message, self.from_name):
+                    self.client.send(**payload)
+                    sent += 1
+                    
+            except Exception as e:
+                if not self.fail_silently:
+                    raise
+        
+        return sent
+
+
+class AsyncADSMediaEmailBackend(ADSMediaEmailBackend):
+    """
+    Email backend for async views (requires "adsmedia[async]")
+    
+    asend_messages() sends every recipient concurrently on the event loop's
+    shared AsyncADSMedia client, capped at ADSMEDIA_ASYNC_CONCURRENCY
+    requests in flight. send_messages() still works for sync callers.
+    
+    settings.py:
+        EMAIL_BACKEND = 'adsmedia_django.AsyncADSMediaEmailBackend'
+    
+    Example:
+        async def notify(request):
+            await asend_mail('Subject', 'Text', None, ['to@example.com'])
+    """
+    
+    async def asend_messages(self, email_messages):
+        """Send one or more EmailMessage objects without blocking the event loop"""
+        client = shared_async_client(
+            self.api_key,
+            self.base_url,
+            max_retries=_max_retries(),
+            max_concurrency=_setting('ADSMEDIA_ASYNC_CONCURRENCY', 10),
+        )
+        payloads = [
+            payload
+            for message in email_messages
+            for payload in _payloads(message, self.from_name)
+        ]
+        results = await asyncio.gather(
+            *(client.send(**payload) for payload in payloads),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors and not self.fail_silently:
+            raise errors[0]
+        return len(results) - len(errors)
+
+
+async def asend_mail(
+    subject: str,
+    message: str,
+    from_email: Optional[str],
+    recipient_list: List[str],
+    fail_silently: bool = False,
+    html_message: Optional[str] = None,
+) -> int:
+    """
+    Awaitable counterpart of django.core.mail.send_mail
+    
+    Example:
+        await asend_mail('Welcome!', 'Hello', None, ['user@example.com'], html_message='<h1>Hello!</h1>')
+    """
+    from django.core.mail import EmailMultiAlternatives
+    
+    mail = EmailMultiAlternatives(subject, message, from_email, recipient_list)
+    if html_message:
+        mail.attach_alternative(html_message, 'text/html')
+    return await AsyncADSMediaEmailBackend(fail_silently=fail_silently).asend_messages([mail])
+
+
+# ===== Background Sending =====
+
+class BackgroundSender:
+    """
+    Worker threads delivering queued sends after the view has returned
+    
+    The queue is bounded; flush() waits for it to drain and runs at
+    interpreter exit so queued mail is not lost on shutdown.
+    """
+    
+    def __init__(self, workers: int = 2, queue_size: int = 1000, flush_timeout: float = 30.0):
+        self.queue: "queue.Queue[Callable[[], Any]]" = queue.Queue(maxsize=queue_size)
+        self.flush_timeout = flush_timeout
+        for index in range(workers):
+            threading.Thread(target=self._work, name=f'adsmedia-mail-{index}', daemon=True).start()
+        atexit.register(self.flush)
+    
+    def submit(self, send: Callable[[], Any]) -> bool:
+        """Queue a send; False when the queue is full"""
+        try:
+            self.queue.put_nowait(send)
+            return True
+        except queue.Full:
+            return False
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until queued sends are done; False if timeout (default flush_timeout) expired"""
+        deadline = time.monotonic() + (self.flush_timeout if timeout is None else timeout)
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning("ADSMedia: %d queued emails not sent before shutdown", self.queue.unfinished_tasks)
+                    return False
+                self.queue.all_tasks_done.wait(remaining)
+        return True
+    
+    def _work(self):
+        while True:
+            send = self.queue.get()
+            try:
+                send()
+            except Exception:
+                logger.exception("ADSMedia background send failed")
+            finally:
+                self.queue.task_done()
+
+
+_sender: Optional[BackgroundSender] = None
+_sender_lock = threading.Lock()
+
+
+def get_background_sender() -> BackgroundSender:
+    """The process-wide BackgroundSender, started on first use"""
+    global _sender
+    with _sender_lock:
+        if _sender is None:
+            _sender = BackgroundSender(
+                workers=_setting('ADSMEDIA_BACKGROUND_WORKERS', 2),
+                queue_size=_setting('ADSMEDIA_BACKGROUND_QUEUE_SIZE', 1000),
+                flush_timeout=_setting('ADSMEDIA_BACKGROUND_FLUSH_TIMEOUT', 30.0),
+            )
+        return _sender
+
+
+class BackgroundADSMediaEmailBackend(ADSMediaEmailBackend):
+    """
+    Email backend that returns at once and sends from worker threads
+    
+    send_messages() queues each message and reports it as sent; delivery
+    failures are logged to the "adsmedia_django" logger. When the queue is
+    full the message is sent in the calling thread, so mail is delayed
+    rather than dropped. open() and close() do nothing: workers send on the
+    shared pooled client, which outlives any one connection.
+    
+    settings.py:
+        EMAIL_BACKEND = 'adsmedia_django.BackgroundADSMediaEmailBackend'
+        ADSMEDIA_BACKGROUND_WORKERS = 2
+        ADSMEDIA_BACKGROUND_QUEUE_SIZE = 1000
+    """
+    
+    def open(self):
+        return False
+
+    def close(self):
+        pass
+
+    def send_messages(self, email_messages):
+        """Queue one or more EmailMessage objects; returns the number accepted"""
+        sender = get_background_sender()
+        sent = 0
+        
+        for message in email_messages:
+            deliver = lambda message=message: ADSMediaEmailBackend.send_messages(self, [message])
+            if sender.submit(deliver):
+                sent += 1
+            else:
+                sent += min(1, super().send_messages([message]))
+        
+        return sent
+
+
+def flush_background(timeout: Optional[float] = None) -> bool:
+    """Wait for background sends queued so far (e.g. at the end of a management command)"""
+    if _sender is None:
+        return True
+    return _sender.flush(timeout)
+
+
+def get_client() -> ADSMedia:
+    """Get the process-wide pooled ADSMedia client"""
+    from django.conf import settings
+    return shared_client(_settings_key(), getattr(settings, 'ADSMEDIA_BASE_URL', None), max_retries=_max_retries())
+
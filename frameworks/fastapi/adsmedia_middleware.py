@@ -2,16 +2,18 @@
 ADSMedia FastAPI Integration
 Send emails via ADSMedia API from FastAPI applications
 
-pip install fastapi requests
+pip install fastapi "adsmedia[async]"
 """
 
 import os
 from typing import Optional, List
-import requests
 from fastapi import FastAPI, HTTPException, Depends
 from pydantic import BaseModel, EmailStr
 
-API_BASE_URL = "https://api.adsmedia.live/v1"
+from adsmedia import ADSMedia, ADSMediaError, AsyncADSMedia, shared_async_client, shared_client
+
+# Resends of failed requests; off unless configured
+MAX_RETRIES = int(os.getenv("ADSMEDIA_MAX_RETRIES", "0"))
 
 
 class EmailRequest(BaseModel):
@@ -38,66 +40,79 @@ class BatchEmailRequest(BaseModel):
     from_name: Optional[str] = None
 
 
+def _http_error(e: ADSMediaError) -> HTTPException:
+    return HTTPException(status_code=e.status_code or 502, detail=e.message)
+
+
 class ADSMediaClient:
-    def __init__(self, api_key: str):
-        self.api_key = api_key
-        self.headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        }
-
-    def _request(self, method: str, endpoint: str, data: dict = None) -> dict:
-        url = f"{API_BASE_URL}{endpoint}"
-        
-        if method == "GET":
-            response = requests.get(url, headers=self.headers, params=data, timeout=30)
-        else:
-            response = requests.post(url, headers=self.headers, json=data, timeout=30)
-        
-        result = response.json()
-        if not result.get("success"):
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=result.get("error", {}).get("message", "ADSMedia API Error")
-            )
-        
-        return result.get("data", {})
+    """Request-model wrapper over the process-wide pooled SDK client"""
+
+    def __init__(self, api_key: str = None, client: ADSMedia = None):
+        self.client = client or shared_client(api_key, max_retries=MAX_RETRIES)
+        self.api_key = self.client.api_key
+
+    def _call(self, method, *args, **kwargs) -> dict:
+        try:
+            return method(*args, **kwargs)
+        except ADSMediaError as e:
+            raise _http_error(e) from e
 
     def send(self, email: EmailRequest) -> dict:
-        payload = email.dict(exclude_none=True)
-        # Convert to API format
-        if "to_name" in payload:
-            payload["to_name"] = payload.pop("to_name")
-        if "from_name" in payload:
-            payload["from_name"] = payload.pop("from_name")
-        if "reply_to" in payload:
-            payload["reply_to"] = payload.pop("reply_to")
-        
-        return self._request("POST", "/send", payload)
+        return self._call(self.client.send, **email.dict(exclude_none=True))
 
     def send_batch(self, batch: BatchEmailRequest) -> dict:
-        payload = batch.dict(exclude_none=True)
-        if "from_name" in payload:
-            payload["from_name"] = payload.pop("from_name")
-        
-        return self._request("POST", "/send/batch", payload)
+        return self._call(self.client.send_batch, **batch.dict(exclude_none=True))
 
     def check_suppression(self, email: str) -> dict:
-        return self._request("GET", "/suppressions/check", {"email": email})
+        return self._call(self.client.check_suppression, email)
 
     def ping(self) -> dict:
-        return self._request("GET", "/ping")
+        return self._call(self.client.ping)
 
     def get_usage(self) -> dict:
-        return self._request("GET", "/account/usage")
+        return self._call(self.client.get_usage)
+
+
+class AsyncADSMediaClient:
+    """ADSMediaClient for async routes; never blocks the event loop"""
+
+    def __init__(self, api_key: str = None, client: AsyncADSMedia = None):
+        self.client = client or shared_async_client(api_key, max_retries=MAX_RETRIES)
+        self.api_key = self.client.api_key
+
+    async def _call(self, method, *args, **kwargs) -> dict:
+        try:
+            return await method(*args, **kwargs)
+        except ADSMediaError as e:
+            raise _http_error(e) from e
 
+    async def send(self, email: EmailRequest) -> dict:
+        return await self._call(self.client.send, **email.dict(exclude_none=True))
 
-# Dependency
+    async def send_batch(self, batch: BatchEmailRequest) -> dict:
+        return await self._call(self.client.send_batch, **batch.dict(exclude_none=True))
+
+    async def check_suppression(self, email: str) -> dict:
+        return await self._call(self.client.check_suppression, email)
+
+    async def ping(self) -> dict:
+        return await self._call(self.client.ping)
+
+    async def get_usage(self) -> dict:
+        return await self._call(self.client.get_usage)
+
+
+# Dependencies
 def get_adsmedia_client() -> ADSMediaClient:
-    api_key = os.getenv("ADSMEDIA_API_KEY")
-    if not api_key:
+    if not os.getenv("ADSMEDIA_API_KEY"):
+        raise HTTPException(status_code=500, detail="ADSMEDIA_API_KEY not configured")
+    return ADSMediaClient()
+
+
+async def get_async_adsmedia_client() -> AsyncADSMediaClient:
+    if not os.getenv("ADSMEDIA_API_KEY"):
         raise HTTPException(status_code=500, detail="ADSMEDIA_API_KEY not configured")
-    return ADSMediaClient(api_key)
+    return AsyncADSMediaClient()
 
 
 # Example FastAPI app with ADSMedia routes
@@ -110,31 +125,31 @@ def create_email_router():
     @router.post("/send")
     async def send_email(
         email: EmailRequest,
-        client: ADSMediaClient = Depends(get_adsmedia_client)
+        client: AsyncADSMediaClient = Depends(get_async_adsmedia_client)
     ):
-        return client.send(email)
+        return await client.send(email)
 
     @router.post("/send/batch")
     async def send_batch(
         batch: BatchEmailRequest,
-        client: ADSMediaClient = Depends(get_adsmedia_client)
+        client: AsyncADSMediaClient = Depends(get_async_adsmedia_client)
     ):
-        return client.send_batch(batch)
+        return await client.send_batch(batch)
 
     @router.get("/check")
     async def check_suppression(
         email: EmailStr,
-        client: ADSMediaClient = Depends(get_adsmedia_client)
+        client: AsyncADSMediaClient = Depends(get_async_adsmedia_client)
     ):
-        return client.check_suppression(email)
+        return await client.check_suppression(email)
 
     @router.get("/ping")
-    async def ping(client: ADSMediaClient = Depends(get_adsmedia_client)):
-        return client.ping()
+    async def ping(client: AsyncADSMediaClient = Depends(get_async_adsmedia_client)):
+        return await client.ping()
 
     @router.get("/usage")
-    async def get_usage(client: ADSMediaClient = Depends(get_adsmedia_client)):
-        return client.get_usage()
+    async def get_usage(client: AsyncADSMediaClient = Depends(get_async_adsmedia_client)):
+        return await client.get_usage()
 
     return router
 
@@ -2,57 +2,14 @@
 ADSMedia Flask Integration
 Send emails via ADSMedia API from Flask applications
 
-pip install flask requests
+pip install flask adsmedia
 """
 
 import os
-import requests
-from typing import Optional, List, Dict, Any
 from functools import wraps
 from flask import Flask, request, jsonify, g, current_app
 
-API_BASE_URL = "https://api.adsmedia.live/v1"
-
-
-class ADSMediaClient:
-    """ADSMedia API Client"""
-    
-    def __init__(self, api_key: str):
-        self.api_key = api_key
-        self.headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        }
-
-    def _request(self, method: str, endpoint: str, data: Dict = None) -> Dict[str, Any]:
-        url = f"{API_BASE_URL}{endpoint}"
-        
-        if method == "GET":
-            response = requests.get(url, headers=self.headers, params=data, timeout=30)
-        else:
-            response = requests.post(url, headers=self.headers, json=data, timeout=30)
-        
-        result = response.json()
-        if not result.get("success"):
-            raise Exception(result.get("error", {}).get("message", "ADSMedia API Error"))
-        
-        return result.get("data", {})
-
-    def send(self, to: str, subject: str, html: str, **kwargs) -> Dict[str, Any]:
-        payload = {"to": to, "subject": subject, "html": html}
-        payload.update(kwargs)
-        return self._request("POST", "/send", payload)
-
-    def send_batch(self, recipients: List[Dict], subject: str, html: str, **kwargs) -> Dict[str, Any]:
-        payload = {"recipients": recipients, "subject": subject, "html": html}
-        payload.update(kwargs)
-        return self._request("POST", "/send/batch", payload)
-
-    def check_suppression(self, email: str) -> Dict[str, Any]:
-        return self._request("GET", "/suppressions/check", {"email": email})
-
-    def ping(self) -> Dict[str, Any]:
-        return self._request("GET", "/ping")
+from adsmedia import ADSMedia as ADSMediaClient, ADSMediaError, shared_client
 
 
 class ADSMedia:
@@ -65,6 +22,8 @@ class ADSMedia:
 
     def init_app(self, app: Flask):
         app.config.setdefault('ADSMEDIA_API_KEY', os.environ.get('ADSMEDIA_API_KEY'))
+        app.config.setdefault('ADSMEDIA_BASE_URL', os.environ.get('ADSMEDIA_BASE_URL'))
+        app.config.setdefault('ADSMEDIA_MAX_RETRIES', 0)
         app.extensions['adsmedia'] = self
         
         @app.before_request
@@ -72,10 +31,21 @@ class ADSMedia:
             g.adsmedia = self.get_client()
 
     def get_client(self) -> ADSMediaClient:
+        """The pooled SDK client shared by every request of the process"""
         api_key = current_app.config['ADSMEDIA_API_KEY']
         if not api_key:
             raise ValueError("ADSMEDIA_API_KEY not configured")
-        return ADSMediaClient(api_key)
+        return shared_client(
+            api_key,
+            current_app.config['ADSMEDIA_BASE_URL'],
+            max_retries=current_app.config['ADSMEDIA_MAX_RETRIES'],
+        )
+
+
+def _error_response(e: Exception):
+    if isinstance(e, ADSMediaError):
+        return jsonify({'error': e.message}), e.status_code or 502
+    return jsonify({'error': str(e)}), 500
 
 
 # Blueprint with email routes
@@ -95,7 +65,7 @@ def create_email_blueprint():
             )
             return jsonify({'success': True, 'data': result})
         except Exception as e:
-            return jsonify({'error': str(e)}), 500
+            return _error_response(e)
 
     @bp.route('/check')
     def check_suppression():
@@ -104,7 +74,7 @@ def create_email_blueprint():
             result = g.adsmedia.check_suppression(email)
             return jsonify({'success': True, 'data': result})
         except Exception as e:
-            return jsonify({'error': str(e)}), 500
+            return _error_response(e)
 
     @bp.route('/ping')
     def ping():
@@ -112,7 +82,7 @@ def create_email_blueprint():
             result = g.adsmedia.ping()
             return jsonify({'success': True, 'data': result})
         except Exception as e:
-            return jsonify({'error': str(e)}), 500
+            return _error_response(e)
 
     return bp
 